@@ -52,11 +52,17 @@ from darwinism.sim.brain import (
     CompositeBrain,
     RuleBrain,
     best_in_channel,
+    decode_best,
+    decode_nearest,
     nearest_in_channel,
+    nearest_in_points,
 )
+from darwinism.sim.lockstep import LockstepSimulation
 from darwinism.sim.perception import SCALAR_DIM, Observation
+from darwinism.sim.profiling import SystemProfiler
 from darwinism.sim.simulation import Simulation
 from darwinism.sim.systems import StepContext, System, default_pipeline
+from darwinism.sim.trace import StateTracer, TraceDivergence
 
 __version__ = "1.0.0"
 
@@ -67,11 +73,12 @@ __all__ = [
     "prey_of", "predators_of",
     "PLANT", "SHEEP", "FOX", "SPECIES_NAMES",
     # simulation
-    "Simulation",
+    "Simulation", "LockstepSimulation", "SystemProfiler", "StateTracer", "TraceDivergence",
     # brain contract
     "Brain", "RuleBrain", "CompositeBrain", "PolicyBrain",
     "ACT_DIM", "A_DX", "A_DY", "A_EAT", "A_DRINK", "A_REPRO", "A_SPEED",
-    "nearest_in_channel", "best_in_channel",
+    "nearest_in_channel", "best_in_channel", "nearest_in_points", "decode_nearest",
+    "decode_best",
     # perception contract
     "Observation", "SCALAR_DIM",
     # tick-system registry (extension point)
@@ -1,7 +1,10 @@
-"""``python -m darwinism [run|live] ...`` -> the headless experiment (default) or live viewer.
+"""``python -m darwinism [run|live|bench|sweep] ...`` -> the headless experiment (default), live
+viewer, benchmark suite or parameter sweep.
 
-Dispatches to ``darwinism.cli.experiment`` / ``darwinism.cli.live``. With no subcommand (or
-``run``) it runs the headless experiment; ``live`` opens the Arcade viewer.
+Dispatches to ``darwinism.cli.experiment`` / ``darwinism.cli.live`` / ``darwinism.cli.bench`` /
+``darwinism.cli.sweep``. With no subcommand (or ``run``) it runs the headless experiment;
+``live`` opens the Arcade viewer; ``bench`` runs the throughput benchmarks; ``sweep`` fans
+many runs out over a process pool.
 """
 from __future__ import annotations
 
@@ -13,6 +16,12 @@ def main() -> None:
     if argv and argv[0] == "live":
         sys.argv = [sys.argv[0], *argv[1:]]
         from darwinism.cli.live import main as _main
+    elif argv and argv[0] == "bench":
+        sys.argv = [sys.argv[0], *argv[1:]]
+        from darwinism.cli.bench import main as _main
+    elif argv and argv[0] == "sweep":
+        sys.argv = [sys.argv[0], *argv[1:]]
+        from darwinism.cli.sweep import main as _main
     else:
         if argv and argv[0] == "run":
             sys.argv = [sys.argv[0], *argv[1:]]
@@ -0,0 +1,194 @@
+"""Columnar binary logging: the CSV logger's columns, buffered in NumPy and written in chunks.
+
+``Logger`` formats one CSV row per record, which is measurable overhead at ``log_every=1`` and
+slow for pandas to read back. ``ColumnarLogger`` logs the same columns (``logger.log_fields``)
+into preallocated NumPy buffers of ``chunk_rows`` rows and flushes each full chunk as one
+block:
+
+    parquet   one row group per chunk (``pyarrow.parquet``)        -> <out>.parquet
+    arrow     one record batch per chunk (Arrow IPC file format)   -> <out>.arrow
+    npy       one ``.npy`` per column in a directory               -> <out>/<column>.npy
+
+Parquet and Arrow need ``pyarrow`` (the ``columnar`` extra); without it they fall back to
+``npy`` with a warning. Unlike the CSV, these files are complete only once the logger is
+closed, so the live monitor keeps reading CSV. ``read_columns`` loads any of the three back
+as ``{column: array}`` (``pandas.DataFrame(read_columns(path))`` for a frame). With
+``background=True`` each chunk is written by a writer thread while the run keeps logging.
+"""
+from __future__ import annotations
+
+import json
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+from darwinism.analysis.logger import log_fields
+from darwinism.analysis.writer import BackgroundWriter
+from darwinism.sim import genome as gn
+
+FORMATS = ("parquet", "arrow", "npy")
+_SUFFIX = {"parquet": ".parquet", "arrow": ".arrow", "npy": ""}
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401  (registers pyarrow.parquet)
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def resolve_format(fmt: str) -> str:
+    """``fmt``, or ``"npy"`` when it needs pyarrow and pyarrow is not installed."""
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown log format {fmt!r} (choose from {', '.join(FORMATS)})")
+    if fmt != "npy" and _pyarrow() is None:
+        warnings.warn(f"pyarrow is not installed; logging {fmt!r} as per-column .npy instead",
+                      stacklevel=2)
+        return "npy"
+    return fmt
+
+
+def log_path(out, fmt: str) -> Path:
+    """Where a run logged as ``fmt`` is written (``out``'s suffix replaced to match)."""
+    return Path(out).with_suffix(_SUFFIX[fmt])
+
+
+class ColumnarLogger:
+    def __init__(self, path, sim, log_every: int | None = None, fmt: str = "parquet",
+                 chunk_rows: int = 4096, background: bool = False, queue_size: int = 4,
+                 running_traits: bool = False):
+        self.fmt = resolve_format(fmt)
+        self.path = log_path(path, self.fmt)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.sim = sim
+        self.log_every = log_every if log_every is not None else sim.cfg.sim.log_every
+        self.chunk_rows = max(1, int(chunk_rows))
+        self.running_traits = running_traits        # as for Logger
+        self._fields = log_fields(sim)
+        species = sim.cfg.species
+        self._traits = {sid: [f"{species[sid].name}_{g}" for g in gn.GENE_NAMES]
+                        for sid in sorted(species)}
+        trait_cols = {c for cols in self._traits.values() for c in cols}
+        self._stat_fields = [f for f in self._fields if f not in trait_cols]
+        self._dtypes = {f: np.float64 if f in trait_cols or f == "veg_biomass" else np.int64
+                        for f in self._fields}
+        self._buf = None
+        self._n = 0
+        self._writer = None
+        # background: full chunks are handed to a writer thread (at most ``queue_size`` chunks
+        # behind) and the sim keeps filling a fresh buffer
+        self.background = background
+        self.queue_size = queue_size
+        self._bg = None
+        self.rows = 0
+
+    # ------------------------------------------------------------------ lifecycle
+    def _new_buffer(self) -> dict:
+        return {f: np.empty(self.chunk_rows, dtype=self._dtypes[f]) for f in self._fields}
+
+    def open(self):
+        self._buf = self._new_buffer()
+        self._n = 0
+        self.rows = 0
+        if self.fmt == "npy":
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._writer = {f: open(self.path / f"{f}.bin", "wb") for f in self._fields}
+        else:
+            pa = _pyarrow()
+            schema = pa.schema([(f, pa.from_numpy_dtype(self._dtypes[f])) for f in self._fields])
+            if self.fmt == "parquet":
+                self._writer = pa.parquet.ParquetWriter(str(self.path), schema)
+            else:
+                self._writer = pa.ipc.new_file(str(self.path), schema)
+        if self.background:
+            self._bg = BackgroundWriter(self._write_chunk, maxsize=self.queue_size)
+
+    def record(self):
+        if self._buf is None:
+            self.open()
+        sim = self.sim
+        if sim.tick % self.log_every != 0:
+            return
+        i = self._n
+        buf, stats = self._buf, sim.stats
+        for f in self._stat_fields:
+            buf[f][i] = stats.get(f, 0)
+        for sid, cols in self._traits.items():
+            means = sim.trait_means(sid, running=self.running_traits)
+            for col, g in zip(cols, gn.GENE_NAMES):
+                buf[col][i] = means[g]
+        self._n += 1
+        self.rows += 1
+        if self._n == self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows out as one chunk."""
+        n = self._n
+        if self._writer is None or n == 0:
+            return
+        chunk = {f: b[:n] for f, b in self._buf.items()}
+        if self._bg is not None:
+            self._bg.submit(chunk)
+            self._buf = self._new_buffer()   # the queued chunk keeps its own arrays
+        else:
+            self._write_chunk(chunk)
+        self._n = 0
+
+    def _write_chunk(self, chunk: dict):
+        if self.fmt == "npy":
+            for f, fh in self._writer.items():
+                chunk[f].tofile(fh)
+        else:
+            pa = _pyarrow()
+            batch = pa.record_batch([pa.array(chunk[f]) for f in self._fields],
+                                    names=self._fields)
+            if self.fmt == "parquet":
+                self._writer.write_table(pa.Table.from_batches([batch]))
+            else:
+                self._writer.write_batch(batch)
+
+    def close(self):
+        if self._writer is None:
+            return
+        self.flush()
+        if self._bg is not None:
+            bg, self._bg = self._bg, None
+            bg.close()                       # every queued chunk is written before finalizing
+        if self.fmt == "npy":
+            for f, fh in self._writer.items():
+                fh.close()
+                raw = self.path / f"{f}.bin"
+                np.save(self.path / f"{f}.npy", np.fromfile(raw, dtype=self._dtypes[f]))
+                raw.unlink()
+            (self.path / "columns.json").write_text(json.dumps(self._fields) + "\n")
+        else:
+            self._writer.close()
+        self._writer = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_columns(path) -> dict:
+    """Load a columnar log (any of ``FORMATS``) as ``{column: ndarray}`` in logged order."""
+    path = Path(path)
+    if path.is_dir():
+        fields = json.loads((path / "columns.json").read_text())
+        return {f: np.load(path / f"{f}.npy") for f in fields}
+    pa = _pyarrow()
+    if pa is None:
+        raise ImportError(f"reading {path.name} needs pyarrow (pip install pyarrow)")
+    if path.suffix == ".parquet":
+        table = pa.parquet.read_table(str(path))
+    else:
+        with pa.memory_map(str(path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+    return {name: table.column(name).to_numpy() for name in table.column_names}
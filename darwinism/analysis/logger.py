@@ -2,41 +2,62 @@
 
 Appends one row every ``log_every`` ticks. Columns include population counts, vegetation
 biomass, births, deaths-by-cause, and mean heritable traits per species (the evolution
-signal). Headless runs are the primary producer.
+signal). Headless runs are the primary producer. With ``background=True`` the CSV is written
+by a writer thread, so file I/O does not stall the tick loop.
 """
 from __future__ import annotations
 
 import csv
 from pathlib import Path
 
+from darwinism.analysis.writer import BackgroundWriter
 from darwinism.sim import genome as gn
 
 
+def log_fields(sim) -> list[str]:
+    """The logged columns, in order: tick, per-species counts, vegetation, births / deaths by
+    cause, then every gene's per-species mean (the evolution signal)."""
+    species = sim.cfg.species
+    names = [species[sid].name for sid in sorted(species)]     # ascending id (n_sheep, n_fox, ..)
+    base = ["tick"] + [f"n_{name}" for name in names]
+    base += ["veg_biomass", "births", "deaths", "death_starve", "death_thirst",
+             "death_age", "death_health", "death_predation"]
+    for name in names:
+        for g in gn.GENE_NAMES:
+            base.append(f"{name}_{g}")
+    return base
+
+
 class Logger:
-    def __init__(self, path: str, sim, log_every: int | None = None):
+    def __init__(self, path: str, sim, log_every: int | None = None, running_traits: bool = False,
+                 background: bool = False, queue_size: int = 1024):
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.sim = sim
         self.log_every = log_every if log_every is not None else sim.cfg.sim.log_every
+        # trait means are recomputed from the live genomes every row; running_traits reads
+        # them from the O(1) float64 running sums instead (see Simulation.trait_means)
+        self.running_traits = running_traits
+        # background: record() only snapshots the row; a writer thread formats and writes it,
+        # at most ``queue_size`` rows behind (see analysis.writer)
+        self.background = background
+        self.queue_size = queue_size
         self._fh = None
         self._writer = None
+        self._bg = None
         self._fields = self._build_fields()
 
     def _build_fields(self):
-        species = self.sim.cfg.species
-        names = [species[sid].name for sid in sorted(species)]     # ascending id (n_sheep, n_fox, ..)
-        base = ["tick"] + [f"n_{name}" for name in names]
-        base += ["veg_biomass", "births", "deaths", "death_starve", "death_thirst",
-                 "death_age", "death_health", "death_predation"]
-        for name in names:
-            for g in gn.GENE_NAMES:
-                base.append(f"{name}_{g}")
-        return base
+        return log_fields(self.sim)
 
     def open(self):
         self._fh = open(self.path, "w", newline="")
         self._writer = csv.DictWriter(self._fh, fieldnames=self._fields)
         self._writer.writeheader()
+        if self.background:
+            self._fh.flush()                 # the header is on disk before the first tick
+            self._bg = BackgroundWriter(self._writer.writerow, flush=self._fh.flush,
+                                        maxsize=self.queue_size)
 
     def record(self):
         if self._writer is None:
@@ -48,15 +69,25 @@ class Logger:
         species = sim.cfg.species
         for sid in sorted(species):
             name = species[sid].name
-            traits = sim.trait_means(sid)
+            traits = sim.trait_means(sid, running=self.running_traits)
             for g in gn.GENE_NAMES:
                 row[f"{name}_{g}"] = traits[g]
         # ensure all fields present
         for k in self._fields:
             row.setdefault(k, sim.stats.get(k, 0))
-        self._writer.writerow(row)
+        if self._bg is not None:
+            self._bg.submit(row)
+        else:
+            self._writer.writerow(row)
 
     def close(self):
+        if self._bg is not None:
+            bg, self._bg = self._bg, None
+            try:
+                bg.close()                   # drain every queued row before closing the file
+            finally:
+                self._fh.close()
+                self._fh = None
         if self._fh is not None:
             self._fh.flush()
             self._fh.close()
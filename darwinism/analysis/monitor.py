@@ -3,7 +3,13 @@
 This is completely independent of the simulation -- it just tails the CSV file that
 ``analysis.logger.Logger`` writes (the logger flushes every row) and redraws the same
 4-panel report as ``analysis.plots`` on a fixed interval. Run it in its own process so it
-never blocks or couples to the sim loop:
+never blocks or couples to the sim loop.
+
+The file is tailed incrementally (``CsvTail``): each refresh parses only the complete rows
+appended since the last one and appends them to in-memory column arrays, and the panels are
+drawn from a min/max-decimated view (``plots.minmax_rows``, one bucket per pixel of panel
+width). Memory grows by one float per column per row, and redraw cost stays flat however
+long the run gets.
 
     python -m darwinism.analysis.monitor runs/run.csv [--interval 1.0]
 
@@ -12,14 +18,23 @@ never blocks or couples to the sim loop:
 from __future__ import annotations
 
 import argparse
+import io
 import subprocess
 import sys
 from pathlib import Path
 
 import matplotlib
+import numpy as np
 import pandas as pd
 
-from darwinism.analysis.plots import biomass_plot, phase_plot, population_plot, trait_plot
+from darwinism.analysis.plots import (
+    PLOTTED_COLUMNS,
+    biomass_plot,
+    minmax_rows,
+    phase_plot,
+    population_plot,
+    trait_plot,
+)
 
 
 def launch(csv_path, interval=1.0):
@@ -34,16 +49,77 @@ def launch(csv_path, interval=1.0):
         return None
 
 
-def _read(csv_path):
-    """Read the CSV, tolerating an empty/header-only/mid-write file. Returns None if
-    there is nothing plottable yet."""
-    try:
-        df = pd.read_csv(csv_path)
-    except (FileNotFoundError, pd.errors.EmptyDataError):
-        return None
-    if df.empty or "tick" not in df.columns:
-        return None
-    return df
+class CsvTail:
+    """Incremental reader of a CSV that another process is appending to.
+
+    ``poll()`` reads from the byte offset it stopped at, parses only the complete lines
+    (a row still being written is left for the next poll) and appends them to per-column
+    float64 arrays with amortised doubling. A file that shrinks (a new run reusing the path)
+    is re-read from the start.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.columns: list[str] = []
+        self.n = 0
+        self._offset = 0
+        self._data = {}
+
+    def _reset(self):
+        self.columns, self.n, self._offset, self._data = [], 0, 0, {}
+
+    def poll(self) -> int:
+        """Read what has been appended since the last poll. Returns the number of new rows."""
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+        if size < self._offset:
+            self._reset()
+        if size == self._offset:
+            return 0
+        with open(self.path, "rb") as fh:
+            fh.seek(self._offset)
+            chunk = fh.read(size - self._offset)
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            return 0                               # not even one complete line yet
+        chunk = chunk[:end]
+        self._offset += end
+        if not self.columns:
+            header, _, chunk = chunk.partition(b"\n")
+            self.columns = header.decode().strip().split(",")
+            self._data = {c: np.empty(1024) for c in self.columns}
+            if not chunk:
+                return 0
+        rows = pd.read_csv(io.BytesIO(chunk), header=None, names=self.columns,
+                           dtype=np.float64).to_numpy()
+        k = rows.shape[0]
+        if self.n + k > next(iter(self._data.values())).shape[0]:
+            cap = max(2 * (self.n + k), 1024)
+            for c in self.columns:
+                grown = np.empty(cap)
+                grown[:self.n] = self._data[c][:self.n]
+                self._data[c] = grown
+        for i, c in enumerate(self.columns):
+            self._data[c][self.n:self.n + k] = rows[:, i]
+        self.n += k
+        return k
+
+    def column(self, name) -> np.ndarray:
+        """The rows read so far of one column (a view; valid until the next poll)."""
+        return self._data[name][:self.n]
+
+    def frame(self, buckets: int | None = None):
+        """The rows read so far as a DataFrame (min/max-decimated to ``buckets`` per plotted
+        column when given), or None when there is nothing plottable yet."""
+        if self.n == 0 or "tick" not in self.columns:
+            return None
+        rows = np.arange(self.n)
+        if buckets is not None:
+            rows = minmax_rows([self.column(c) for c in PLOTTED_COLUMNS
+                                if c in self._data], buckets)
+        return pd.DataFrame({c: self.column(c)[rows] for c in self.columns})
 
 
 def _redraw(df, axes, csv_path):
@@ -69,8 +145,9 @@ def monitor(csv_path, interval=1.0):
     fig.tight_layout(rect=(0, 0, 1, 0.96))
     plt.show(block=False)
 
+    tail = CsvTail(csv_path)
     while plt.fignum_exists(fig.number):
-        df = _read(csv_path)
+        df = tail.frame(buckets=max(1, int(axes[0].bbox.width))) if tail.poll() else None
         if df is not None:
             _redraw(df, axes, csv_path)
             fig.tight_layout(rect=(0, 0, 1, 0.96))
@@ -1,11 +1,17 @@
 """matplotlib analysis of a logged run (§17 of v1.md).
 
-Reads the CSV produced by ``analysis.logger.Logger`` with pandas and renders:
+Reads the CSV produced by ``analysis.logger.Logger`` (or a columnar log from
+``analysis.columnar``) with pandas and renders:
   - population vs time (ecosystem signal; look for predator-prey oscillations)
   - mean trait vs time (evolution signal; look for drift under selection)
   - sheep-vs-fox phase plot (Lotka-Volterra loop)
 
-Usage:  python -m analysis.plots <run.csv> [--out plots_dir] [--show]
+Long runs are min/max-decimated before plotting (``minmax_rows``): per pixel-wide bucket of
+rows only the extremes of each plotted column are drawn, so a multi-million-row report renders
+in bounded time and memory and shows the same envelope. Runs of no more than two rows per
+pixel are drawn whole; ``--no-decimate`` (``decimated=False``) always draws every row.
+
+Usage:  python -m analysis.plots <run.csv> [--out plots_dir] [--show] [--no-decimate]
 """
 from __future__ import annotations
 
@@ -13,11 +19,50 @@ import argparse
 from pathlib import Path
 
 import matplotlib
+import numpy as np
 import pandas as pd
 
 matplotlib.use("Agg")  # safe default; overridden to a GUI backend if --show
 import matplotlib.pyplot as plt
 
+# the columns the report panels draw (decimation keeps each one's envelope)
+PLOTTED_COLUMNS = ("tick", "n_sheep", "n_fox", "veg_biomass",
+                   "sheep_max_speed", "sheep_sensory_range", "sheep_size")
+
+
+def minmax_rows(columns, buckets: int) -> np.ndarray:
+    """Row indices that keep the min/max envelope of every series in ``columns``.
+
+    The rows are cut into ``buckets`` equal runs (one per horizontal pixel, say); from each
+    run the rows holding each column's minimum and maximum are kept, plus the first and last
+    row. Plotting only those rows draws the same envelope as plotting every row, at a cost
+    bounded by ``buckets`` instead of the run length. Returns every row when there are no more
+    than ``2 * buckets`` of them. NaNs (an extinct species' traits) never win a bucket unless
+    the whole bucket is NaN.
+    """
+    columns = [np.asarray(c, dtype=np.float64) for c in columns]
+    n = columns[0].shape[0] if columns else 0
+    if n <= 2 * buckets or buckets < 1:
+        return np.arange(n)
+    size = -(-n // buckets)                       # rows per bucket (ceil)
+    pad = size * buckets - n
+    starts = np.arange(buckets) * size
+    keep = [np.array([0, n - 1])]
+    for col in columns:
+        lo = np.concatenate([np.where(np.isnan(col), np.inf, col), np.full(pad, np.inf)])
+        hi = np.concatenate([np.where(np.isnan(col), -np.inf, col), np.full(pad, -np.inf)])
+        keep.append(starts + lo.reshape(buckets, size).argmin(axis=1))
+        keep.append(starts + hi.reshape(buckets, size).argmax(axis=1))
+    rows = np.unique(np.concatenate(keep))
+    return rows[rows < n]
+
+
+def decimate(df, columns, buckets: int):
+    """``df`` cut down to ``minmax_rows`` of ``columns`` (all rows if it is short already)."""
+    columns = [c for c in columns if c in df.columns]
+    rows = minmax_rows([df[c].to_numpy() for c in columns], buckets)
+    return df if rows.shape[0] == len(df) else df.iloc[rows]
+
 
 def population_plot(df, ax):
     ax.plot(df["tick"], df["n_sheep"], label="sheep", color="#3a7d2c")
@@ -56,9 +101,22 @@ def phase_plot(df, ax):
     ax.legend()
 
 
-def make_report(csv_path, out_dir=None, show=False):
-    df = pd.read_csv(csv_path)
+def load_run(path, columns=None) -> pd.DataFrame:
+    """A run log as a DataFrame: a CSV, or any columnar log (see ``analysis.columnar``).
+    ``columns`` restricts it to those columns (the ones present)."""
+    keep = None if columns is None else set(columns)
+    if Path(path).suffix == ".csv":
+        return pd.read_csv(path, usecols=None if keep is None else lambda c: c in keep)
+    from darwinism.analysis.columnar import read_columns
+    data = read_columns(path)
+    return pd.DataFrame({c: v for c, v in data.items() if keep is None or c in keep})
+
+
+def make_report(csv_path, out_dir=None, show=False, decimated=True):
+    df = load_run(csv_path, columns=PLOTTED_COLUMNS)
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    if decimated:       # one min/max bucket per pixel of panel width
+        df = decimate(df, PLOTTED_COLUMNS, buckets=max(1, int(axes[0, 0].bbox.width)))
     population_plot(df, axes[0, 0])
     biomass_plot(df, axes[0, 1])
     trait_plot(df, axes[1, 0], species="sheep")
@@ -82,10 +140,12 @@ def main():
     ap.add_argument("csv", help="path to the logged run CSV")
     ap.add_argument("--out", default="analysis/out", help="output directory for PNGs")
     ap.add_argument("--show", action="store_true", help="open an interactive window")
+    ap.add_argument("--no-decimate", action="store_true",
+                    help="plot every row instead of the per-pixel min/max envelope")
     args = ap.parse_args()
     if args.show:
         matplotlib.use("TkAgg", force=True)
-    make_report(args.csv, out_dir=args.out, show=args.show)
+    make_report(args.csv, out_dir=args.out, show=args.show, decimated=not args.no_decimate)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,79 @@
+"""Background writer thread for the run loggers.
+
+A logger in background mode snapshots its row (or chunk) on the simulation thread and hands
+it to a ``BackgroundWriter``; the writer thread does the formatting and file I/O, so a slow
+disk or network filesystem stalls the writer instead of the tick loop:
+
+    writer = BackgroundWriter(write_row, flush=fh.flush, maxsize=1024)
+    writer.submit(row)      # returns at once unless ``maxsize`` items are already waiting
+    writer.close()          # drains the queue, flushes, joins the thread
+
+The queue is bounded: when the writer falls ``maxsize`` items behind, ``submit`` blocks until
+it catches up (backpressure -- memory stays bounded and no row is ever dropped). ``flush`` is
+called whenever the queue runs empty, so a tailing reader (the live monitor) sees rows as soon
+as the writer is idle. An exception raised on the writer thread is re-raised on the caller's
+thread by the next ``submit`` or by ``close``.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+
+_STOP = object()
+
+
+class BackgroundWriter:
+    def __init__(self, write, flush=None, maxsize: int = 1024, name: str = "darwinism-log"):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1 (got {maxsize})")
+        self._write = write
+        self._flush = flush
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._error = None
+        self._failed = False                # once a write fails, later items are discarded
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        q = self._queue
+        while True:
+            item = q.get()
+            if item is _STOP:
+                break
+            if self._failed:
+                continue                    # keep draining so a blocked submit() wakes up
+            try:
+                self._write(item)
+                if self._flush is not None and q.empty():
+                    self._flush()
+            except BaseException as e:      # surfaced on the caller's thread
+                self._error, self._failed = e, True
+        if not self._failed and self._flush is not None:
+            try:
+                self._flush()
+            except BaseException as e:
+                self._error, self._failed = e, True
+
+    def _raise(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def submit(self, item) -> None:
+        """Queue ``item`` for writing (blocks while the queue is full)."""
+        self._raise()
+        if not self._thread.is_alive():
+            raise ValueError("the background writer is closed")
+        self._queue.put(item)
+
+    def close(self) -> None:
+        """Write everything still queued, flush, and stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise()
+
+    @property
+    def pending(self) -> int:
+        """Items queued but not yet written (approximate)."""
+        return self._queue.qsize()
@@ -2,8 +2,10 @@
 
 ``experiment`` -- headless, fast-forward run that writes a CSV (the reproducible path).
 ``live``       -- Arcade observer window (needs a display + the ``[render]`` extra).
+``bench``      -- throughput benchmark suite (scenarios + scaling sweeps -> a JSON file).
+``sweep``      -- seed / config-override grid over a process pool (-> one results table).
 
-Invoke via the installed console scripts ``darwinism-run`` / ``darwinism-live``, via
-``python -m darwinism [run|live] ...``, or the modules directly
+Invoke via the installed console scripts ``darwinism-run`` / ``darwinism-live`` /
+``darwinism-bench`` / ``darwinism-sweep``, via ``python -m darwinism [run|live|bench|sweep] ...``, or the modules directly
 (``python -m darwinism.cli.experiment``).
 """
@@ -0,0 +1,270 @@
+"""Entry point: throughput benchmark suite with population / world-size scaling curves.
+
+Runs a fixed set of scenarios for N ticks each, timing the tick loop (ticks/s) and every tick
+system (via ``sim.profiling.SystemProfiler``), then sweeps population size and world size on
+the default config to produce scaling curves. Everything lands in one JSON file (plus the git
+commit, numpy version and platform) so two commits can be compared run-for-run. Usage
+(installed console script; ``python -m darwinism bench`` is equivalent):
+    darwinism-bench                                   # every scenario + both sweeps
+    darwinism-bench --ticks 200 --scenarios default,many-foxes --sweep-pop "" --sweep-world ""
+    darwinism-bench --sweep-pop 0.5,1,2,4 --sweep-world 1,2 --out runs/bench.json
+    darwinism-bench --compare runs/bench_main.json    # print speedups vs an earlier result
+
+Scenarios:
+    default      the stock sheep + fox config
+    dense-herd   4x the founder sheep packed into tight herds (neighbour queries, grazing)
+    large-world  2x width and height, founders scaled with the area (per-cell systems)
+    many-foxes   10x the founder foxes (predation, threat perception)
+    policy       a ``PolicyBrain`` for both species (brain inference); uses ``--sheep-brain`` /
+                 ``--fox-brain`` checkpoints when given, else a small untrained stand-in
+                 network of the same interface. Skipped when torch is not installed.
+
+World generation is timed separately (``setup_s``) and excluded from ticks/s; ``--warmup``
+ticks run before the clock starts. Runs never stop early on extinction -- every run covers
+the same number of ticks, so the cost numbers stay comparable.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+from darwinism import __version__
+from darwinism.config import FOX, SHEEP, make_config
+from darwinism.sim.simulation import Simulation
+
+SCENARIOS = ("default", "dense-herd", "large-world", "many-foxes", "policy")
+
+
+def _scale_population(cfg, factor: float) -> None:
+    """Multiply every species' founder count and population cap by ``factor`` (entity store
+    grown to fit)."""
+    for spec in cfg.species.values():
+        spec.init_count = max(1, round(spec.init_count * factor))
+        spec.population_cap = max(1, round(spec.population_cap * factor))
+    cfg.sim.max_entities = max(cfg.sim.max_entities, round(cfg.sim.max_entities * factor))
+
+
+def _scale_world(cfg, factor: float) -> None:
+    cfg.world = replace(cfg.world, width=max(16, round(cfg.world.width * factor)),
+                        height=max(9, round(cfg.world.height * factor)))
+
+
+def scenario_config(name: str, world_seed: int = 12345, seed: int = 7,
+                    pop_scale: float = 1.0, world_scale: float = 1.0,
+                    world_cache: str | None = None):
+    """Build the ``Config`` for a named scenario, then apply the sweep scales on top."""
+    if name not in SCENARIOS:
+        raise ValueError(f"unknown scenario {name!r} (choose from {', '.join(SCENARIOS)})")
+    cfg = make_config(world_seed=world_seed, seed=seed)
+    cfg.sim.world_cache = world_cache
+    if name == "dense-herd":
+        sheep = cfg.species[SHEEP]
+        sheep.init_count *= 4
+        sheep.population_cap *= 2
+        sheep.cluster = (sheep.cluster[0], sheep.cluster[1] * 0.5)
+    elif name == "large-world":
+        _scale_world(cfg, 2.0)
+        _scale_population(cfg, 4.0)
+    elif name == "many-foxes":
+        fox = cfg.species[FOX]
+        fox.init_count *= 10
+        fox.population_cap = max(fox.population_cap, fox.init_count * 4)
+        cfg.sim.max_entities = max(cfg.sim.max_entities,
+                                   sum(s.population_cap for s in cfg.species.values()) + 500)
+    if pop_scale != 1.0:
+        _scale_population(cfg, pop_scale)
+    if world_scale != 1.0:
+        _scale_world(cfg, world_scale)
+    return cfg
+
+
+def _standin_policy(device: str):
+    """A small, untrained torch network honouring the ``PolicyBrain`` model interface
+    ``(grids, scalars) -> (head_mean, gate_logits, speed_logit)``. It stands in for a trained
+    checkpoint when none is given: the numbers are meaningless, the inference cost is not."""
+    import torch
+    from torch import nn
+
+    class _StandIn(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.conv = nn.LazyConv2d(16, 3, padding=1)
+            self.body = nn.LazyLinear(64)
+            self.head = nn.Linear(64, 2)
+            self.gates = nn.Linear(64, 3)
+            self.speed = nn.Linear(64, 1)
+
+        def forward(self, grids, scalars):
+            g = torch.relu(self.conv(grids)).mean(dim=(2, 3))
+            h = torch.relu(self.body(torch.cat([g, scalars], dim=1)))
+            return torch.tanh(self.head(h)), self.gates(h), self.speed(h)
+
+    torch.manual_seed(0)
+    return _StandIn().to(device)
+
+
+def _policy_brain(sheep_brain: str | None, fox_brain: str | None, device: str):
+    from darwinism.sim.policy_brain import PolicyBrain, policy_brain_from_path
+    brains = {}
+    for sid, path in ((SHEEP, sheep_brain), (FOX, fox_brain)):
+        brains[sid] = (policy_brain_from_path(path, sid, device=device) if path
+                       else PolicyBrain({sid: _standin_policy(device)}, device=device))
+    return brains
+
+
+def run_once(cfg, ticks: int, warmup: int = 20, brain=None, label: str = "") -> dict:
+    """Build a ``Simulation`` from ``cfg`` and time ``ticks`` steps after ``warmup`` untimed
+    ones. Returns a JSON-ready record: throughput, setup time, populations and the
+    per-system breakdown."""
+    t0 = time.perf_counter()
+    sim = Simulation(cfg, brain=brain)
+    setup_s = time.perf_counter() - t0
+    initial = sim.populations
+    for _ in range(warmup):
+        sim.step()
+    sim.enable_profiling(window=max(ticks, 1))          # timed ticks only
+    alive = 0
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        sim.step()
+        alive += sim.entities.n_alive
+    wall_s = time.perf_counter() - t0
+    return {
+        "label": label,
+        "world": [cfg.world.width, cfg.world.height],
+        "initial_populations": initial,
+        "ticks": ticks,
+        "warmup": warmup,
+        "setup_s": setup_s,
+        "wall_s": wall_s,
+        "ticks_per_s": ticks / wall_s if wall_s > 0 else 0.0,
+        "ms_per_tick": 1e3 * wall_s / ticks if ticks else 0.0,
+        "mean_alive": alive / ticks if ticks else 0.0,
+        "final_populations": sim.populations,
+        "systems": sim.profile.summary(),
+    }
+
+
+def _parse_scales(text: str) -> list[float]:
+    return [float(s) for s in text.split(",") if s.strip()]
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, timeout=10, cwd=Path(__file__).resolve().parent)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _meta(args) -> dict:
+    return {
+        "darwinism": __version__,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "args": {k: v for k, v in vars(args).items() if k != "compare"},
+    }
+
+
+def _key(run: dict) -> tuple:
+    return (run["kind"], run["name"], run.get("scale"))
+
+
+def _print_run(run: dict) -> None:
+    scale = f" x{run['scale']:g}" if run.get("scale") is not None else ""
+    pops = "  ".join(f"{k} {v}" for k, v in run["final_populations"].items())
+    slowest = max(run["systems"].items(), key=lambda kv: kv[1]["mean_ms"], default=None)
+    hot = f"  slowest {slowest[0]} {slowest[1]['share']:.0%}" if slowest else ""
+    print(f"  {run['kind']:<9}{run['name'] + scale:<18}{run['ticks_per_s']:>9.1f} ticks/s"
+          f"{run['ms_per_tick']:>9.2f} ms  setup {run['setup_s']:>5.1f}s  alive "
+          f"{run['mean_alive']:>7.0f}  [{pops}]{hot}")
+
+
+def _print_compare(runs: list[dict], path: str) -> None:
+    old = {_key(r): r for r in json.loads(Path(path).read_text())["runs"]}
+    print(f"\nvs {path}:")
+    for run in runs:
+        prev = old.get(_key(run))
+        if prev is None or not prev["ticks_per_s"]:
+            continue
+        scale = f" x{run['scale']:g}" if run.get("scale") is not None else ""
+        print(f"  {run['kind']:<9}{run['name'] + scale:<18}{prev['ticks_per_s']:>9.1f} -> "
+              f"{run['ticks_per_s']:>9.1f} ticks/s  ({run['ticks_per_s'] / prev['ticks_per_s']:.2f}x)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Ecosystem throughput benchmark suite.")
+    ap.add_argument("--ticks", type=int, default=500, help="timed ticks per run")
+    ap.add_argument("--warmup", type=int, default=20, help="untimed ticks before the clock")
+    ap.add_argument("--world-seed", type=int, default=12345)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--scenarios", type=str, default=",".join(SCENARIOS),
+                    help=f"comma-separated subset of {', '.join(SCENARIOS)} ('' for none)")
+    ap.add_argument("--sweep-pop", type=str, default="0.5,1,2,4",
+                    help="founder/cap multipliers for the population sweep ('' to skip)")
+    ap.add_argument("--sweep-world", type=str, default="0.5,1,1.5,2",
+                    help="width/height multipliers for the world-size sweep ('' to skip)")
+    ap.add_argument("--sheep-brain", type=str, default=None,
+                    help="checkpoint for the policy scenario's sheep (default: stand-in net)")
+    ap.add_argument("--fox-brain", type=str, default=None,
+                    help="checkpoint for the policy scenario's foxes (default: stand-in net)")
+    ap.add_argument("--device", type=str, default="cpu")
+    ap.add_argument("--world-cache", type=str, default=None, metavar="DIR",
+                    help="reuse generated worlds from DIR (setup_s then measures the load)")
+    ap.add_argument("--out", type=str, default="runs/bench.json")
+    ap.add_argument("--compare", type=str, default=None,
+                    help="an earlier bench JSON to print per-run speedups against")
+    args = ap.parse_args()
+
+    names = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    for name in names:
+        if name not in SCENARIOS:
+            ap.error(f"unknown scenario {name!r} (choose from {', '.join(SCENARIOS)})")
+    plan = [("scenario", name, None) for name in names]
+    plan += [("pop", "default", s) for s in _parse_scales(args.sweep_pop)]
+    plan += [("world", "default", s) for s in _parse_scales(args.sweep_world)]
+
+    print(f"darwinism {__version__}  world_seed={args.world_seed}  seed={args.seed}  "
+          f"ticks={args.ticks} (+{args.warmup} warmup)")
+    runs, skipped = [], []
+    for kind, name, scale in plan:
+        cfg = scenario_config(name, args.world_seed, args.seed,
+                              pop_scale=scale if kind == "pop" else 1.0,
+                              world_scale=scale if kind == "world" else 1.0,
+                              world_cache=args.world_cache)
+        brain = None
+        if name == "policy":
+            try:
+                brain = _policy_brain(args.sheep_brain, args.fox_brain, args.device)
+            except ImportError as e:
+                print(f"  skipping policy scenario: {e}", file=sys.stderr)
+                skipped.append({"name": name, "reason": str(e)})
+                continue
+        run = run_once(cfg, args.ticks, args.warmup, brain=brain, label=name)
+        run.update(kind=kind, name=name, scale=scale)
+        runs.append(run)
+        _print_run(run)
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps({"meta": _meta(args), "runs": runs, "skipped": skipped},
+                              indent=2) + "\n")
+    print(f"\nresults: {out.resolve()}")
+    if args.compare:
+        _print_compare(runs, args.compare)
+
+
+if __name__ == "__main__":
+    main()
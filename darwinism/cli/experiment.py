@@ -5,6 +5,10 @@ and the ``run_experiment.py`` root shim are equivalent):
     darwinism-run --ticks 20000 --world-seed 12345 --seed 7 --out runs/run.csv
     darwinism-run --ticks 20000 --world-seed 12345   # random run on a fixed world
     darwinism-run --ticks 20000 --plot               # also render a PNG report
+    darwinism-run --ticks 2000 --profile             # print a per-system timing breakdown
+    darwinism-run --world-cache cache/worlds         # generate the world once, mmap it after
+    darwinism-run --log-format parquet               # columnar log (runs/run.parquet)
+    darwinism-run --async-log                        # log from a background writer thread
 
 ``--world-seed`` fixes the terrain/rivers; ``--seed`` fixes the run dynamics (omit it for a
 random, non-reproducible run -- the resolved seed is printed so you can reproduce it later).
@@ -15,9 +19,11 @@ import argparse
 import time
 from pathlib import Path
 
+from darwinism.analysis.columnar import FORMATS as COLUMNAR_FORMATS
+from darwinism.analysis.columnar import ColumnarLogger
 from darwinism.analysis.logger import Logger
 from darwinism.analysis.monitor import launch as _launch_monitor
-from darwinism.config import FOX, SHEEP, make_config
+from darwinism.config import FOX, SHEEP, Config, make_config
 from darwinism.sim.simulation import Simulation
 
 
@@ -65,16 +71,33 @@ def run_experiment(ticks: int, out: str, world_seed: int | None = 12345,
                    seed: int | None = None, log_every: int | None = None,
                    progress_every: int = 2000, quiet: bool = False,
                    monitor: bool = False, sheep_brain: str | None = None,
-                   fox_brain: str | None = None, device: str = "cpu"):
-    cfg = make_config(world_seed=world_seed, seed=seed)
+                   fox_brain: str | None = None, device: str = "cpu",
+                   predation_mode: str | None = None, profile: bool = False,
+                   world_cache: str | None = None, cfg: Config | None = None,
+                   log_format: str = "csv", async_log: bool = False,
+                   running_traits: bool = False):
+    # a prebuilt ``cfg`` (e.g. one cell of a darwinism-sweep grid) replaces the world/run seeds
+    if cfg is None:
+        cfg = make_config(world_seed=world_seed, seed=seed)
     if log_every is not None:
         cfg.sim.log_every = log_every
+    if predation_mode is not None:
+        cfg.sim.predation_mode = predation_mode
+    if world_cache is not None:
+        cfg.sim.world_cache = world_cache
     brain_spec = build_brain(sheep_brain, fox_brain, device)
-    sim = Simulation(cfg, brain=brain_spec)   # make_rng resolves + records the run seed
+    sim = Simulation(cfg, brain=brain_spec, profile=profile)   # make_rng resolves the run seed
     if not quiet:
         print(f"world_seed={cfg.world.seed}  run_seed={sim.cfg.seed}  "
               f"sheep_brain={sheep_brain or 'rule'}  fox_brain={fox_brain or 'rule'}")
-    logger = Logger(out, sim)
+    if log_format == "csv":
+        logger = Logger(out, sim, background=async_log, running_traits=running_traits)
+    else:           # buffered columns flushed in chunks (see analysis.columnar)
+        if monitor:
+            raise ValueError("the live monitor tails a CSV; use log_format='csv' with monitor")
+        logger = ColumnarLogger(out, sim, fmt=log_format, background=async_log,
+                                running_traits=running_traits)
+        out = str(logger.path)
     logger.open()   # writes the header now, so the monitor has a file to tail
     mon_proc = _launch_monitor(out) if monitor else None
 
@@ -103,7 +126,11 @@ def run_experiment(ticks: int, out: str, world_seed: int | None = 12345,
         if extinct_at:
             gone = [s for s in ("sheep", "fox") if final[s] == 0]
             print(f"** {' & '.join(gone)} extinct at tick {extinct_at} -- stopping **")
-        print(f"CSV: {Path(out).resolve()}")
+        print(f"{'CSV' if log_format == 'csv' else 'log'}: {Path(out).resolve()}")
+    if profile and not quiet:
+        print("\nper-system timing (rolling window of the last "
+              f"{sim.profile.window} ticks):")
+        print(sim.profile.format_table())
     if mon_proc is not None and mon_proc.poll() is None and not quiet:
         print("monitor window still open (close it to exit); "
               "showing the final data")
@@ -131,12 +158,34 @@ def main():
                          "with the rule brain")
     ap.add_argument("--device", type=str, default="cpu",
                     help="torch device for any neural brain (default cpu)")
+    ap.add_argument("--predation-mode", choices=("sequential", "batched"), default=None,
+                    help="resolve hunts one predator at a time (default) or all at once; "
+                         "'batched' is faster with many foxes and feeds a prey caught by "
+                         "several hunters to the first of them only")
+    ap.add_argument("--profile", action="store_true",
+                    help="time every tick system and print a per-system breakdown at the end")
+    ap.add_argument("--world-cache", type=str, default=None, metavar="DIR",
+                    help="cache generated worlds in DIR and reuse them on later runs")
+    ap.add_argument("--log-format", choices=("csv", *COLUMNAR_FORMATS), default="csv",
+                    help="per-tick log: CSV (default) or a columnar binary file; parquet / "
+                         "arrow need pyarrow and fall back to per-column .npy without it")
+    ap.add_argument("--async-log", action="store_true",
+                    help="write the log from a background thread (bounded queue; the run "
+                         "only waits when the writer falls far behind)")
+    ap.add_argument("--running-traits", action="store_true",
+                    help="log trait means from O(1) running sums instead of recomputing them "
+                         "each row (faster; can differ from the default in the last digits)")
     args = ap.parse_args()
+    if args.monitor and args.log_format != "csv":
+        ap.error("--monitor tails a CSV log; drop --log-format or use --log-format csv")
 
     sim, out = run_experiment(args.ticks, args.out, world_seed=args.world_seed,
                               seed=args.seed, log_every=args.log_every,
                               monitor=args.monitor, sheep_brain=args.sheep_brain,
-                              fox_brain=args.fox_brain, device=args.device)
+                              fox_brain=args.fox_brain, device=args.device,
+                              predation_mode=args.predation_mode, profile=args.profile,
+                              world_cache=args.world_cache, log_format=args.log_format,
+                              async_log=args.async_log, running_traits=args.running_traits)
 
     if args.plot:
         from darwinism.analysis.plots import make_report
@@ -34,6 +34,9 @@ def main():
                          "when --monitor is set)")
     ap.add_argument("--monitor", action="store_true",
                     help="open a separate live window that plots the CSV as it is written")
+    ap.add_argument("--async-log", action="store_true",
+                    help="write the CSV from a background thread so slow disks never stall "
+                         "a frame")
     ap.add_argument("--sheep-brain", type=str, default=None,
                     help="path to a trained sheep-brain checkpoint (.pt), e.g. "
                          "notebooks/imitation_learning/sheep.pt; omit to drive sheep with the "
@@ -61,7 +64,8 @@ def main():
     # the sim package without pulling in OpenGL.
     from darwinism.render.viewer import run
     run(cfg, scale=args.scale, steps_per_frame=args.spf,
-        log_csv=args.log_csv, monitor=args.monitor, brain=brain, save_gif=args.save_gif)
+        log_csv=args.log_csv, monitor=args.monitor, brain=brain, save_gif=args.save_gif,
+        async_log=args.async_log)
 
 
 if __name__ == "__main__":
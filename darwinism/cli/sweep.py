@@ -0,0 +1,245 @@
+"""Entry point: parameter sweep -- many headless runs fanned out over a process pool.
+
+Expands a grid of world seeds x config overrides x run seeds into jobs, runs each with
+``run_experiment`` (the same loop as ``darwinism-run``, extinction early-stop included) on a
+``ProcessPoolExecutor``, and collects one summary row per run into ``<out>/results.csv``; each
+run's own CSV lands in ``<out>/runs/``. Usage (installed console script; ``python -m darwinism
+sweep`` is equivalent):
+    darwinism-sweep --seeds 1-500 --ticks 20000
+    darwinism-sweep --seeds 1-64 --world-seeds 12345,7 --set sim.predation_mode=sequential,batched
+    darwinism-sweep --seeds 1-32 --set species.fox.init_count=20,40 --workers 8
+
+``--set KEY=V1,V2,..`` sweeps one config field over the listed values (repeatable; the grid is
+the cartesian product). KEY is ``world.<field>``, ``env.<field>``, ``sim.<field>`` or
+``species.<name|id>.<field>``; values are Python literals, else strings.
+
+Every distinct world is generated once, up front, into a world cache (``--world-cache``, or a
+temporary one for the sweep) and each worker memory-maps it copy-on-write -- the map is read
+from shared pages instead of being regenerated or copied per run. A persistent ``--world-cache``
+outlives code changes: its key covers the config, the numpy/opensimplex versions and the source
+of ``sim/world.py`` / ``sim/hydrology.py``, so edits there retire old entries by themselves, but
+after any other change to what generation produces, clear the directory (or bump
+``world_cache.CACHE_VERSION``) before sweeping again.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import csv
+import itertools
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, replace
+from pathlib import Path
+
+from darwinism.cli.experiment import run_experiment
+from darwinism.config import Config, make_config
+from darwinism.sim import world_cache
+from darwinism.sim.world import World
+
+
+def parse_ints(text: str) -> list[int]:
+    """``"1-4,10,20-21"`` -> ``[1, 2, 3, 4, 10, 20, 21]`` (ranges are inclusive)."""
+    out = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        lo, sep, hi = part.partition("-")
+        if sep and lo:
+            out.extend(range(int(lo), int(hi) + 1))
+        else:
+            out.append(int(part))
+    return out
+
+
+def _literal(text: str):
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def parse_set(text: str) -> tuple[str, list]:
+    """``"species.fox.init_count=20,40"`` -> ``("species.fox.init_count", [20, 40])``."""
+    key, sep, values = text.partition("=")
+    if not sep or not key.strip():
+        raise ValueError(f"--set expects KEY=V1,V2,.. (got {text!r})")
+    return key.strip(), [_literal(v.strip()) for v in values.split(",")]
+
+
+def apply_override(cfg: Config, key: str, value) -> None:
+    """Set one dotted config field (see the module docstring for the key forms)."""
+    section, _, attr = key.partition(".")
+    if section == "species":
+        name, _, attr = attr.partition(".")
+        target = next((s for sid, s in cfg.species.items()
+                       if s.name == name or str(sid) == name), None)
+        if target is None:
+            raise ValueError(f"unknown species {name!r} in {key!r}")
+    elif section in ("world", "env", "sim"):
+        target = getattr(cfg, section)
+    else:
+        raise ValueError(f"unknown config section {section!r} in {key!r}")
+    if not attr or "." in attr or not hasattr(target, attr):
+        raise ValueError(f"unknown config field {key!r}")
+    if section == "world":
+        cfg.world = replace(cfg.world, **{attr: value})
+    else:
+        setattr(target, attr, value)
+
+
+def build_grid(seeds, world_seeds, overrides: list[tuple[str, list]]) -> list[dict]:
+    """One job per (world seed, override combination, run seed), run seed varying fastest."""
+    combos = list(itertools.product(*[[(key, v) for v in values] for key, values in overrides]))
+    jobs = []
+    for world_seed in world_seeds:
+        for combo in combos:
+            for seed in seeds:
+                jobs.append({"run": len(jobs), "world_seed": world_seed, "seed": seed,
+                             "overrides": dict(combo)})
+    return jobs
+
+
+def job_config(job: dict, cache_dir: str | None = None, log_every: int | None = None) -> Config:
+    cfg = make_config(world_seed=job["world_seed"], seed=job["seed"])
+    for key, value in job["overrides"].items():
+        apply_override(cfg, key, value)
+    cfg.sim.world_cache = cache_dir
+    if log_every is not None:
+        cfg.sim.log_every = log_every
+    return cfg
+
+
+def _prebuild_world(world_cfg, cache_dir: str) -> None:
+    # an existing entry is trusted as-is; see the module docstring for when to clear the cache
+    if world_cache.load(world_cfg, cache_dir) is None:
+        world_cache.save(World(world_cfg), cache_dir)
+
+
+def _run_job(job: dict, ticks: int, out_dir: str, cache_dir: str,
+             log_every: int | None) -> dict:
+    """Run one grid cell and return its results-table row."""
+    cfg = job_config(job, cache_dir, log_every)
+    csv_path = Path(out_dir) / "runs" / f"run-{job['run']:05d}.csv"
+    t0 = time.perf_counter()
+    sim, _ = run_experiment(ticks, str(csv_path), cfg=cfg, quiet=True)
+    wall_s = time.perf_counter() - t0
+    pops = sim.populations
+    gone = [name for name, n in pops.items() if n == 0]
+    row = {"run": job["run"], "world_seed": job["world_seed"], "seed": job["seed"],
+           **job["overrides"],
+           "ticks": sim.tick,
+           "extinct": "+".join(gone),
+           "extinct_at": sim.tick if gone else "",
+           **{f"final_{name}": n for name, n in pops.items()},
+           "veg_biomass": round(float(sim.stats.get("veg_biomass", 0.0)), 3),
+           "wall_s": round(wall_s, 3),
+           "csv": csv_path.relative_to(out_dir).as_posix()}
+    return row
+
+
+def run_sweep(jobs: list[dict], ticks: int, out_dir, cache_dir, workers: int = 1,
+              log_every: int | None = None, quiet: bool = False) -> list[dict]:
+    """Run every job (``workers`` processes; 1 runs them in this process) and write
+    ``<out_dir>/results.csv``. Returns the rows, ordered by run id."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    worlds = {}
+    for job in jobs:
+        world_cfg = job_config(job).world
+        worlds.setdefault(json.dumps(asdict(world_cfg), sort_keys=True), world_cfg)
+    t0 = time.perf_counter()
+    rows = []
+
+    def report(row):
+        rows.append(row)
+        if not quiet:
+            gone = f"  extinct {row['extinct']} @ {row['extinct_at']}" if row["extinct"] else ""
+            print(f"  [{len(rows):>{len(str(len(jobs)))}}/{len(jobs)}] run {row['run']:>5}  "
+                  f"world {row['world_seed']}  seed {row['seed']}  {row['ticks']} ticks  "
+                  f"{row['wall_s']:.1f}s{gone}")
+
+    if workers <= 1:
+        for world_cfg in worlds.values():
+            _prebuild_world(world_cfg, str(cache_dir))
+        for job in jobs:
+            report(_run_job(job, ticks, str(out_dir), str(cache_dir), log_every))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # generate each world once before any run needs it, so workers only ever mmap it
+            list(pool.map(_prebuild_world, worlds.values(),
+                          itertools.repeat(str(cache_dir))))
+            futures = [pool.submit(_run_job, job, ticks, str(out_dir), str(cache_dir), log_every)
+                       for job in jobs]
+            for fut in as_completed(futures):
+                report(fut.result())
+
+    rows.sort(key=lambda r: r["run"])
+    fields = list(dict.fromkeys(k for row in rows for k in row))
+    with open(out_dir / "results.csv", "w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    if not quiet:
+        print(f"\n{len(rows)} runs in {time.perf_counter() - t0:.1f}s "
+              f"({len(worlds)} world{'s' if len(worlds) != 1 else ''})")
+    return rows
+
+
+def _print_summary(rows: list[dict], override_keys: list[str]) -> None:
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(row.get(k) for k in override_keys), []).append(row)
+    for combo, group in groups.items():
+        label = "  ".join(f"{k}={v}" for k, v in zip(override_keys, combo)) or "all runs"
+        extinct = sum(1 for r in group if r["extinct"])
+        mean_ticks = sum(r["ticks"] for r in group) / len(group)
+        print(f"  {label}: {len(group)} runs, {extinct} extinct "
+              f"({extinct / len(group):.0%}), mean {mean_ticks:.0f} ticks")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Parallel parameter sweep of headless runs.")
+    ap.add_argument("--ticks", type=int, default=20000, help="ticks per run (early-stops on "
+                                                             "extinction)")
+    ap.add_argument("--seeds", type=str, default="1-8",
+                    help="run seeds, e.g. '1-500' or '1,2,5-9'")
+    ap.add_argument("--world-seeds", type=str, default="12345",
+                    help="world seeds, same syntax as --seeds")
+    ap.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=V1,V2",
+                    help="sweep a config field over values (repeatable), e.g. "
+                         "sim.predation_mode=sequential,batched or species.fox.init_count=20,40")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                    help="worker processes (default: all cores; 1 = run in this process)")
+    ap.add_argument("--world-cache", type=str, default=None, metavar="DIR",
+                    help="world cache shared by the workers (default: a temporary directory)")
+    ap.add_argument("--log-every", type=int, default=None)
+    ap.add_argument("--out", type=str, default="runs/sweep",
+                    help="results.csv + per-run CSVs (runs/) go here")
+    args = ap.parse_args()
+
+    try:
+        overrides = [parse_set(s) for s in args.overrides]
+        jobs = build_grid(parse_ints(args.seeds), parse_ints(args.world_seeds), overrides)
+        for job in jobs:
+            job_config(job)                            # fail on a bad --set before forking
+    except ValueError as e:
+        ap.error(str(e))
+    if not jobs:
+        ap.error("the grid is empty (no --seeds / --world-seeds)")
+
+    print(f"{len(jobs)} runs x {args.ticks} ticks on {args.workers} worker(s) -> {args.out}")
+    with tempfile.TemporaryDirectory(prefix="darwinism-worlds-") as tmp:
+        cache_dir = args.world_cache or tmp
+        rows = run_sweep(jobs, args.ticks, args.out, cache_dir, workers=args.workers,
+                         log_every=args.log_every)
+    _print_summary(rows, [key for key, values in overrides if len(values) > 1])
+    print(f"results: {(Path(args.out) / 'results.csv').resolve()}")
+
+
+if __name__ == "__main__":
+    main()
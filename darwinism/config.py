@@ -212,6 +212,29 @@ class SimConfig:
     food_eat_threshold: float = 0.15    # min vegetation in a cell to be worth eating
     mating_glow_duration: float = 12.0  # ticks a pair stays "rose"-tinted after breeding
                                         # (cosmetic only; read by the viewer, not the sim)
+    # predation resolution: "sequential" resolves one hunter at a time with its own RNG draw
+    # (the golden-master stream); "batched" resolves all hunters at once with one batched
+    # kill-roll draw -- the same draws in the same order -- and gives a prey caught by several
+    # hunters to the lowest-slot hunter only, where "sequential" lets each of them feed. With
+    # no contested prey in a tick the two are identical.
+    predation_mode: str = "sequential"
+    # directory of the on-disk world cache (see sim.world_cache): a world is generated once per
+    # WorldConfig and memory-mapped on later runs. None => always generate (nothing written).
+    world_cache: str | None = None
+    # observation encoding: "dense" builds the (N, C, K, K) grids every tick; "sparse" keeps
+    # the entity channels as (row, y, x, value) lists and computes every channel the brain
+    # did not declare (Brain.channels) only when it is read; "auto" is sparse for species
+    # whose brain declares its channels (RuleBrain) and dense for the rest (a CNN reads the
+    # whole tensor). Same actions whichever is chosen.
+    perception_format: str = "auto"
+    # how the default RuleBrain reads its targets: "direct" (neighbour lists + precomputed
+    # fields, no grid rasterization), "grid" (reduce the dense channels) or "validate" (both,
+    # raising on any mismatch -- for checking the direct path; slower than either).
+    rule_decode: str = "direct"
+    # perception grid storage: "float32", "float16" or "uint8" (1/255 steps; Observation.scale
+    # = 255). Narrower grids cut perception memory traffic 2-4x; brains read float32 values
+    # back through Observation.channel. Non-float32 quantizes the fields, so runs differ.
+    perception_dtype: str = "float32"
 
 
 @dataclass
@@ -23,6 +23,7 @@ import numpy as np
 from PIL import Image
 
 from darwinism.config import FOX, SHEEP, Config
+from darwinism.sim import genome as gn
 from darwinism.sim.entities import MALE
 from darwinism.sim.perception import (
     FX_FOOD,
@@ -34,6 +35,7 @@ from darwinism.sim.perception import (
     SH_TERRAIN,
     SH_THREAT,
     SH_WATER,
+    load_grids,
 )
 from darwinism.sim.simulation import Simulation
 from darwinism.sim.world import BIOME_COLORS
@@ -81,7 +83,7 @@ class EcosystemViewer(arcade.Window):
 
     def __init__(self, cfg: Config | None = None, scale: int = 4, steps_per_frame: float = 1.0,
                  log_csv: str | None = None, monitor: bool = False, brain=None,
-                 save_gif: str | None = None):
+                 save_gif: str | None = None, async_log: bool = False):
         cfg = cfg or Config()
         # brain is pluggable (rule brain by default, or a trained brain / per-species spec
         # passed in); the viewer stays an OBSERVER and never constructs the brain itself.
@@ -97,7 +99,8 @@ class EcosystemViewer(arcade.Window):
             log_csv = "runs/live.csv"        # the monitor needs a file to tail
         if log_csv is not None:
             from darwinism.analysis.logger import Logger
-            self._logger = Logger(log_csv, self.sim)
+            # async_log: rows are written by a background thread, off the frame loop
+            self._logger = Logger(log_csv, self.sim, background=async_log)
             self._logger.open()              # write the header now
             if monitor:
                 from darwinism.analysis.monitor import launch
@@ -339,6 +342,15 @@ class EcosystemViewer(arcade.Window):
             f"births {s.get('births', 0)}  deaths {s.get('deaths', 0)} "
             f"(pred {s.get('death_predation', 0)})   asleep {s.get('n_asleep', 0)}"
         ]
+        # mean +- sd of the headline genes, read from the running sums (no per-frame reduction)
+        traits = self.sim.entities.traits
+        for sid in sorted(self.sim.cfg.species):
+            if traits.count[sid] == 0:
+                continue
+            mean, sd = traits.mean(sid), np.sqrt(traits.var(sid))
+            parts = [f"{g.split('_')[-1]} {mean[gn.GENE_INDEX[g]]:.2f}±{sd[gn.GENE_INDEX[g]]:.2f}"
+                     for g in ("max_speed", "sensory_range", "size") if g in gn.GENE_INDEX]
+            lines.append(f"{self.sim.cfg.species[sid].name:<6}" + "  ".join(parts))
         # dark translucent backing so white text stays readable over light terrain
         # (snow / beach / grazed grass) -- without it the HUD "disappears" on bright cells.
         panel_w = min(self.width, 430)
@@ -373,9 +385,9 @@ class EcosystemViewer(arcade.Window):
         if obs is None:
             return None
         rows = np.nonzero(obs.idx == slot)[0]
-        if rows.shape[0] == 0 or int(rows[0]) >= obs.grids.shape[0]:
+        if rows.shape[0] == 0 or int(rows[0]) >= len(obs):
             return None
-        return obs.grids[int(rows[0])]
+        return load_grids(obs.grids[int(rows[0])], obs.scale)
 
     def _ensure_grid_textures(self, k: int, n_ch: int) -> None:
         """Lazily (re)build ``n_ch`` per-channel RGBA textures for a window side ``k``."""
@@ -598,7 +610,8 @@ class EcosystemViewer(arcade.Window):
 
 def run(cfg: Config | None = None, scale: int = 4, steps_per_frame: float = 1.0,
         log_csv: str | None = None, monitor: bool = False, brain=None,
-        save_gif: str | None = None):
+        save_gif: str | None = None, async_log: bool = False):
     EcosystemViewer(cfg, scale=scale, steps_per_frame=steps_per_frame,
-                    log_csv=log_csv, monitor=monitor, brain=brain, save_gif=save_gif)
+                    log_csv=log_csv, monitor=monitor, brain=brain, save_gif=save_gif,
+                    async_log=async_log)
     arcade.run()
@@ -12,6 +12,12 @@ channels back into the simple targets it reasons over -- "nearest threat", "best
 cell", "nearest mate/water/prey" (``nearest_in_channel`` / ``best_in_channel``). A neural
 brain skips the decoding and learns straight off the channels.
 
+On a lazy observation the rule brain decodes DIRECTLY instead (``decode_nearest`` /
+``decode_best``): entity targets from the neighbour cell lists, water from a static per-cell
+nearest-water field, grass from a small sub-window bounded by a per-tick local-max field --
+never rasterizing a (K,K) grid, with results identical to the grid decode (checked by
+``RuleBrain(decode="validate")``).
+
 Each species is decoded separately (its grids carry only the channels it uses), but the
 explore-heading RNG is drawn ONCE over the global ordering so the action stream is identical
 regardless of how perception is partitioned (keeps runs deterministic + comparable).
@@ -46,6 +52,10 @@ _NEED_URGENCY = 0.4
 # tolerate distant predators and keep foraging/breeding
 _FLEE_TRIGGER = 0.45
 
+# half-width of the sub-window decode_best searches before falling back to the full window
+# (most grazers' best cell is within a few cells of the local maximum)
+_BEST_RADIUS = 8
+
 # default vegetation threshold a grass cell must clear to be worth grazing (config override
 # is passed into RuleBrain; mirrors cfg.sim.food_eat_threshold)
 _DEFAULT_FOOD_THR = 0.15
@@ -91,6 +101,68 @@ def nearest_in_channel(chan: np.ndarray):
             np.where(present, dist, 0.0))
 
 
+def nearest_in_points(cells, n: int, K: int):
+    """``nearest_in_channel`` over a sparse channel given as ``(rows, y, x, value)`` cells of
+    ``n`` (K,K) windows -- the same result (ties go to the first cell in row-major order, like
+    the dense ``argmin``) without ever building the (N,K,K) array."""
+    rows, y, x, value = cells
+    ox, oy, dcell = _stencil(K)
+    keep = value > 0.0
+    rows = rows[keep]
+    flat = y[keep].astype(np.intp) * K + x[keep]
+    d = dcell[flat]
+    order = np.lexsort((flat, d, rows))               # by row, then distance, then cell
+    rows, first = np.unique(rows[order], return_index=True)
+    j = flat[order][first]
+    present = np.zeros(n, dtype=np.float32)
+    dx = np.zeros(n, dtype=np.float32)
+    dy = np.zeros(n, dtype=np.float32)
+    dist = np.zeros(n, dtype=np.float32)
+    present[rows] = 1.0
+    dx[rows] = ox[j]
+    dy[rows] = oy[j]
+    dist[rows] = dcell[j]
+    return present, dx, dy, dist
+
+
+def decode_nearest(obs, role: str):
+    """``nearest_in_channel`` of an observation's ``role`` channel, decoded DIRECTLY when the
+    observation is lazy: an entity channel off its neighbour cell list, water off the static
+    per-cell nearest-water field. Same result as the grid decode, without rasterizing."""
+    cells = obs.cells(role)
+    if cells is not None:
+        return nearest_in_points(cells, len(obs), 2 * obs.radius + 1)
+    if role == "water" and obs.lazy is not None:
+        return obs.lazy.nearest_water()
+    return nearest_in_channel(obs.channel(role))
+
+
+def decode_best(obs, role: str):
+    """``best_in_channel`` of an observation's ``role`` channel. A lazy observation is first
+    searched in the central (2*_BEST_RADIUS+1)^2 cells: any cell outside lies at least
+    ``_BEST_RADIUS + 1`` away, so it scores at most ``local_max - 0.02 * (_BEST_RADIUS + 1)``.
+    A row whose sub-window best beats that bound (or whose eye disc fits inside, or whose
+    local max is below the threshold) is final; only the other rows read the full window."""
+    lazy = obs.lazy
+    if lazy is None or role not in lazy.fields:
+        return best_in_channel(obs.channel(role))
+    rho = min(_BEST_RADIUS, obs.radius)
+    near = lazy.window(role, rho)
+    present, dx, dy, dist = best_in_channel(near)
+    ar = np.arange(len(obs))
+    value = near[ar, dy.astype(np.intp) + rho, dx.astype(np.intp) + rho]
+    score = np.where(present > 0.0, value - 0.02 * dist, -np.inf)
+    bound = lazy.local_max(role)
+    final = ((lazy.mask_radius() <= rho) | (bound <= _DEFAULT_FOOD_THR)
+             | (score > bound - 0.02 * (rho + 1) + 1e-4))
+    rest = np.flatnonzero(~final)
+    if rest.shape[0]:
+        for out, full in zip((present, dx, dy, dist),
+                             best_in_channel(lazy.window(role, rows=rest))):
+            out[rest] = full
+    return present, dx, dy, dist
+
+
 def best_in_channel(chan: np.ndarray):
     """Reduce a scalar-valued (N,K,K) channel (e.g. vegetation) to its BEST cell.
 
@@ -119,6 +191,12 @@ class Brain:
         Returns actions: (len(idx), ACT_DIM) float32 aligned to ``idx``."""
         raise NotImplementedError
 
+    def channels(self, species_id: int) -> tuple | None:
+        """The channel roles this brain reads for ``species_id``, or ``None`` for the whole
+        (N, C, K, K) tensor (the default -- e.g. a CNN). A brain that declares its roles lets
+        perception hand it a lazy observation that never builds the channels it skips."""
+        return None
+
 
 class CompositeBrain(Brain):
     """Routes each species to its own ``Brain`` -- e.g. a learned sheep policy alongside a rule
@@ -146,6 +224,10 @@ class CompositeBrain(Brain):
                 if hasattr(b, "bind"):
                     b.bind(entities)
 
+    def channels(self, species_id: int) -> tuple | None:
+        brain = self.brains.get(species_id)
+        return brain.channels(species_id) if hasattr(brain, "channels") else None
+
     def decide(self, obs_by_species, idx) -> np.ndarray:
         n_global = idx.shape[0]
         act = np.zeros((n_global, ACT_DIM), dtype=np.float32)
@@ -169,7 +251,7 @@ class CompositeBrain(Brain):
             sub_act = brain.decide(sub_obs, idx)
             for s in sids:
                 obs = obs_by_species.get(s)
-                if obs is None or obs.grids.shape[0] == 0:
+                if obs is None or len(obs) == 0:
                     continue
                 pos = np.searchsorted(idx, obs.idx)
                 act[pos] = sub_act[pos]
@@ -187,8 +269,22 @@ def _norm(dx, dy):
 class RuleBrain(Brain):
     """Vectorized priority arbitration over decoded perception grids (throwaway logic)."""
 
-    def __init__(self, rng: np.random.Generator):
+    # the roles _decide_species reads: never terrain or the positional dist channel
+    CHANNELS = ("food", "water", "mate", "threat")
+
+    def __init__(self, rng: np.random.Generator, decode: str = "direct"):
+        """``decode``: how targets are read off the observations -- "direct" (neighbour lists
+        and precomputed fields where the observation is lazy, see ``decode_nearest`` /
+        ``decode_best``), "grid" (always reduce the dense channels), or "validate" (both,
+        raising ``ValueError`` at the first target on which they disagree)."""
+        if decode not in ("direct", "grid", "validate"):
+            raise ValueError(f"unknown decode mode {decode!r} (expected 'direct', 'grid' or "
+                             f"'validate')")
         self.rng = rng
+        self.decode = decode
+
+    def channels(self, species_id: int) -> tuple:
+        return self.CHANNELS
 
     def decide(self, obs_by_species, idx) -> np.ndarray:
         n_global = idx.shape[0]
@@ -201,16 +297,31 @@ class RuleBrain(Brain):
         ang = self.rng.uniform(0.0, 2 * np.pi, size=n_global).astype(np.float32)
         for sid in sorted(obs_by_species):             # ascending species id (determinism)
             obs = obs_by_species.get(sid)
-            if obs is None or obs.grids.shape[0] == 0:
+            if obs is None or len(obs) == 0:
                 continue
             pos = np.searchsorted(idx, obs.idx)        # rows of this species in global act
             act[pos] = self._decide_species(obs, ang[pos])
         return act
 
+    def _target(self, obs, role, reduction="nearest"):
+        """(present, dx, dy, dist) of the ``role`` target, decoded per ``self.decode``."""
+        grid = best_in_channel if reduction == "best" else nearest_in_channel
+        if self.decode == "grid":
+            return grid(obs.channel(role))
+        direct = (decode_best if reduction == "best" else decode_nearest)(obs, role)
+        if self.decode == "validate":
+            for name, got, want in zip(("present", "dx", "dy", "dist"), direct,
+                                       grid(obs.channel(role))):
+                bad = np.flatnonzero(got != want)
+                if bad.shape[0]:
+                    raise ValueError(f"direct decoding of {role!r} (species {obs.species}) "
+                                     f"differs from the grid decoding in {name} at rows "
+                                     f"{bad[:5].tolist()}")
+        return direct
+
     def _decide_species(self, obs, ang) -> np.ndarray:
-        grids = obs.grids                       # (n, C, K, K) for this species' layout
         sc = obs.scalars                        # (n, SCALAR_DIM)
-        n = grids.shape[0]
+        n = len(obs)
         act = np.zeros((n, ACT_DIM), dtype=np.float32)
 
         hunger, thirst, energy = sc[:, S_HUNGER], sc[:, S_THIRST], sc[:, S_ENERGY]
@@ -220,17 +331,14 @@ class RuleBrain(Brain):
         # them by ROLE via the observation's self-describing channel map (no hardcoded per-
         # species indices). Food uses the reduction the species declared (best cell for a
         # grazer, nearest marker for a hunter); water/mate/threat are always the nearest. A
-        # species with no threat channel (no predators) never flees -- its threat reads absent. ---
+        # species with no threat channel (no predators) never flees -- its threat reads absent.
+        # A sparse observation's entity channels are decoded off their cell lists directly. ---
         ch = obs.channels
-        food_chan = grids[:, ch["food"]]
-        if obs.food_reduction == "best":
-            food_p, food_dx, food_dy, food_dc = best_in_channel(food_chan)
-        else:
-            food_p, food_dx, food_dy, food_dc = nearest_in_channel(food_chan)
-        wat_p, wat_dx, wat_dy, wat_dc = nearest_in_channel(grids[:, ch["water"]])
-        mate_p, mate_dx, mate_dy, mate_dc = nearest_in_channel(grids[:, ch["mate"]])
+        food_p, food_dx, food_dy, food_dc = self._target(obs, "food", obs.food_reduction)
+        wat_p, wat_dx, wat_dy, wat_dc = self._target(obs, "water")
+        mate_p, mate_dx, mate_dy, mate_dc = self._target(obs, "mate")
         if "threat" in ch:
-            thr_p, thr_dx, thr_dy, thr_dc = nearest_in_channel(grids[:, ch["threat"]])
+            thr_p, thr_dx, thr_dy, thr_dc = self._target(obs, "threat")
         else:
             z = np.zeros(n, dtype=np.float32)
             thr_p, thr_dx, thr_dy, thr_dc = z, z, z, z
@@ -12,6 +12,7 @@ import numpy as np
 
 from darwinism.config import Config, SpeciesConfig
 from darwinism.sim import genome as gn
+from darwinism.sim.traits import TraitStats
 
 # Sex labels for the ``sex`` array (random 50/50 at birth; non-heritable). The choice of
 # which integer is male is arbitrary -- it only drives the viewer's male marker.
@@ -65,6 +66,8 @@ class Entities:
         # next identity token to hand out (see ``birth_id`` above); starts at 1 so 0 stays
         # reserved for "never spawned".
         self._next_birth_id = 1
+        # per-species running trait sums, kept in step with spawn / kill (see sim/traits.py)
+        self.traits = TraitStats(cfg)
 
     # ------------------------------------------------------------------ helpers
     @property
@@ -125,6 +128,7 @@ class Entities:
         self.asleep[slots_k] = False       # newborns / recycled slots start awake
         self.action_overridden[slots_k] = False
         self.alive[slots_k] = True
+        self.traits.add(spec.species_id, self.genome[slots_k])
         return slots_k
 
     def kill(self, slots: np.ndarray) -> None:
@@ -132,6 +136,8 @@ class Entities:
         slots = slots[self.alive[slots]]
         if slots.shape[0] == 0:
             return
+        dead = np.unique(slots)
+        self.traits.remove(self.species[dead], self.genome[dead])
         self.alive[slots] = False
         self.species[slots] = -1
         # return slots to the free list (sorted desc so low indices are reused first,
@@ -84,3 +84,59 @@ class SpatialGrid:
         d2 = (cpx - x) ** 2 + (cpy - y) ** 2
         keep = d2 <= r * r
         return cand[keep], cpx[keep], cpy[keep]
+
+    def query_radius_batch(self, xs: np.ndarray, ys: np.ndarray, rs: np.ndarray):
+        """Answer many radius queries at once; returns CSR-style ``(offsets, slots, dx, dy)``.
+
+        The batched twin of ``query_radius``: the same cell-block scan and exact distance
+        filter, for every query point ``(xs[q], ys[q])`` with its own radius ``rs[q]``, in
+        vectorized NumPy (no per-query Python loop). Query ``q``'s neighbours are
+        ``slots[offsets[q]:offsets[q + 1]]``, in exactly the order ``query_radius`` returns
+        them, with ``dx``/``dy`` the indexed position minus the query point. The offsets are
+        float64 so they are exact (a float32 difference can round), which lets a caller rank
+        neighbours by distance exactly as a Python-float loop over ``query_radius`` would.
+        """
+        xs = np.asarray(xs, dtype=np.float32)
+        ys = np.asarray(ys, dtype=np.float32)
+        rs = np.asarray(rs, dtype=np.float64)
+        nq = xs.shape[0]
+        offsets = np.zeros(nq + 1, dtype=np.intp)
+        if self._indices is None or self._indices.shape[0] == 0 or nq == 0:
+            empty_f = np.empty(0, dtype=np.float64)
+            return offsets, np.empty(0, dtype=np.intp), empty_f, empty_f
+        # cell block per query, with the scalar path's float64 bounds + int() truncation
+        x64 = xs.astype(np.float64)
+        y64 = ys.astype(np.float64)
+        cx0 = np.maximum(0, np.trunc((x64 - rs) / self.cell).astype(np.intp))
+        cx1 = np.minimum(self.nx - 1, np.trunc((x64 + rs) / self.cell).astype(np.intp))
+        cy0 = np.maximum(0, np.trunc((y64 - rs) / self.cell).astype(np.intp))
+        cy1 = np.minimum(self.ny - 1, np.trunc((y64 + rs) / self.cell).astype(np.intp))
+
+        # one (query, cell row) span per row of each block; a row is a contiguous CSR range
+        n_rows = np.maximum(0, cy1 - cy0 + 1)
+        rq = np.repeat(np.arange(nq, dtype=np.intp), n_rows)
+        first = np.cumsum(n_rows) - n_rows
+        row = cy0[rq] + (np.arange(rq.shape[0], dtype=np.intp) - first[rq])
+        base = row * self.nx
+        s = self._cell_start[base + cx0[rq]]
+        e = self._cell_start[base + cx1[rq] + 1]
+        span = np.maximum(0, e - s)
+
+        # expand every span into its candidate positions in the sorted index arrays
+        total = int(span.sum())
+        if total == 0:
+            empty_f = np.empty(0, dtype=np.float64)
+            return offsets, np.empty(0, dtype=np.intp), empty_f, empty_f
+        span_first = np.cumsum(span) - span
+        pos = np.repeat(s - span_first, span) + np.arange(total, dtype=np.intp)
+        q = np.repeat(rq, span)
+        # exact filter in float32 against the float64 r*r, like query_radius
+        cpx = self._px[pos]
+        cpy = self._py[pos]
+        d2 = (cpx - xs[q]) ** 2 + (cpy - ys[q]) ** 2
+        keep = d2 <= (rs * rs).astype(np.float32)[q]
+        q = q[keep]
+        np.cumsum(np.bincount(q, minlength=nq), out=offsets[1:])
+        dx = cpx[keep].astype(np.float64) - x64[q]
+        dy = cpy[keep].astype(np.float64) - y64[q]
+        return offsets, self._indices[pos[keep]], dx, dy
@@ -1,48 +1,78 @@
 """Ocean / river / lake generation on the elevation field (§8.2 of v1.md).
 
-Pure NumPy + standard-library BFS (no scipy dependency). Produces boolean maps:
+Pure NumPy, vectorized (no scipy dependency, no per-cell Python loops except the river walk
+itself). Every pass reproduces the queue-based BFS it replaced exactly. Produces boolean maps:
 ``ocean``, ``river``, ``lake``, ``beach``, plus derived ``freshwater`` and ``water_any``,
-and a freshwater-distance field used to boost moisture.
+and a freshwater-distance field used to boost moisture. ``nearest_source`` is the shared
+vectorized distance transform (also used by ``World`` for its nearest-water/cover fields).
 
 Coordinate convention used throughout: arrays are indexed [y, x] (row, col).
 """
 from __future__ import annotations
 
-from collections import deque
-
 import numpy as np
 
 from darwinism.config import WorldConfig
 
 # 8-neighborhood offsets (dy, dx)
 _NB8 = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+# the same offsets, and the step lengths, as arrays in ``_NB8`` order (the BFS relaxation order)
+_DY8 = np.array([dy for dy, _ in _NB8])
+_DX8 = np.array([dx for _, dx in _NB8])
+_STEP8 = np.array([1.41421356 if (dy and dx) else 1.0 for dy, dx in _NB8], dtype=np.float32)
+
+
+def _border_components(mask: np.ndarray) -> np.ndarray:
+    """Cells of ``mask`` whose 8-connected component touches the map border.
+
+    Connected-component labelling without a per-cell loop: each row's horizontal runs of True
+    are the nodes, runs that touch across adjacent rows (incl. diagonally) are the edges, and
+    a vectorized union-find (min-label propagation + pointer jumping) merges them.
+    """
+    h, w = mask.shape
+    m = mask.ravel()
+    start = m.copy()
+    start[1:] &= ~m[:-1]
+    start[::w] = m[::w]                              # every row begins a new run
+    run = np.cumsum(start) - 1                       # run id of each True cell
+    n_runs = int(start.sum())
+    if n_runs == 0:
+        return np.zeros((h, w), dtype=bool)
+    run2 = run.reshape(h, w)
+    ra, rb = [], []
+    for dx in (-1, 0, 1):                            # row y touches row y+1 at x+dx
+        lo, hi = max(0, -dx), w - max(0, dx)
+        both = mask[:-1, lo:hi] & mask[1:, lo + dx:hi + dx]
+        ra.append(run2[:-1, lo:hi][both])
+        rb.append(run2[1:, lo + dx:hi + dx][both])
+    ra = np.concatenate(ra)
+    rb = np.concatenate(rb)
+    label = np.arange(n_runs)
+    while True:
+        new = label.copy()
+        low = np.minimum(label[ra], label[rb])
+        np.minimum.at(new, ra, low)
+        np.minimum.at(new, rb, low)
+        while True:                                  # pointer jumping to the component root
+            jumped = new[new]
+            if np.array_equal(jumped, new):
+                break
+            new = jumped
+        if np.array_equal(new, label):
+            break
+        label = new
+    edge = np.zeros((h, w), dtype=bool)
+    edge[0, :] = edge[-1, :] = edge[:, 0] = edge[:, -1] = True
+    touches = np.zeros(n_runs, dtype=bool)
+    touches[label[run[m & edge.ravel()]]] = True
+    out = np.zeros(h * w, dtype=bool)
+    out[m] = touches[label[run[m]]]
+    return out.reshape(h, w)
 
 
 def _ocean_floodfill(elevation: np.ndarray, sea_level: float) -> np.ndarray:
-    """Cells below sea level connected to the map border are ocean (BFS from edges)."""
-    h, w = elevation.shape
-    below = elevation < sea_level
-    ocean = np.zeros((h, w), dtype=bool)
-    dq = deque()
-    # seed from all border cells that are below sea level
-    for x in range(w):
-        for y in (0, h - 1):
-            if below[y, x] and not ocean[y, x]:
-                ocean[y, x] = True
-                dq.append((y, x))
-    for y in range(h):
-        for x in (0, w - 1):
-            if below[y, x] and not ocean[y, x]:
-                ocean[y, x] = True
-                dq.append((y, x))
-    while dq:
-        y, x = dq.popleft()
-        for dy, dx in _NB8:
-            ny, nx = y + dy, x + dx
-            if 0 <= ny < h and 0 <= nx < w and below[ny, nx] and not ocean[ny, nx]:
-                ocean[ny, nx] = True
-                dq.append((ny, nx))
-    return ocean
+    """Cells below sea level connected to the map border are ocean."""
+    return _border_components(elevation < sea_level)
 
 
 def _lowest_neighbor(elevation: np.ndarray, y: int, x: int):
@@ -72,11 +102,18 @@ def _carve_rivers(elevation: np.ndarray, ocean: np.ndarray, cfg: WorldConfig,
     n_sources = min(cfg.n_river_sources, land_idx.shape[0])
     chosen = rng.choice(land_idx.shape[0], size=n_sources, replace=False)
 
+    lake_flat = lake.reshape(-1)
     for ci in chosen:
         y, x = int(land_idx[ci, 0]), int(land_idx[ci, 1])
         steps = 0
         max_steps = h * w  # safety bound
+        visited = set()
         while steps < max_steps:
+            # the walk's next step depends only on (y, x): a revisit means it is cycling
+            # (typically pit -> spill -> back into the pit) and would mark nothing new
+            if (y, x) in visited:
+                break
+            visited.add((y, x))
             steps += 1
             river[y, x] = True
             if ocean[y, x]:
@@ -88,9 +125,9 @@ def _carve_rivers(elevation: np.ndarray, ocean: np.ndarray, cfg: WorldConfig,
                 # local minimum -> form a small lake by flooding up to a spill level
                 spill = elevation[y, x] + 0.015
                 basin = _floodfill_basin(elevation, y, x, spill, ocean)
-                lake |= basin
+                lake_flat[basin] = True
                 # try to find a spill cell on the basin rim lower than current
-                spill_cell = _find_spill(elevation, basin, ocean)
+                spill_cell = _find_spill(elevation, basin)
                 if spill_cell is None:
                     break
                 y, x = spill_cell
@@ -105,67 +142,208 @@ def _carve_rivers(elevation: np.ndarray, ocean: np.ndarray, cfg: WorldConfig,
     return river, lake
 
 
+def _neighbours(cells: np.ndarray, h: int, w: int):
+    """Flat indices of the in-bounds 8-neighbours of ``cells``, in (cell, ``_NB8``) order."""
+    cy, cx = np.divmod(cells, w)
+    ty = cy[:, None] + _DY8
+    tx = cx[:, None] + _DX8
+    ok = (ty >= 0) & (ty < h) & (tx >= 0) & (tx < w)
+    return (ty * w + tx)[ok]
+
+
 def _floodfill_basin(elevation: np.ndarray, sy: int, sx: int, spill: float,
                      ocean: np.ndarray) -> np.ndarray:
-    """Flood cells reachable from (sy,sx) with elevation <= spill (BFS)."""
+    """Flood cells reachable from (sy,sx) with elevation <= spill; returns their flat indices.
+
+    Replays the capped BFS level by level: the lake stops growing once 400 cells have been
+    expanded, so which cells make it in depends on queue order -- each level keeps the first
+    claim on a cell in (parent, neighbour) order, exactly as the queue did.
+    """
     h, w = elevation.shape
-    basin = np.zeros((h, w), dtype=bool)
     if ocean[sy, sx]:
-        return basin
-    dq = deque([(sy, sx)])
-    basin[sy, sx] = True
-    count = 0
-    while dq and count < 400:                # cap lake size for v1
-        y, x = dq.popleft()
-        count += 1
-        for dy, dx in _NB8:
-            ny, nx = y + dy, x + dx
-            if (0 <= ny < h and 0 <= nx < w and not basin[ny, nx]
-                    and not ocean[ny, nx] and elevation[ny, nx] <= spill):
-                basin[ny, nx] = True
-                dq.append((ny, nx))
-    return basin
-
-
-def _find_spill(elevation: np.ndarray, basin: np.ndarray, ocean: np.ndarray):
-    """Lowest cell on the rim adjacent to the basin (the overflow point)."""
+        return np.empty(0, dtype=np.intp)
+    elev = elevation.ravel()
+    sea = ocean.ravel()
+    basin = [np.array([sy * w + sx])]
+    frontier = basin[0]
+    expanded = 0
+    while frontier.shape[0] and expanded < 400:      # cap lake size for v1
+        frontier = frontier[:400 - expanded]
+        expanded += frontier.shape[0]
+        nb = _neighbours(frontier, h, w)
+        nb = nb[~sea[nb] & (elev[nb] <= spill)]
+        nb = nb[~np.isin(nb, np.concatenate(basin))]
+        _, first = np.unique(nb, return_index=True)
+        frontier = nb[np.sort(first)]
+        basin.append(frontier)
+    return np.concatenate(basin)
+
+
+def _find_spill(elevation: np.ndarray, basin: np.ndarray):
+    """Lowest cell on the rim adjacent to the basin (the overflow point); ``basin`` is flat
+    indices. Ties go to the first rim cell in raster order of the basin, then ``_NB8``."""
     h, w = elevation.shape
-    best = None
-    best_e = np.inf
-    ys, xs = np.nonzero(basin)
-    for y, x in zip(ys.tolist(), xs.tolist()):
-        for dy, dx in _NB8:
-            ny, nx = y + dy, x + dx
-            if 0 <= ny < h and 0 <= nx < w and not basin[ny, nx]:
-                if elevation[ny, nx] < best_e:
-                    best_e = elevation[ny, nx]
-                    best = (ny, nx)
-    return best
-
-
-def _distance_to(mask: np.ndarray, max_dist: float) -> np.ndarray:
-    """Approx euclidean distance to nearest True cell via multi-source BFS (capped)."""
+    cells = np.sort(basin)
+    rim = _neighbours(cells, h, w)
+    rim = rim[~np.isin(rim, cells)]
+    if rim.shape[0] == 0:
+        return None
+    best = int(rim[np.argmin(elevation.ravel()[rim])])
+    return divmod(best, w)
+
+
+_NO_VALUE = np.int64(0xFFFFFFFF)    # above every finite/inf float32 bit pattern
+
+
+def _ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenation of ``arange(s, e)`` for every ``(s, e)`` pair."""
+    lens = ends - starts
+    total = int(lens.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.arange(total, dtype=np.int64) + np.repeat(starts - (np.cumsum(lens) - lens), lens)
+
+
+def _settled_distance(mask: np.ndarray, cap: np.float32) -> np.ndarray:
+    """Final 8-neighbour path distance to the nearest True cell (float32 step sums; cells at or
+    beyond ``cap`` don't propagate) -- the distances the BFS ends with.
+
+    Relaxing ``d[v] = min(d[v], d[u] + step)`` reaches the same fixed point in any order,
+    because float32 addition of a positive step is monotone. Each round relaxes every edge
+    once (down/up row sweeps for the vertical and diagonal edges, right/left column sweeps
+    for the horizontal ones) and the loop stops at the first round that changes nothing.
+    """
     h, w = mask.shape
-    dist = np.full((h, w), np.inf, dtype=np.float32)
-    dq = deque()
-    ys, xs = np.nonzero(mask)
-    for y, x in zip(ys.tolist(), xs.tolist()):
-        dist[y, x] = 0.0
-        dq.append((y, x))
-    cap = float(max_dist)
-    while dq:
-        y, x = dq.popleft()
-        if dist[y, x] >= cap:
-            continue
-        for dy, dx in _NB8:
-            ny, nx = y + dy, x + dx
-            if 0 <= ny < h and 0 <= nx < w:
-                step = 1.41421356 if (dy and dx) else 1.0
-                nd = dist[y, x] + step
-                if nd < dist[ny, nx]:
-                    dist[ny, nx] = nd
-                    dq.append((ny, nx))
-    return dist
+    inf = np.float32(np.inf)
+    diag, one = _STEP8[0], _STEP8[1]
+    d = np.where(mask, np.float32(0.0), inf).astype(np.float32)
+    row = np.full(w + 2, inf, dtype=np.float32)
+    while True:
+        before = d.copy()
+        for ys, back in ((range(1, h), 1), (range(h - 2, -1, -1), -1)):
+            for y in ys:
+                prev = d[y - back]
+                row[1:-1] = np.where(prev < cap, prev, inf)
+                best = np.minimum(np.minimum(row[:-2] + diag, row[2:] + diag), row[1:-1] + one)
+                np.minimum(d[y], best, out=d[y])
+        dt = np.ascontiguousarray(d.T)
+        for xs, back in ((range(1, w), 1), (range(w - 2, -1, -1), -1)):
+            for x in xs:
+                prev = dt[x - back]
+                np.minimum(dt[x], np.where(prev < cap, prev, inf) + one, out=dt[x])
+        d = np.ascontiguousarray(dt.T)
+        if np.array_equal(before, d):
+            return d
+
+
+def nearest_source(mask: np.ndarray, max_dist: float = np.inf):
+    """Distance to, and coordinates of, the nearest True cell of ``mask``.
+
+    Returns ``(dist, nearest_x, nearest_y)``: float32 path distance over the 8-neighbourhood
+    (steps of 1 and 1.41421356; inf where no source is reachable) and the int32 cell indices of
+    the source it leads to (-1 where unreachable). Cells at or beyond ``max_dist`` keep their
+    distance but don't spread it further (a capped transform).
+
+    Byte-identical to the multi-source FIFO BFS this replaced, tie-breaks included: the queue
+    is replayed one generation at a time, each generation's relaxations handled as arrays in
+    queue order. An entry can never read below its settled distance (values only fall), so
+    relaxations that could not beat a cell's current value are pruned up front.
+    """
+    h, w = mask.shape
+    flat = mask.ravel()
+    cap = np.float32(max_dist)
+    dist = np.where(flat, np.float32(0.0), np.float32(np.inf)).astype(np.float32)
+    near = np.where(flat, np.arange(h * w), -1).astype(np.int64)
+    settled = _settled_distance(mask, cap).ravel()
+    entries = np.flatnonzero(flat)                   # generation 0: the sources, raster order
+    while entries.shape[0]:
+        m = entries.shape[0]
+        ey, ex = np.divmod(entries, w)
+        ty = ey[:, None] + _DY8
+        tx = ex[:, None] + _DX8
+        ok = (ty >= 0) & (ty < h) & (tx >= 0) & (tx < w)
+        tv = np.where(ok, ty * w + tx, 0)
+        lo = settled[entries]                        # an entry never reads below its final value
+        ok &= (lo < cap)[:, None] & ((lo[:, None] + _STEP8).astype(np.float32) < dist[tv])
+        t_c = np.flatnonzero(ok.ravel())             # queue time = entry * 8 + neighbour
+        if t_c.shape[0] == 0:
+            break
+        v_c = tv.ravel()[t_c]
+        order = np.argsort(v_c, kind="stable")       # group by target cell, time order within
+        t_c, v_c = t_c[order], v_c[order]
+        nc = v_c.shape[0]
+        pos_of_t = np.full(8 * m, -1, dtype=np.int64)
+        pos_of_t[t_c] = np.arange(nc)
+        p_c = t_c >> 3
+        step = _STEP8[t_c & 7]
+        first = np.ones(nc, dtype=bool)
+        first[1:] = v_c[1:] != v_c[:-1]
+        gs = np.flatnonzero(first)
+        ge = np.append(gs[1:], nc)
+        gid = np.cumsum(first) - 1
+        n_groups = gs.shape[0]
+        gv = v_c[gs]
+        base_bits = dist[gv].view(np.uint32).astype(np.int64)
+        # entry -> the candidate group on its own cell, and the last candidate before its turn
+        j_ent = np.searchsorted(v_c * (8 * m) + t_c, entries * (8 * m) + np.arange(m) * 8) - 1
+        g_ent = np.minimum(np.searchsorted(gv, entries), n_groups - 1)
+        fed = np.flatnonzero((gv[g_ent] == entries) & (j_ent >= gs[g_ent]))
+        fed_by_group = fed[np.argsort(g_ent[fed], kind="stable")]
+        fed_start = np.searchsorted(g_ent[fed_by_group], np.arange(n_groups + 1))
+
+        read_d = dist[entries]
+        read_n = near[entries]
+        nd = np.empty(nc, dtype=np.float32)
+        nn = np.empty(nc, dtype=np.int64)
+        last_hit = np.full(nc, -1, dtype=np.int64)
+        hit = np.zeros(nc, dtype=bool)
+        cs, es = np.arange(nc), fed
+        while True:
+            rd = read_d[p_c[cs]]
+            val = (rd + step[cs]).astype(np.float32)
+            nd[cs] = val
+            nn[cs] = read_n[p_c[cs]]
+            bits = np.where(rd < cap, val.view(np.uint32).astype(np.int64), _NO_VALUE)
+            g = gid[cs]
+            # running min per group in one pass: later groups get smaller high words
+            run = np.minimum.accumulate(((n_groups - 1 - g) << 32) | bits)
+            prev = np.empty_like(run)
+            prev[1:] = run[:-1] & 0xFFFFFFFF
+            prev[first[cs]] = _NO_VALUE
+            h_cs = bits < np.minimum(prev, base_bits[g])
+            hit[cs] = h_cs
+            last_hit[cs] = np.maximum.accumulate(np.where(h_cs, cs, -1))
+            if es.shape[0] == 0:
+                break
+            lh = last_hit[j_ent[es]]
+            got = lh >= gs[g_ent[es]]
+            new_d = dist[entries[es]]
+            new_n = near[entries[es]]
+            new_d[got] = nd[lh[got]]
+            new_n[got] = nn[lh[got]]
+            changed = (new_d != read_d[es]) | (new_n != read_n[es])
+            if not changed.any():
+                break
+            ch = es[changed]
+            read_d[ch] = new_d[changed]
+            read_n[ch] = new_n[changed]
+            # redo only the groups those entries feed, and the entries reading from them
+            pos = pos_of_t[(ch[:, None] * 8 + np.arange(8)).ravel()]
+            groups = np.unique(gid[pos[pos >= 0]])
+            cs = _ranges(gs[groups], ge[groups])
+            es = fed_by_group[_ranges(fed_start[groups], fed_start[groups + 1])]
+        won = np.flatnonzero(hit)
+        won_v = v_c[won]
+        final = np.ones(won.shape[0], dtype=bool)
+        final[:-1] = won_v[:-1] != won_v[1:]
+        dist[won_v[final]] = nd[won[final]]
+        near[won_v[final]] = nn[won[final]]
+        entries = won_v[np.argsort(t_c[won], kind="stable")]   # next generation, queue order
+    ny, nx = np.divmod(near, w)
+    nx[near < 0] = -1
+    ny[near < 0] = -1
+    return (dist.reshape(h, w), nx.reshape(h, w).astype(np.int32),
+            ny.reshape(h, w).astype(np.int32))
 
 
 def generate(elevation: np.ndarray, cfg: WorldConfig, rng: np.random.Generator) -> dict:
@@ -176,21 +354,19 @@ def generate(elevation: np.ndarray, cfg: WorldConfig, rng: np.random.Generator)
     river &= ~ocean
     lake &= ~ocean
 
-    # beach: land cells within 1 step of ocean
+    # beach: land cells within 1 step of ocean (the ocean mask shifted to all 8 neighbours)
     h, w = elevation.shape
     beach = np.zeros((h, w), dtype=bool)
-    oy, ox = np.nonzero(ocean)
-    for y, x in zip(oy.tolist(), ox.tolist()):
-        for dy, dx in _NB8:
-            ny, nx = y + dy, x + dx
-            if 0 <= ny < h and 0 <= nx < w and not ocean[ny, nx]:
-                beach[ny, nx] = True
+    for dy, dx in _NB8:
+        beach[max(0, dy):h + min(0, dy), max(0, dx):w + min(0, dx)] |= \
+            ocean[max(0, -dy):h + min(0, -dy), max(0, -dx):w + min(0, -dx)]
+    beach &= ~ocean
 
     freshwater = (river | lake) & ~ocean
     water_any = freshwater | ocean
 
     # moisture boost from freshwater with distance falloff
-    fw_dist = _distance_to(freshwater, cfg.moisture_boost_radius)
+    fw_dist = nearest_source(freshwater, cfg.moisture_boost_radius)[0]
     boost = np.clip(1.0 - fw_dist / cfg.moisture_boost_radius, 0.0, 1.0).astype(np.float32)
     boost[np.isinf(fw_dist)] = 0.0
 
@@ -0,0 +1,182 @@
+"""LockstepSimulation: B independent worlds stepped tick by tick, side by side.
+
+RL rollouts and parameter sweeps run dozens of small simulations. A ``LockstepSimulation``
+builds B ``Simulation``s and stacks their per-cell state along a leading batch axis:
+vegetation, nutrients and the temperature field become ``(B, H, W)``, and each member's own
+field is a row view of the stack (the systems write those fields in place). The entity
+stores stay each member's own: ``batch.entities`` gathers them into ``(B, max_entities)``
+arrays when read, so a system is free to replace an entity array. A member stays a normal
+``Simulation`` that can be inspected (or logged) alone.
+
+This is a lockstep runner, not a batched engine. A tick runs the pipeline system by system
+across the members. Only the systems marked ``batchable`` (environment, vegetation, stats)
+run once over the stacks. Perception, the brain, movement, consumption, metabolism and
+reproduction have no batched form: they run once per world, on that world's own entity
+store, so their cost grows linearly with B just as B separate runs would. Those are the
+systems that draw from the run RNG; each world keeps its own Generator, so the stream a world
+sees is exactly its standalone one. World ``b`` therefore stays byte-identical to
+``Simulation(configs[b])``:
+
+    batch = LockstepSimulation.from_seeds([1, 2, 3, 4], world_seeds=12345)
+    for _ in range(1000):
+        stats = batch.step()                  # {"n_sheep": array([...]), ...}, one per world
+    batch.populations                         # {"sheep": array([...]), "fox": array([...])}
+
+Members sharing a ``WorldConfig`` share one generated World (only the nutrient field, which
+a run mutates, is per world). All members must agree on map size, ``max_entities`` and the
+species set, since those fix the shapes of the stacks.
+"""
+from __future__ import annotations
+
+import copy
+import json
+from dataclasses import asdict, replace
+
+import numpy as np
+
+from darwinism.config import Config, make_config
+from darwinism.sim import genome as gn
+from darwinism.sim import world_cache
+from darwinism.sim.simulation import Simulation
+from darwinism.sim.systems.pipeline import StepContext
+from darwinism.sim.world import World
+
+
+class StackedEntities:
+    """Read-only batch view of the members' entity stores. ``<name>`` stacks every member's
+    current ``entities.<name>`` on a leading batch axis (a fresh ``(B, cap, ...)`` array per
+    read); the counts are per-world ``(B,)`` arrays. The stores themselves are never rebound,
+    so writes go to ``sims[b].entities``."""
+
+    def __init__(self, stores: list):
+        self._stores = list(stores)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        arrays = [getattr(e, name) for e in self._stores]
+        if not isinstance(arrays[0], np.ndarray):
+            raise AttributeError(f"Entities.{name} is not an array")
+        return np.stack(arrays)
+
+    @property
+    def n_alive(self) -> np.ndarray:
+        return np.array([e.n_alive for e in self._stores])
+
+    def count_species(self, species_id: int) -> np.ndarray:
+        return np.array([e.count_species(species_id) for e in self._stores])
+
+
+class LockstepSimulation:
+    def __init__(self, configs: list[Config], brains: list | None = None):
+        if not configs:
+            raise ValueError("LockstepSimulation needs at least one config")
+        if brains is not None and len(brains) != len(configs):
+            raise ValueError(f"got {len(brains)} brains for {len(configs)} configs")
+        first = configs[0]
+        layout = gn.build_registry(first.species)
+        for cfg in configs[1:]:
+            if (cfg.world.width, cfg.world.height) != (first.world.width, first.world.height):
+                raise ValueError("every world in a batch must have the same width and height")
+            if cfg.sim.max_entities != first.sim.max_entities:
+                raise ValueError("every world in a batch must have the same max_entities")
+            if (sorted(cfg.species) != sorted(first.species)
+                    or gn.build_registry(cfg.species) != layout):
+                raise ValueError("every world in a batch must register the same species and genes")
+
+        # one generated World per distinct WorldConfig; each member gets a shallow copy whose
+        # nutrient field (the only World array a run mutates) is its row of a (B, H, W) stack
+        bases = {}
+        for cfg in configs:
+            key = json.dumps(asdict(cfg.world), sort_keys=True)
+            if key not in bases:
+                bases[key] = (world_cache.load_or_build(cfg.world, cfg.sim.world_cache)
+                              if cfg.sim.world_cache else World(cfg.world))
+        worlds = [bases[json.dumps(asdict(cfg.world), sort_keys=True)] for cfg in configs]
+        self.nutrients = np.stack([w.nutrients for w in worlds])
+        members = []
+        for b, base in enumerate(worlds):
+            world = copy.copy(base)
+            world.nutrients = self.nutrients[b]
+            members.append(world)
+
+        self.sims = [Simulation(cfg, brain=None if brains is None else brains[b], world=world)
+                     for b, (cfg, world) in enumerate(zip(configs, members))]
+        n_systems = {len(sim.systems) for sim in self.sims}
+        if len(n_systems) != 1:
+            raise ValueError("every world in a batch must run a pipeline of the same length")
+
+        self.entities = StackedEntities([sim.entities for sim in self.sims])
+        self.veg = np.stack([sim.veg for sim in self.sims])
+        for b, sim in enumerate(self.sims):
+            sim.veg = self.veg[b]
+        # static per-cell fields read by the batched systems: (1, H, W) when every member is
+        # on the same map, else (B, H, W)
+        self.static_temp = self._stack_static("static_temp")
+        self.plant_suitability = self._stack_static("plant_suitability")
+        self.moisture = self._stack_static("moisture")
+        self.water_any = self._stack_static("water_any")
+
+        self.tick = 0
+        # per-tick stats of every world, as {key: (B,) array}; set by step()
+        self.stats = {}
+
+    @classmethod
+    def from_seeds(cls, seeds, world_seeds=None, cfg: Config | None = None,
+                   brains: list | None = None) -> LockstepSimulation:
+        """One world per run seed, each a copy of ``cfg`` (default: ``make_config()``).
+        ``world_seeds`` is one world seed for all, a list of one per run seed, or ``None`` to
+        keep ``cfg``'s."""
+        base = cfg if cfg is not None else make_config()
+        seeds = list(seeds)
+        if world_seeds is None or np.isscalar(world_seeds):
+            world_seeds = [world_seeds] * len(seeds)
+        if len(world_seeds) != len(seeds):
+            raise ValueError(f"got {len(world_seeds)} world seeds for {len(seeds)} run seeds")
+        configs = []
+        for seed, world_seed in zip(seeds, world_seeds):
+            c = copy.deepcopy(base)
+            c.seed = seed
+            if world_seed is not None:
+                c.world = replace(c.world, seed=world_seed)
+            configs.append(c)
+        return cls(configs, brains=brains)
+
+    def _stack_static(self, name: str) -> np.ndarray:
+        fields = [getattr(sim.world, name) for sim in self.sims]
+        if all(f is fields[0] for f in fields):
+            return fields[0][None]
+        return np.stack(fields)
+
+    def __len__(self) -> int:
+        return len(self.sims)
+
+    # ------------------------------------------------------------------ tick
+    def step(self, dt: float | None = None) -> dict:
+        """Advance every world one tick (batchable systems once over the stacks, the rest once
+        per world). Returns the per-world stats as ``{key: (B,) array}``."""
+        ctxs = []
+        for sim in self.sims:
+            sim.tick += 1
+            ctxs.append(StepContext(sim, sim.cfg.sim.dt if dt is None else dt))
+        self.tick += 1
+        for k, system in enumerate(self.sims[0].systems):
+            members = [sim.systems[k] for sim in self.sims]
+            if system.batchable and all(type(s) is type(system) for s in members):
+                system.apply_batch(ctxs, self)
+            else:
+                for member, ctx in zip(members, ctxs):
+                    member.apply(ctx)
+        for sim, ctx in zip(self.sims, ctxs):
+            sim.last_obs = ctx.obs
+            sim.stats = ctx.stats
+        self.stats = {key: np.array([ctx.stats[key] for ctx in ctxs]) for key in ctxs[0].stats}
+        return self.stats
+
+    # ------------------------------------------------------------------ analysis helpers
+    @property
+    def populations(self) -> dict:
+        """Live count per species and world, keyed by species name (``(B,)`` int arrays)."""
+        cfg = self.sims[0].cfg
+        return {cfg.species[sid].name: self.entities.count_species(sid)
+                for sid in sorted(cfg.species)}
@@ -3,7 +3,8 @@
 Each tick this builds, for every alive agent, a stack of egocentric perception grids plus
 a small vector of internal/global scalars. The grids are the agent's *raw* local view of
 the world -- a square window of side ``K = 2*R + 1`` cells centred on the agent, where
-``R`` is the largest sensory range across all species. Cells beyond the agent's OWN
+``R`` is the largest sensory range of the agent's SPECIES (``ceil`` of its
+``gene_ranges["sensory_range"].hi``, so sheep and foxes get different K). Cells beyond the agent's OWN
 heritable ``sensory_range`` (Euclidean, in cells) or outside the world are zeroed, so each
 individual only perceives what its eyes can reach -- the window is just a fixed, batchable
 canvas. Each grid channel is CNN-ready (the whole point of the grid design).
@@ -86,12 +87,29 @@ NUM_BIOMES = 7                      # see sim/world.py biome ids (OCEAN..PLAINS)
 SCALAR_DIM = 10
 
 
+# grid storage (``SimConfig.perception_dtype``) -> (numpy dtype, stored units per 1.0). Every
+# channel is binary or a [0, 1] field, so uint8 keeps 1/255 steps and float16 ~3 digits.
+GRID_DTYPES = {"float32": (np.float32, 1.0), "float16": (np.float16, 1.0),
+               "uint8": (np.uint8, 255.0)}
+
+
+def load_grids(a: np.ndarray, scale: float) -> np.ndarray:
+    """Stored grid values as float32 channel values (a no-op on float32 grids)."""
+    if a.dtype == np.float32:
+        return a
+    out = a.astype(np.float32)
+    if scale != 1.0:
+        out /= np.float32(scale)
+    return out
+
+
 class Observation:
     """The batched per-species perception handed to ``Brain.decide``.
 
-    ``grids``   : (N, C, K, K) float32 -- egocentric channels for this species (CNN-ready).
+    ``grids``   : (N, C, K, K) -- egocentric channels for this species (CNN-ready), float32
+      unless ``SimConfig.perception_dtype`` stores them narrower (see ``scale``).
     ``scalars`` : (N, SCALAR_DIM) float32 -- internal state + global env.
-    ``radius``  : int -- the window half-width R (K = 2R+1).
+    ``radius``  : int -- this species' window half-width R (K = 2R+1).
     ``idx``     : (N,) global entity slot ids for the rows (sorted), for scatter-back.
     ``species`` : int -- the species id this observation describes.
     ``channels``: dict role -> grid channel index for THIS species (e.g. {"terrain":0,
@@ -100,18 +118,165 @@ class Observation:
     ``food_reduction``: how a rule brain should reduce the food channel to a target -- "best"
       (richest cell, for grazers eating a continuous field) or "nearest" (closest marker, for
       hunters eating discrete prey). A neural brain ignores this and learns off the raw channel.
+    ``points``  : ``None`` for a dense observation. A SPARSE observation (see
+      ``SimConfig.perception_format``) instead carries its entity channels (threat, mate, prey
+      food) as COO lists ``{role: (rows, y, x, value)}`` in window coordinates. It is LAZY:
+      a field channel (terrain, water, grazed food, dist) is computed only when it is read,
+      and so is an entity channel its brain did not declare (``Brain.channels``); ``points``
+      holds the ones built so far. ``channel(role)`` and ``grids`` materialize the dense form
+      on request, so any brain can read either kind. An undeclared entity channel is
+      computed from the entity state at read time, so ``finish_entities`` builds the rest
+      once the brain has decided, before anything moves (``Simulation.last_obs`` is
+      finished); a lazy observation from a bare ``Perception.build()`` is not.
+    ``scale``   : stored grid units per 1.0 -- 255 for uint8 grids, else 1. ``channel(role)``
+      always returns float32 values; a consumer of the raw ``grids`` upcasts and divides.
+    ``lazy``    : ``None`` for a dense observation; else the ``_LazyChannels`` that computes
+      its unbuilt channels (and the direct-decoding lookups ``RuleBrain`` uses).
+
+    ``len(obs)`` is the number of rows; prefer it to ``obs.grids.shape[0]``, which would build
+    a sparse observation's whole dense tensor.
     """
-    __slots__ = ("grids", "scalars", "radius", "idx", "species", "channels", "food_reduction")
+    __slots__ = ("_grids", "scalars", "radius", "idx", "species", "channels", "food_reduction",
+                 "points", "lazy", "scale", "_cache")
 
     def __init__(self, grids, scalars, radius, idx, species, channels=None,
-                 food_reduction="nearest"):
-        self.grids = grids
+                 food_reduction="nearest", points=None, lazy=None, scale=1.0):
+        self._grids = grids
         self.scalars = scalars
         self.radius = radius
         self.idx = idx
         self.species = species
         self.channels = channels
         self.food_reduction = food_reduction
+        self.points = points
+        self.lazy = lazy                      # computes the unbuilt channels (sparse only)
+        self.scale = scale
+        self._cache = {}
+
+    def __len__(self) -> int:
+        return self.scalars.shape[0]
+
+    @property
+    def sparse(self) -> bool:
+        return self.points is not None
+
+    def cells(self, role: str):
+        """``(rows, y, x, value)`` of ``role`` when the channel is nothing BUT its COO list (a
+        sparse entity channel); ``None`` when it has to be read densely via ``channel``."""
+        if self.points is None or role in self.lazy.fields:
+            return None
+        cells = self.points.get(role)
+        if cells is None:
+            cells = self.points[role] = self.lazy.cells(role)
+        return cells
+
+    def finish_entities(self) -> None:
+        """Build every entity channel not built yet, from the entity state as it is now (a
+        no-op for a dense observation). The field channels read state that does not move
+        within a tick, so they can stay lazy."""
+        if self.points is None or not len(self):
+            return
+        for role in self.channels:
+            if role not in self.lazy.fields:
+                self.cells(role)
+
+    def channel(self, role: str) -> np.ndarray:
+        """The dense (N, K, K) float32 channel for ``role`` (a view of float32 ``grids``)."""
+        if self.points is None:
+            return load_grids(self._grids[:, self.channels[role]], self.scale)
+        chan = self._cache.get(role)
+        if chan is None:
+            n, K = len(self), 2 * self.radius + 1
+            if role in self.lazy.fields:
+                chan = self.lazy.window(role)
+            else:
+                chan = np.zeros((n, K, K), dtype=np.float32)
+                rows, y, x, value = self.cells(role)
+                chan[rows, y, x] = value
+            self._cache[role] = chan
+        return chan
+
+    @property
+    def grids(self) -> np.ndarray:
+        if self._grids is None:
+            order = sorted(self.channels, key=self.channels.get)
+            p = self.lazy.perception
+            self._grids = (p._store(np.stack([self.channel(r) for r in order], axis=1))
+                           if len(self) else
+                           np.zeros((0, len(order), 2 * self.radius + 1, 2 * self.radius + 1),
+                                    dtype=p.grid_dtype))
+        return self._grids
+
+
+class _LazyChannels:
+    """The unbuilt channels of one species' sparse observation, computed on request: a field
+    role's (n, K, K) window is the same masked slice ``Perception._field`` produces for the
+    dense grids, an entity role's cells the same ``Perception._entity_cells`` list."""
+
+    def __init__(self, perception, sid, sp_idx, px, py, cx, cy, sens, veg_pad):
+        self.perception = perception
+        self.sid, self.sp_idx = sid, sp_idx
+        self.px, self.py, self.cx, self.cy, self.sens = px, py, cx, cy, sens
+        self.veg_pad = veg_pad
+        self.fields = {"terrain", "water", "dist"}
+        if perception._food_fields[sid]:
+            self.fields.add("food")
+        self._masks = None
+
+    def masks(self) -> np.ndarray:
+        if self._masks is None:
+            p = self.perception
+            self._masks = p._masks_of[self.sid][self.mask_radius()]
+        return self._masks
+
+    def window(self, role: str, radius: int | None = None, rows=None) -> np.ndarray:
+        """The masked (n, K, K) window of a field role. ``radius`` cuts it to the central
+        (2*radius+1)^2 square (same cells, same row-major order); ``rows`` to those rows."""
+        p = self.perception
+        R = p._radius[self.sid]
+        r = R if radius is None else min(radius, R)
+        cx, cy = self.cx, self.cy
+        if rows is None and r == R:
+            masks = self.masks()
+        else:
+            eye = self.mask_radius()
+            if rows is not None:
+                eye, cx, cy = eye[rows], cx[rows], cy[rows]
+            masks = p._masks_of[self.sid][:, R - r:R + r + 1, R - r:R + r + 1][eye]
+        if role == "dist":
+            return p._round_trip(p._pos_d_of[self.sid][None, R - r:R + r + 1, R - r:R + r + 1]
+                                 * masks)
+        src = {"terrain": p._terr_pad, "water": p._water_pad, "food": self.veg_pad}[role]
+        return p._round_trip(p._field(src, cx, cy, masks))
+
+    def mask_radius(self) -> np.ndarray:
+        """Each row's integer eye radius (its mask is the disc ``dist <= radius``)."""
+        return np.clip(np.rint(self.sens).astype(np.intp), 0, self.perception._radius[self.sid])
+
+    def nearest_water(self):
+        """``nearest_in_channel`` of the water channel, read off the static per-cell
+        ``Perception.water_nearest`` field -- no window is sliced."""
+        dx, dy, d = self.perception.water_nearest()
+        d = d[self.cy, self.cx]
+        present = d <= self.mask_radius()
+        return (present.astype(np.float32),
+                np.where(present, dx[self.cy, self.cx], np.float32(0.0)),
+                np.where(present, dy[self.cy, self.cx], np.float32(0.0)),
+                np.where(present, d, np.float32(0.0)))
+
+    def local_max(self, role: str) -> np.ndarray:
+        """Per row, an upper bound on every cell of the row's ``role`` window (the grazed
+        field's max over the (K, K) square around it)."""
+        if role != "food":
+            raise ValueError(f"no local-max field for channel {role!r}")
+        p = self.perception
+        return p._round_trip(p.veg_local_max()[self.cy, self.cx])  # rounding is monotone
+
+    def cells(self, role: str):
+        rows, y, x = self.perception._entity_cells(self.sid, self.sp_idx, self.px, self.py,
+                                                   self.cx, self.cy, self.sens,
+                                                   roles=(role,))[role]
+        return rows, y, x, np.ones(rows.shape[0], dtype=np.float32)
 
 
 class Perception:
@@ -123,12 +288,24 @@ class Perception:
         self.veg = None                       # wired in per-tick by Simulation
         self.temp_field = None                # wired in per-tick by Simulation
         self._species_grids = {}              # species_id -> SpatialGrid (rebuilt each tick)
-
-        # window half-width = ceil(largest sensory_range across all species). One fixed K
-        # so each species' batch shares the same canvas; smaller-eyed individuals just see a
-        # masked sub-disc of it.
-        max_sens = max(s.gene_ranges["sensory_range"].hi for s in cfg.species.values())
-        self.R = int(np.ceil(max_sens))
+        # "dense": (N, C, K, K) grids; "sparse": lazy COO observations; "auto": sparse for
+        # species whose brain declares its channels, dense for the rest
+        self.format = cfg.sim.perception_format
+        if self.format not in ("auto", "dense", "sparse"):
+            raise ValueError(f"unknown perception_format {self.format!r} (expected 'auto', "
+                             f"'dense' or 'sparse')")
+        if cfg.sim.perception_dtype not in GRID_DTYPES:
+            raise ValueError(f"unknown perception_dtype {cfg.sim.perception_dtype!r} (expected "
+                             f"one of {sorted(GRID_DTYPES)})")
+        self.grid_dtype, self.grid_scale = GRID_DTYPES[cfg.sim.perception_dtype]
+
+        # window half-width per species = ceil(its largest sensory_range) (genes are clamped
+        # to their range, so no individual sees past it); one K per species batch, and
+        # smaller-eyed individuals see a masked sub-disc of it. ``R`` / ``K`` are the largest
+        # window: the padding border, and the reach of the direct-decoding fields.
+        self._radius = {sid: int(np.ceil(spec.gene_ranges["sensory_range"].hi))
+                        for sid, spec in cfg.species.items()}
+        self.R = max(self._radius.values())
         self.K = 2 * self.R + 1
 
         # egocentric distance-from-centre stencil (K,K)
@@ -152,6 +329,27 @@ class Perception:
         terrain = (biome + 1.0) * (1.0 / NUM_BIOMES)
         self._terr_pad = np.pad(terrain, self.R)
         self._water_pad = np.pad(world.freshwater.astype(np.float32), self.R)
+        # narrow grids are filled in their own storage width: every window value is v * mask
+        # with a 0/1 mask, i.e. the stored bits of v AND all-ones/all-zero mask bits (exact,
+        # and integer-fast where float16 arithmetic is not). Static fields are stored once.
+        self._bits = None
+        if self.grid_dtype is not np.float32:
+            self._bits = np.uint8 if self.grid_dtype is np.uint8 else np.uint16
+            ones = np.iinfo(self._bits).max
+            self._mask_bits = np.where(self._mask_cache > 0, ones, 0).astype(self._bits)
+            self._terr_bits = self._store(self._terr_pad).view(self._bits)
+            self._water_bits = self._store(self._water_pad).view(self._bits)
+            self._pos_bits = self._store(self._pos_d).view(self._bits)
+        # each species' stencils are the central crops of the largest ones (so a cell's ``dist``
+        # value does not depend on the species), contiguous for fast per-agent gathers
+        self._masks_of, self._pos_d_of, self._mask_bits_of, self._pos_bits_of = {}, {}, {}, {}
+        for sid, r in self._radius.items():
+            self._masks_of[sid] = np.ascontiguousarray(self._crop(self._mask_cache[:r + 1], r))
+            self._pos_d_of[sid] = np.ascontiguousarray(self._crop(self._pos_d, r))
+            if self._bits is not None:
+                self._mask_bits_of[sid] = np.ascontiguousarray(
+                    self._crop(self._mask_bits[:r + 1], r))
+                self._pos_bits_of[sid] = np.ascontiguousarray(self._crop(self._pos_bits, r))
 
         # --- per-species channel SCHEMA, derived from diet + predation relationships (data,
         # not hardcoded). Canonical order: terrain, water, food, [threat iff the species has
@@ -183,28 +381,73 @@ class Perception:
 
         # lazily-grown output buffers, one (grids, scalars) pair per species
         self._buf = {}                        # species_id -> [grids, scalars]
+        # direct-decoding fields (see RuleBrain): built on first use. The water one is static;
+        # the vegetation local max is per tick (reset by build).
+        self._water_nearest = None
+        self._veg_max = None
 
     # ------------------------------------------------------------------ buffers
     def _ensure_buffers(self, sid: int, n: int):
         buf = self._buf.get(sid)
-        if buf is None or buf[0].shape[0] < n:
+        if buf is None or buf[0] is None or buf[0].shape[0] < n:
             cap = max(n, 1)
-            buf = [np.zeros((cap, self._n_channels[sid], self.K, self.K), dtype=np.float32),
+            k = 2 * self._radius[sid] + 1
+            buf = [np.zeros((cap, self._n_channels[sid], k, k), dtype=self.grid_dtype),
                    np.zeros((cap, SCALAR_DIM), dtype=np.float32)]
             self._buf[sid] = buf
         return buf
 
+    def _ensure_scalars(self, sid: int, n: int) -> np.ndarray:
+        """Scalar buffer alone, for the sparse format (which never allocates grids)."""
+        buf = self._buf.get(sid)
+        if buf is None or buf[1].shape[0] < n:
+            buf = [None, np.zeros((max(n, 1), SCALAR_DIM), dtype=np.float32)]
+            self._buf[sid] = buf
+        return buf[1]
+
+    def _crop(self, a: np.ndarray, r: int) -> np.ndarray:
+        """The central (2r+1)^2 cells of a (..., K, K) stencil."""
+        R = self.R
+        return a[..., R - r:R + r + 1, R - r:R + r + 1]
+
+    def _store(self, a: np.ndarray) -> np.ndarray:
+        """float32 channel values in the grid storage dtype (uint8: clipped to [0, 1] and
+        rounded to 1/255 steps)."""
+        if self.grid_dtype is np.float32:
+            return a
+        if self.grid_dtype is np.uint8:
+            return np.rint(np.clip(a, 0.0, 1.0) * self.grid_scale).astype(np.uint8)
+        return a.astype(self.grid_dtype)
+
+    def _round_trip(self, a: np.ndarray) -> np.ndarray:
+        """``a`` as a brain reads it back from the grid storage, so a lazy channel holds the
+        very values a dense one of the same dtype would."""
+        if self.grid_dtype is np.float32:
+            return a
+        return load_grids(self._store(a), self.grid_scale)
+
     # ------------------------------------------------------------------ public
-    def build(self):
-        """Return (obs_by_species, idx). ``idx`` is the global alive ordering."""
+    def build(self, channels=None):
+        """Return (obs_by_species, idx). ``idx`` is the global alive ordering.
+
+        ``channels`` maps species id -> the roles its consumers will read (``Brain.channels``),
+        or ``None`` for the full tensor. Under ``"auto"`` a species with declared roles gets a
+        sparse observation (its declared entity channels built now, everything else on read)
+        and one without gets the dense grids; ``"dense"`` / ``"sparse"`` force one kind."""
+        channels = channels or {}
         ent = self.ent
         idx = ent.alive_indices()
         species_of_idx = ent.species[idx]
         veg_pad = np.pad(self.veg, self.R)            # one veg pad per tick (grazing field)
+        self._veg_max = None
         obs_by_species = {}
         for sid in sorted(self.cfg.species):          # ascending id (determinism)
             sp_idx = idx[species_of_idx == sid]       # sorted subset of the global idx
-            obs_by_species[sid] = self._build_species(sid, sp_idx, veg_pad)
+            roles = channels.get(sid)
+            if self.format == "dense" or (self.format == "auto" and roles is None):
+                obs_by_species[sid] = self._build_species(sid, sp_idx, veg_pad)
+            else:
+                obs_by_species[sid] = self._build_species_sparse(sid, sp_idx, veg_pad, roles)
         return obs_by_species, idx
 
     def _build_species(self, sid, sp_idx, veg_pad) -> Observation:
@@ -213,7 +456,8 @@ class Perception:
         ci = self._chan_index[sid]                   # role -> channel index (schema)
         fr = self._food_reduction[sid]
         if n == 0:
-            return Observation(grids[:0], scalars[:0], self.R, sp_idx, sid, ci, fr)
+            return Observation(grids[:0], scalars[:0], self._radius[sid], sp_idx, sid, ci, fr,
+                               scale=self.grid_scale)
 
         ent = self.ent
         px = ent.pos_x[sp_idx]
@@ -223,8 +467,22 @@ class Perception:
         cx, cy = self.world.world_to_cell(px, py)
         cx = cx.astype(np.int32)
         cy = cy.astype(np.int32)
-        masks = self._mask_cache[np.clip(np.rint(sens).astype(np.intp), 0, self.R)]  # (n,K,K)
-
+        eye = np.clip(np.rint(sens).astype(np.intp), 0, self._radius[sid])
+        if self._bits is not None:
+            self._fill_narrow(grids, n, ci, sid, cx, cy, self._mask_bits_of[sid][eye], veg_pad)
+        else:
+            self._fill_fields(grids, n, ci, sid, cx, cy, self._masks_of[sid][eye], veg_pad)
+        # --- entity channels: prey (food), threat, mate -- set their present cells to 1.0 ---
+        for role, (rows, y, x) in self._entity_cells(sid, sp_idx, px, py, cx, cy, sens).items():
+            if rows.shape[0]:
+                grids[rows, ci[role], y, x] = self.grid_scale
+
+        self._fill_scalars(scalars, n, sp_idx, sens, max_age, cx, cy)
+        return Observation(grids[:n], scalars[:n], self._radius[sid], sp_idx, sid, ci, fr,
+                           scale=self.grid_scale)
+
+    def _fill_fields(self, grids, n, ci, sid, cx, cy, masks, veg_pad) -> None:
+        """The field channels of a float32 grid buffer, with the entity channels zeroed."""
         # --- field channels: terrain + water (every species; assignment overwrites) ---
         grids[:n, ci["terrain"]] = self._field(self._terr_pad, cx, cy, masks)
         grids[:n, ci["water"]] = self._field(self._water_pad, cx, cy, masks)
@@ -240,25 +498,59 @@ class Perception:
         for _fld in self._food_fields[sid]:
             # the vegetation per-cell field is the only grazeable field today
             grids[:n, ci["food"]] = self._field(veg_pad, cx, cy, masks)
-        if self._prey_of.get(sid):
-            # exposed prey only -- prey hidden in cover are invisible to predators (refuge)
-            self._scatter_from_species(grids, n, px, py, cx, cy, sens, ci["food"],
-                                       self._prey_of[sid], cover_filter=True)
-
-        # --- threat: nearby predator species (only present when this species has predators) ---
-        if "threat" in ci:
-            self._scatter_from_species(grids, n, px, py, cx, cy, sens, ci["threat"],
-                                       self._predators_of[sid], cover_filter=False)
-
-        # --- mate: conspecific opposite-sex adults ---
-        self._scatter_mates(grids, n, sp_idx, px, py, cx, cy, sens, sid, ci["mate"])
 
         # --- positional channel (common): radial distance, masked to each agent's own vision
         # disc exactly like the content channels above ---
-        grids[:n, ci["dist"]] = self._pos_d[None] * masks
-
-        # --- scalars ---
-        s = scalars
+        grids[:n, ci["dist"]] = self._pos_d_of[sid][None] * masks
+
+    def _fill_narrow(self, grids, n, ci, sid, cx, cy, mask_bits, veg_pad) -> None:
+        """``_fill_fields`` for a float16/uint8 buffer, as bit-ANDs in the storage width."""
+        g = grids.view(self._bits)
+        k = mask_bits.shape[-1]
+        o = self.R - (k - 1) // 2                     # the species window inside the padding
+        cy, cx = cy + o, cx + o
+
+        def win(src):
+            return sliding_window_view(src, (k, k))[cy, cx]
+
+        np.bitwise_and(win(self._terr_bits), mask_bits, out=g[:n, ci["terrain"]])
+        np.bitwise_and(win(self._water_bits), mask_bits, out=g[:n, ci["water"]])
+        for role in ("food", "threat", "mate"):
+            if role in ci:
+                g[:n, ci[role]] = 0
+        if self._food_fields[sid]:
+            veg_bits = self._store(veg_pad).view(self._bits)
+            np.bitwise_and(win(veg_bits), mask_bits, out=g[:n, ci["food"]])
+        np.bitwise_and(self._pos_bits_of[sid][None], mask_bits, out=g[:n, ci["dist"]])
+
+    def _build_species_sparse(self, sid, sp_idx, veg_pad, roles=None) -> Observation:
+        """The sparse twin of ``_build_species``: the entity channels in ``roles`` (all of them
+        when ``None``) as COO cell lists, everything else left to ``_LazyChannels`` until
+        it is read. No (N, C, K, K) buffer."""
+        n = sp_idx.shape[0]
+        scalars = self._ensure_scalars(sid, n)
+        ci = self._chan_index[sid]
+        fr = self._food_reduction[sid]
+        ent = self.ent
+        px = ent.pos_x[sp_idx]
+        py = ent.pos_y[sp_idx]
+        sens = gn.gene(ent.genome[sp_idx], "sensory_range")
+        max_age = gn.gene(ent.genome[sp_idx], "max_age")
+        cx, cy = self.world.world_to_cell(px, py)
+        cx = cx.astype(np.int32)
+        cy = cy.astype(np.int32)
+        points = {}
+        if n:
+            for role, (rows, y, x) in self._entity_cells(sid, sp_idx, px, py, cx, cy, sens,
+                                                         roles).items():
+                points[role] = (rows, y, x, np.ones(rows.shape[0], dtype=np.float32))
+            self._fill_scalars(scalars, n, sp_idx, sens, max_age, cx, cy)
+        lazy = _LazyChannels(self, sid, sp_idx, px, py, cx, cy, sens, veg_pad)
+        return Observation(None, scalars[:n], self._radius[sid], sp_idx, sid, ci, fr,
+                           points=points, lazy=lazy, scale=self.grid_scale)
+
+    def _fill_scalars(self, s, n, sp_idx, sens, max_age, cx, cy) -> None:
+        ent = self.ent
         s[:n, S_HUNGER] = ent.hunger[sp_idx]
         s[:n, S_THIRST] = ent.thirst[sp_idx]
         s[:n, S_ENERGY] = ent.energy[sp_idx]
@@ -270,63 +562,170 @@ class Perception:
         s[:n, S_SEASON] = self.env.season
         s[:n, S_SENSORY] = sens
 
-        return Observation(grids[:n], scalars[:n], self.R, sp_idx, sid, ci, fr)
+    # ------------------------------------------------------------------ decoding fields
+    def water_nearest(self):
+        """Per world cell, the freshwater cell a window centred there decodes as NEAREST: the
+        ``(dx, dy, dist)`` offset to it (float32, ``dist`` inf when there is none within R).
+
+        "Nearest" is exactly ``nearest_in_channel``'s pick -- smallest float32 cell distance,
+        ties to the first cell in row-major window order -- so an agent's water target is just
+        a lookup, present iff ``dist`` is inside its eye radius. Computed once per world by
+        walking the window offsets in that order; ``world.fw_dist`` (an 8-neighbour path
+        distance, never below the straight-line one and at most 1.0824x it) rules out the
+        cells with no water in range up front."""
+        if self._water_nearest is None:
+            world, R, K = self.world, self.R, self.K
+            h, w = world.h, world.w
+            oy, ox = np.divmod(np.arange(K * K), K)
+            oy, ox = oy - R, ox - R
+            d = self._d_cell.ravel()
+            dx = np.zeros((h, w), dtype=np.float32)
+            dy = np.zeros((h, w), dtype=np.float32)
+            dist = np.full((h, w), np.inf, dtype=np.float32)
+            open_ = np.flatnonzero(world.fw_dist.ravel() <= 1.0824 * R + 2.0)
+            cy, cx = np.divmod(open_, w)
+            fw = world.freshwater
+            for k in np.lexsort((np.arange(K * K), d)):       # by distance, then window order
+                if d[k] > R or open_.shape[0] == 0:
+                    break
+                ty, tx = cy + oy[k], cx + ox[k]
+                hit = (ty >= 0) & (ty < h) & (tx >= 0) & (tx < w)
+                hit[hit] = fw[ty[hit], tx[hit]]
+                if hit.any():
+                    y, x = cy[hit], cx[hit]
+                    dx[y, x], dy[y, x], dist[y, x] = ox[k], oy[k], d[k]
+                    keep = ~hit
+                    open_, cy, cx = open_[keep], cy[keep], cx[keep]
+            self._water_nearest = (dx, dy, dist)
+        return self._water_nearest
+
+    def veg_local_max(self) -> np.ndarray:
+        """This tick's vegetation max over the (K, K) square around every cell."""
+        if self._veg_max is None:
+            self._veg_max = _square_max(self.veg, self.R)
+        return self._veg_max
 
     # ------------------------------------------------------------------ fill helpers
     def _field(self, src_pad, cx, cy, masks):
-        """Egocentric KxK window of a padded world field, masked by each agent's eye disc."""
-        K = self.K
-        return sliding_window_view(src_pad, (K, K))[cy, cx] * masks   # (n,K,K)
-
-    def _scatter_from_species(self, grids, n, px, py, cx, cy, sens, ch, species_ids,
-                              cover_filter):
-        """Mark in-range members of the given (ascending-id) species into channel ``ch``.
+        """Egocentric KxK window of a padded world field, masked by each agent's eye disc
+        (K is the masks' side: a species window sits ``R - (K-1)/2`` cells into the padding)."""
+        k = masks.shape[-1]
+        o = self.R - (k - 1) // 2
+        if o:
+            cy, cx = cy + o, cx + o
+        return sliding_window_view(src_pad, (k, k))[cy, cx] * masks   # (n,K,K)
+
+    def _entity_cells(self, sid, sp_idx, px, py, cx, cy, sens, roles=None) -> dict:
+        """Present cells of this species' entity channels (those in ``roles``, or all when
+        ``None``), as ``{role: (rows, y, x)}`` in window coordinates (duplicates allowed --
+        several targets can share a cell):
+
+          food    exposed prey (hunters only) -- prey hidden in cover are invisible (refuge)
+          threat  nearby predators (only when this species has predators)
+          mate    conspecific opposite-sex adults
+        """
+        cells = {}
+        if roles is None:
+            roles = ("food", "threat", "mate")
+        r = self._radius[sid]
+        if self._prey_of.get(sid) and "food" in roles:
+            cells["food"] = self._cells_from_species(px, py, cx, cy, sens, r,
+                                                     self._prey_of[sid], cover_filter=True)
+        if "threat" in self._chan_index[sid] and "threat" in roles:
+            cells["threat"] = self._cells_from_species(px, py, cx, cy, sens, r,
+                                                       self._predators_of[sid],
+                                                       cover_filter=False)
+        if "mate" in roles:
+            cells["mate"] = self._mate_cells(sp_idx, px, py, cx, cy, sens, r, sid)
+        return cells
+
+    def _cells_from_species(self, px, py, cx, cy, sens, r, species_ids, cover_filter):
+        """In-range members of the given (ascending-id) species, as window cells.
 
         Used for both the ``food`` channel (prey species, ``cover_filter=True`` so prey hidden
         in cover are invisible -- the refuge, v1.md §18) and the ``threat`` channel (predator
-        species, no cover filter). Draws no RNG; scatter is idempotent (sets cells to 1.0), so
-        the order among ``species_ids`` does not affect the result -- for the default config
-        each list is a singleton, byte-identical to the old per-role helpers."""
+        species, no cover filter). Draws no RNG; a present cell is simply marked, so the order
+        among ``species_ids`` does not affect the result.
+
+        Batched: every (observer, target) pair of a species comes from one grid query, so
+        there is no per-agent Python loop."""
         ent = self.ent
+        found = []
         for other in species_ids:
             grid = self._species_grids.get(other)
             if grid is None or int(ent.count_species(other)) == 0:
                 continue
-            for k in range(n):
-                cand, cpx, cpy = grid.query_radius(float(px[k]), float(py[k]), float(sens[k]))
-                if cand.shape[0] == 0:
-                    continue
-                if cover_filter:
-                    keep = ~self.world.in_cover(cpx, cpy)
-                    if not keep.any():
-                        continue
-                    cpx, cpy = cpx[keep], cpy[keep]
-                self._scatter(grids[k, ch], int(cx[k]), int(cy[k]), cpx, cpy)
-
-    def _scatter_mates(self, grids, n, sp_idx, px, py, cx, cy, sens, sid, ch):
+            rows, _cand, cpx, cpy = self._pairs(grid, px, py, sens)
+            if cover_filter and rows.shape[0]:
+                keep = ~self.world.in_cover(cpx, cpy)
+                rows, cpx, cpy = rows[keep], cpx[keep], cpy[keep]
+            found.append(self._window_cells(rows, cx, cy, cpx, cpy, r))
+        return _concat_cells(found)
+
+    def _mate_cells(self, sp_idx, px, py, cx, cy, sens, r, sid):
         """Adults see in-range conspecifics of the opposite sex who are also adult. Juveniles
-        can't mate, so they skip the (expensive) query entirely."""
+        can't mate, so they are left out of the (batched) query entirely."""
         ent = self.ent
         grid = self._species_grids.get(sid)
         if grid is None:
-            return
+            return _concat_cells([])
         mat = self.cfg.species[sid].maturity_age
-        for k in range(n):
-            slot = sp_idx[k]
-            if ent.age[slot] < mat:
-                continue
-            cand, cpx, cpy = grid.query_radius(float(px[k]), float(py[k]), float(sens[k]))
-            if cand.shape[0] == 0:
-                continue
-            valid = (ent.sex[cand] != ent.sex[slot]) & (ent.age[cand] >= mat) & (cand != slot)
-            if valid.any():
-                self._scatter(grids[k, ch], int(cx[k]), int(cy[k]), cpx[valid], cpy[valid])
-
-    def _scatter(self, chan, ocx: int, ocy: int, cpx, cpy) -> None:
-        """Mark candidate world positions as present cells in one agent's (K,K) window."""
-        R = self.R
-        ox = cpx.astype(np.int32) - ocx
-        oy = cpy.astype(np.int32) - ocy
+        adults = np.nonzero(ent.age[sp_idx] >= mat)[0]
+        if adults.shape[0] == 0:
+            return _concat_cells([])
+        q, cand, cpx, cpy = self._pairs(grid, px[adults], py[adults], sens[adults])
+        if q.shape[0] == 0:
+            return _concat_cells([])
+        rows = adults[q]
+        slot = sp_idx[rows]
+        valid = (ent.sex[cand] != ent.sex[slot]) & (ent.age[cand] >= mat) & (cand != slot)
+        return self._window_cells(rows[valid], cx, cy, cpx[valid], cpy[valid], r)
+
+    def _pairs(self, grid, px, py, sens):
+        """Flatten a batched grid query into aligned ``(row, slot, x, y)`` pair arrays.
+
+        ``row`` indexes the query (observer) arrays. The grid was rebuilt from this tick's
+        positions just before perception, so a neighbour's position is read straight from the
+        entity store."""
+        offsets, slots, _dx, _dy = grid.query_radius_batch(px, py, sens)
+        rows = np.repeat(np.arange(px.shape[0], dtype=np.intp), np.diff(offsets))
+        return rows, slots, self.ent.pos_x[slots], self.ent.pos_y[slots]
+
+    def _window_cells(self, rows, cx, cy, cpx, cpy, R):
+        """Candidate world positions as ``(rows, y, x)`` cells of their observers' (K,K)
+        windows of half-width ``R`` (pairs falling outside the window are dropped).
+
+        ``rows[i]`` is the observer row of the candidate at ``(cpx[i], cpy[i])``; ``cx``/``cy``
+        are the observers' cells."""
+        ox = cpx.astype(np.int32) - cx[rows]
+        oy = cpy.astype(np.int32) - cy[rows]
         m = (ox >= -R) & (ox <= R) & (oy >= -R) & (oy <= R)
-        if m.any():
-            chan[oy[m] + R, ox[m] + R] = 1.0
+        return rows[m], oy[m] + R, ox[m] + R
+
+
+def _square_max(a, r):
+    """Max of ``a`` over the (2r+1)^2 square around every cell (cells off the edge ignored),
+    as two separable running maxima of log2(2r+1) doubling steps each."""
+    for axis in (0, 1):
+        n = a.shape[axis]
+        pad = [(0, 0), (0, 0)]
+        pad[axis] = (r, r)
+        m = np.pad(a, pad, constant_values=-np.inf)
+        span, width = 1, 2 * r + 1
+        while 2 * span <= width:             # m[i] = max over [i, i + 2*span)
+            m = np.maximum(m.take(range(m.shape[axis] - span), axis),
+                           m.take(range(span, m.shape[axis]), axis))
+            span *= 2
+        lo = m.take(range(n), axis)
+        hi = m.take(range(width - span, width - span + n), axis)
+        a = np.maximum(lo, hi)
+    return a
+
+
+def _concat_cells(parts):
+    if not parts:
+        return (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.int32),
+                np.empty(0, dtype=np.int32))
+    if len(parts) == 1:
+        return parts[0]
+    return tuple(np.concatenate(a) for a in zip(*parts))
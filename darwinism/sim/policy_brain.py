@@ -55,13 +55,16 @@ class PolicyBrain(Brain):
             return act
         for sid, model in self.models.items():
             obs = obs_by_species.get(sid)
-            if obs is None or obs.grids.shape[0] == 0:
+            if obs is None or len(obs) == 0:
                 continue
+            # narrow (float16/uint8) grids travel to the device as stored, then upcast there
             grids = torch.from_numpy(np.ascontiguousarray(obs.grids)).to(self.device).float()
+            if obs.scale != 1.0:
+                grids = grids / obs.scale
             scalars = torch.from_numpy(np.ascontiguousarray(obs.scalars)).to(self.device).float()
             with torch.no_grad():
                 mean, gate_logits, speed_logit = model(grids, scalars)
-            n = obs.grids.shape[0]
+            n = len(obs)
             a = np.zeros((n, ACT_DIM), dtype=np.float32)
             a[:, _A_HEAD] = mean.cpu().numpy()
             a[:, _A_GATES] = (gate_logits > 0.0).float().cpu().numpy()   # sigmoid>0.5 <=> logit>0
@@ -0,0 +1,142 @@
+"""Per-system tick profiling: wall time of each ``System.apply`` in the pipeline.
+
+Opt-in (``Simulation(cfg, profile=True)`` or ``sim.enable_profiling()``). When it is off,
+``Simulation.step`` runs its plain loop and nothing here is touched, so a normal run pays
+nothing. When it is on, each ``apply`` is bracketed by ``time.perf_counter`` (monotonic,
+high resolution) and the duration lands in a fixed-size ring buffer per system. The summary
+gives rolling mean / p50 / p99 over the last ``window`` ticks, plus lifetime calls and total
+time. Timing only -- it draws no RNG and never touches sim state, so a profiled run is
+identical to an unprofiled one.
+
+    sim = Simulation(cfg, profile=True)
+    for _ in range(1000):
+        sim.step()
+    print(sim.profile.format_table())
+    sim.profile.to_csv("runs/profile.csv")     # or .to_json(...)
+"""
+from __future__ import annotations
+
+import csv
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+_COLUMNS = ("system", "calls", "total_s", "mean_ms", "p50_ms", "p99_ms", "share")
+
+
+def system_names(systems) -> list[str]:
+    """Stable display name per pipeline entry: the class name, suffixed ``#2``, ``#3``, ...
+    when the same class appears more than once."""
+    seen: dict[str, int] = {}
+    names = []
+    for system in systems:
+        base = type(system).__name__
+        seen[base] = seen.get(base, 0) + 1
+        names.append(base if seen[base] == 1 else f"{base}#{seen[base]}")
+    return names
+
+
+class _Series:
+    """Ring buffer of the last ``window`` durations (seconds) plus lifetime totals."""
+    __slots__ = ("buf", "pos", "filled", "calls", "total")
+
+    def __init__(self, window: int):
+        self.buf = np.zeros(window, dtype=np.float64)
+        self.pos = 0
+        self.filled = 0
+        self.calls = 0
+        self.total = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.buf[self.pos] = seconds
+        self.pos = (self.pos + 1) % self.buf.shape[0]
+        self.filled = min(self.filled + 1, self.buf.shape[0])
+        self.calls += 1
+        self.total += seconds
+
+
+class SystemProfiler:
+    """Rolling per-system timing stats for a ``Simulation``'s tick pipeline."""
+
+    def __init__(self, window: int = 1000):
+        if window < 1:
+            raise ValueError(f"profiling window must be >= 1 (got {window})")
+        self.window = int(window)
+        self._series: dict[str, _Series] = {}     # insertion order = pipeline order
+        self._names: list[str] = []
+        self._names_key: tuple = ()
+
+    def run(self, systems, ctx) -> None:
+        """Apply every system to ``ctx`` in order, timing each call."""
+        key = tuple(id(s) for s in systems)
+        if key != self._names_key:                # pipeline edited since the last tick
+            self._names = system_names(systems)
+            self._names_key = key
+        clock = time.perf_counter
+        for name, system in zip(self._names, systems):
+            t0 = clock()
+            system.apply(ctx)
+            self.record(name, clock() - t0)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one timed call for ``name`` (also usable for custom, non-pipeline sections)."""
+        series = self._series.get(name)
+        if series is None:
+            series = self._series[name] = _Series(self.window)
+        series.add(seconds)
+
+    def reset(self) -> None:
+        self._series.clear()
+
+    # ------------------------------------------------------------------ reporting
+    def summary(self) -> dict:
+        """``{system: {calls, total_s, mean_ms, p50_ms, p99_ms, share}}`` in pipeline order.
+
+        ``mean``/``p50``/``p99`` cover the rolling window; ``calls``/``total_s`` are lifetime;
+        ``share`` is the system's fraction of the summed rolling means (its slice of a tick).
+        """
+        out = {}
+        for name, s in self._series.items():
+            recent = s.buf[:s.filled] * 1e3
+            out[name] = {
+                "calls": s.calls,
+                "total_s": s.total,
+                "mean_ms": float(recent.mean()) if s.filled else 0.0,
+                "p50_ms": float(np.percentile(recent, 50)) if s.filled else 0.0,
+                "p99_ms": float(np.percentile(recent, 99)) if s.filled else 0.0,
+            }
+        tick_ms = sum(row["mean_ms"] for row in out.values())
+        for row in out.values():
+            row["share"] = row["mean_ms"] / tick_ms if tick_ms > 0 else 0.0
+        return out
+
+    def format_table(self) -> str:
+        """Human-readable breakdown, slowest system first."""
+        rows = sorted(self.summary().items(), key=lambda kv: kv[1]["mean_ms"], reverse=True)
+        lines = [f"{'system':<22}{'calls':>8}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}"
+                 f"{'share':>8}"]
+        for name, r in rows:
+            lines.append(f"{name:<22}{r['calls']:>8}{r['mean_ms']:>10.3f}{r['p50_ms']:>10.3f}"
+                         f"{r['p99_ms']:>10.3f}{r['share']:>8.1%}")
+        tick_ms = sum(r["mean_ms"] for _, r in rows)
+        lines.append(f"{'tick (sum of means)':<28}{tick_ms:>12.3f} ms")
+        return "\n".join(lines)
+
+    def to_csv(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", newline="") as fh:
+            w = csv.writer(fh)
+            w.writerow(_COLUMNS)
+            for name, r in self.summary().items():
+                w.writerow([name] + [r[c] for c in _COLUMNS[1:]])
+        return path
+
+    def to_json(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"window": self.window, "systems": self.summary()},
+                                   indent=2) + "\n")
+        return path
@@ -12,23 +12,29 @@ Fixed tick order:
 """
 from __future__ import annotations
 
+import copy
+
 import numpy as np
 
 from darwinism.config import Config
 from darwinism.sim import genome as gn
+from darwinism.sim import snapshot, world_cache
 from darwinism.sim.brain import CompositeBrain, RuleBrain
 from darwinism.sim.entities import Entities
 from darwinism.sim.environment import Environment
 from darwinism.sim.grid import SpatialGrid
 from darwinism.sim.perception import Perception
+from darwinism.sim.profiling import SystemProfiler
 from darwinism.sim.systems import vegetation  # initial_field used at construction
 from darwinism.sim.systems.brain_system import BrainSystem
 from darwinism.sim.systems.pipeline import StepContext, default_pipeline
+from darwinism.sim.trace import StateTracer
 from darwinism.sim.world import World
 
 
 class Simulation:
-    def __init__(self, cfg: Config | None = None, brain=None, systems=None):
+    def __init__(self, cfg: Config | None = None, brain=None, systems=None,
+                 profile: bool = False, world: World | None = None):
         self.cfg = cfg or Config()
         # build the gene layout from the registered species BEFORE the entity store is sized
         # (its genome array is (max_entities, N_GENES)). For the default sheep+fox set this
@@ -38,8 +44,18 @@ class Simulation:
         self.rng = self.cfg.make_rng()
 
         # world is generated once from the WORLD seed only (independent of the run RNG), so
-        # the same world seed reproduces the same map regardless of the run/determinism seed
-        self.world = World(self.cfg.world)
+        # the same world seed reproduces the same map regardless of the run/determinism seed.
+        # With ``sim.world_cache`` set it is generated once per WorldConfig and mmapped after.
+        # A prebuilt ``world`` (e.g. one map shared by a LockstepSimulation) is used as given;
+        # the run mutates its ``nutrients``, so a caller sharing a World hands each run a copy.
+        if world is not None:
+            if world.cfg != self.cfg.world:
+                raise ValueError("world was generated from a different WorldConfig than cfg.world")
+            self.world = world
+        elif self.cfg.sim.world_cache:
+            self.world = world_cache.load_or_build(self.cfg.world, self.cfg.sim.world_cache)
+        else:
+            self.world = World(self.cfg.world)
         self.env = Environment(self.cfg.env, self.rng)
         self.entities = Entities(self.cfg)
 
@@ -61,6 +77,7 @@ class Simulation:
         # Brain contract (e.g. sim.policy_brain.PolicyBrain) can be injected. A brain that
         # keeps per-agent memory (e.g. an LSTM) is given a handle on the entity store via
         # bind(), so it can reset an agent's memory when its slot is recycled.
+        self._brain_spec = brain             # kept so fork() can share the passed-in brains
         self.brain = self._resolve_brain(brain)
         if hasattr(self.brain, "bind"):
             self.brain.bind(self.entities)
@@ -71,6 +88,14 @@ class Simulation:
         # tick systems. Reordering RNG-drawing systems changes the run -- see systems.pipeline.
         self.systems = systems if systems is not None else default_pipeline(self.cfg)
 
+        # per-system timing (a SystemProfiler) when profiling is on, else None -- step() then
+        # runs its plain loop, so an unprofiled run pays nothing. See sim.profiling.
+        self.profile = None
+        if profile:
+            self.enable_profiling()
+        # per-system state digests (a StateTracer) when tracing is on, else None. See sim.trace.
+        self.trace = None
+
         self.tick = 0
         # per-tick stats populated by step() for the logger / HUD
         self.stats = {}
@@ -92,7 +117,7 @@ class Simulation:
           determinism contract). Wrapped in a ``CompositeBrain`` that routes per species.
         """
         if brain is None:
-            return RuleBrain(self.rng)
+            return RuleBrain(self.rng, decode=self.cfg.sim.rule_decode)
         if isinstance(brain, dict):
             rule = None
             resolved = {}
@@ -100,7 +125,7 @@ class Simulation:
                 b = brain.get(sid)
                 if b is None:
                     if rule is None:
-                        rule = RuleBrain(self.rng)
+                        rule = RuleBrain(self.rng, decode=self.cfg.sim.rule_decode)
                     b = rule
                 resolved[sid] = b
             return CompositeBrain(resolved)
@@ -160,6 +185,72 @@ class Simulation:
                             return (nx + 0.5, ny + 0.5)
         return None
 
+    def enable_profiling(self, window: int = 1000) -> SystemProfiler:
+        """Start timing every ``System.apply`` (rolling stats over the last ``window`` ticks).
+        Returns the profiler, also reachable as ``sim.profile``."""
+        self.profile = SystemProfiler(window)
+        return self.profile
+
+    def disable_profiling(self) -> None:
+        self.profile = None
+
+    def enable_tracing(self, reference: StateTracer | None = None) -> StateTracer:
+        """Start digesting the state after every ``System.apply``. With ``reference`` (a trace
+        recorded earlier), ``step`` raises ``TraceDivergence`` at the first (tick, system) that
+        differs from it. Returns the tracer, also reachable as ``sim.trace``."""
+        self.trace = StateTracer(reference)
+        return self.trace
+
+    def disable_tracing(self) -> None:
+        self.trace = None
+
+    # ------------------------------------------------------------------ checkpoint / resume
+    def save_state(self, path):
+        """Checkpoint the full dynamic state (entities, free list, vegetation, nutrients,
+        environment, RNG) to ``path`` as an uncompressed ``.npz``. See ``sim.snapshot``."""
+        return snapshot.save(self, path)
+
+    @classmethod
+    def load_state(cls, path, brain=None, systems=None, profile: bool = False) -> Simulation:
+        """Rebuild a ``Simulation`` from a ``save_state`` checkpoint. Pass the same ``brain`` /
+        ``systems`` the run used; stepping it then continues byte-identically."""
+        sim = cls(snapshot.read_config(path), brain=brain, systems=systems, profile=profile)
+        snapshot.restore(sim, path)
+        return sim
+
+    def fork(self, seed: int | None = None) -> Simulation:
+        """An independent copy of this run, ready to step.
+
+        The copy is taken member by member, without running the constructor (no founders
+        seeded, no buffers rebuilt, no RNG draws). The World's static arrays are shared
+        (nothing writes them); the mutable state -- entities, vegetation, nutrients,
+        environment, perception buffers, RNG -- is copied. With ``seed=None`` the fork
+        continues exactly as this run would; with a ``seed`` its RNG is reseeded, so many
+        rollouts can branch from one warmed-up state. A passed-in Brain object is shared --
+        except one with a ``bind`` method (per-agent memory tied to an entity store), which is
+        copied along with its memory and points at the fork's entity store, so both runs
+        carry on from the same memory. The default RuleBrain moves to the fork's RNG. The
+        system instances are shared; profiling, tracing and ``last_obs`` start off.
+        """
+        world = copy.copy(self.world)
+        world.nutrients = self.world.nutrients.copy()   # the one World array a run mutates
+        memo = {id(self.world): world, id(self.systems): list(self.systems),
+                id(self.profile): None, id(self.trace): None, id(self.last_obs): None}
+        for value in vars(self.world).values():
+            if isinstance(value, np.ndarray) and value is not self.world.nutrients:
+                memo[id(value)] = value
+        for system in self.systems:
+            memo[id(system)] = system
+        spec = self._brain_spec
+        for b in spec.values() if isinstance(spec, dict) else (spec,):
+            if b is not None and not hasattr(b, "bind"):
+                memo[id(b)] = b
+        child = copy.deepcopy(self, memo)
+        if seed is not None:
+            child.cfg.seed = seed
+            child.rng.bit_generator.state = np.random.default_rng(seed).bit_generator.state
+        return child
+
     def _rebuild_grids(self):
         ent = self.entities
         for sid, g in self._species_grids.items():
@@ -178,8 +269,13 @@ class Simulation:
         dt = self.cfg.sim.dt if dt is None else dt
         self.tick += 1
         ctx = StepContext(self, dt)          # captures tick, veg, grids, perception, paused flag
-        for system in self.systems:
-            system.apply(ctx)
+        if self.trace is not None:
+            self.trace.run(self.systems, ctx, self.profile)
+        elif self.profile is None:
+            for system in self.systems:
+                system.apply(ctx)
+        else:
+            self.profile.run(self.systems, ctx)
         # expose this tick's per-species observations for an observer (the live viewer's entity
         # inspector). Each Observation carries its own ``idx`` captured at perception time, so a
         # row still maps to its slot even though deaths were filtered from the working set later.
@@ -188,8 +284,17 @@ class Simulation:
         return self.stats
 
     # ------------------------------------------------------------------ analysis helpers
-    def trait_means(self, species_id: int) -> dict:
-        """Mean of each heritable gene over the living members of a species."""
+    def trait_means(self, species_id: int, running: bool = False) -> dict:
+        """Mean of each heritable gene over the living members of a species.
+
+        Gathers the live genomes and reduces them (the float32 NumPy mean the CSV logs carry;
+        the golden baseline pins it). ``running=True`` instead reads the float64 running sums
+        ``entities.traits`` keeps up to date on spawn / kill: O(1), but the value can differ
+        in the last digits.
+        """
+        if running:
+            means = self.entities.traits.mean(species_id)
+            return {name: float(means[i]) for i, name in enumerate(gn.GENE_NAMES)}
         ent = self.entities
         mask = ent.species_mask(species_id)
         out = {}
@@ -202,6 +307,11 @@ class Simulation:
             out[name] = float(gn.gene(g, name).mean())
         return out
 
+    def trait_variances(self, species_id: int) -> dict:
+        """Population variance of each heritable gene over the living members (O(1))."""
+        var = self.entities.traits.var(species_id)
+        return {name: float(var[i]) for i, name in enumerate(gn.GENE_NAMES)}
+
     @property
     def populations(self) -> dict:
         """Live count per species, keyed by species name (e.g. {"sheep": .., "fox": ..})."""
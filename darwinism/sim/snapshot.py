@@ -0,0 +1,168 @@
+"""Checkpoint / resume: the complete dynamic state of a ``Simulation`` in one ``.npz`` file.
+
+The World is not stored -- it is a pure function of ``cfg.world`` and is regenerated (or
+loaded from the world cache) on resume. Everything a tick reads or writes is:
+
+    ent.<array>     every entity Structure-of-Arrays column (all slots, free ones included)
+    ent._free       the free-slot stack, in order (slot reuse order is part of the run)
+    veg, nutrients  the vegetation field and the world's mutable nutrient field
+    meta            JSON: format version, tick, ``_next_birth_id``, environment clock /
+                    season / weather, the run Generator's bit-generator state, last stats,
+                    and the ``Config`` the run was built from (its dataclasses as plain data)
+
+All arrays are written uncompressed at full precision, so a resumed run is byte-identical to
+an uninterrupted one. Brains and systems are code, not state: pass the same ones to
+``Simulation.load_state`` (a brain that keeps memory of its own, e.g. an LSTM, is not saved).
+Nothing is pickled: a checkpoint is arrays and JSON, so loading one never runs code.
+
+    sim.save_state("runs/warm.npz")
+    sim = Simulation.load_state("runs/warm.npz")
+
+``capture`` / ``apply`` are the same state without the file: ``Simulation.fork`` uses them to
+branch a run in memory.
+"""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+
+from darwinism.config import (
+    Config,
+    EnvConfig,
+    FieldFood,
+    GeneRange,
+    PreyFood,
+    SimConfig,
+    SpeciesConfig,
+    WorldConfig,
+)
+
+FORMAT_VERSION = 1
+
+# diet source classes by the tag they are stored under
+_DIET = {"field": FieldFood, "prey": PreyFood}
+
+# Environment attributes that are wiring, not state
+_ENV_SKIP = ("cfg", "rng")
+
+
+def _bytes(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype=np.uint8)
+
+
+def _diet_state(src) -> dict:
+    for kind, cls in _DIET.items():
+        if type(src) is cls:
+            return {"kind": kind, **asdict(src)}
+    raise ValueError(f"cannot checkpoint a {type(src).__name__} diet source "
+                     "(only FieldFood / PreyFood are stored)")
+
+
+def _config_state(cfg: Config) -> dict:
+    """``cfg`` as JSON-ready data (species listed with their id, diet sources tagged by kind)."""
+    species = []
+    for sid in sorted(cfg.species):
+        spec = asdict(cfg.species[sid])
+        spec["diet"] = [_diet_state(src) for src in cfg.species[sid].diet]
+        species.append({"id": sid, **spec})
+    return {"world": asdict(cfg.world), "env": asdict(cfg.env), "sim": asdict(cfg.sim),
+            "species": species, "seed": cfg.seed}
+
+
+def _config_from_state(state: dict) -> Config:
+    species = {}
+    for spec in state["species"]:
+        spec = dict(spec)
+        sid = spec.pop("id")
+        spec["gene_ranges"] = {g: GeneRange(**r) for g, r in spec["gene_ranges"].items()}
+        spec["diet"] = [_DIET[src.pop("kind")](**src) for src in map(dict, spec["diet"])]
+        spec["cluster"] = tuple(spec["cluster"])
+        species[sid] = SpeciesConfig(**spec)
+    return Config(world=WorldConfig(**state["world"]), env=EnvConfig(**state["env"]),
+                  sim=SimConfig(**state["sim"]), species=species, seed=state["seed"])
+
+
+def capture(sim) -> tuple[dict, dict]:
+    """``sim``'s dynamic state as ``(arrays, meta)``. The arrays are the live ones, not copies;
+    ``apply`` (or ``np.savez``) copies them out."""
+    ent = sim.entities
+    arrays = {f"ent.{k}": v for k, v in vars(ent).items() if isinstance(v, np.ndarray)}
+    arrays["ent._free"] = np.asarray(ent._free, dtype=np.int64)
+    arrays["veg"] = sim.veg
+    arrays["nutrients"] = sim.world.nutrients
+    meta = {
+        "format": FORMAT_VERSION,
+        "tick": sim.tick,
+        "next_birth_id": ent._next_birth_id,
+        "veg_growth_paused": sim.veg_growth_paused,
+        "env": {k: v for k, v in vars(sim.env).items() if k not in _ENV_SKIP},
+        "rng": sim.rng.bit_generator.state,
+        "stats": dict(sim.stats),
+    }
+    return arrays, meta
+
+
+def apply(sim, arrays, meta: dict) -> None:
+    """Overwrite ``sim``'s state with captured ``(arrays, meta)``. ``sim`` must have been built
+    from the same config. Arrays are written in place, so views onto them stay valid."""
+    if meta.get("format") != FORMAT_VERSION:
+        raise ValueError(f"unsupported checkpoint format {meta.get('format')!r}")
+    ent = sim.entities
+    for key in arrays:
+        if not key.startswith("ent.") or key == "ent._free":
+            continue
+        source, target = arrays[key], getattr(ent, key[4:])
+        if target.shape != source.shape:
+            raise ValueError(f"{key} has shape {source.shape}, this simulation has "
+                             f"{target.shape} (built from another config?)")
+        target[...] = source
+    ent._free = arrays["ent._free"].tolist()
+    ent.traits.rebuild(ent)
+    sim.veg[...] = arrays["veg"]
+    sim.world.nutrients[...] = arrays["nutrients"]
+    ent._next_birth_id = meta["next_birth_id"]
+    sim.tick = meta["tick"]
+    sim.veg_growth_paused = meta["veg_growth_paused"]
+    for key, value in meta["env"].items():
+        setattr(sim.env, key, value)
+    sim.rng.bit_generator.state = meta["rng"]
+    sim.stats = dict(meta["stats"])
+    sim.last_obs = None
+
+
+def save(sim, path) -> Path:
+    """Write ``sim``'s state to ``path`` (atomically: the file is complete or absent)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    arrays, meta = capture(sim)
+    meta["config"] = _config_state(sim.cfg)
+    arrays["meta"] = _bytes(json.dumps(meta).encode())
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:                 # a file handle keeps np.savez from adding .npz
+        np.savez(fh, **arrays)
+    os.replace(tmp, path)
+    return path
+
+
+def read_config(path) -> Config:
+    """The ``Config`` a checkpoint was saved from (to build the ``Simulation`` to restore into)."""
+    with np.load(path) as data:
+        meta = json.loads(data["meta"].tobytes())
+    if meta.get("format") != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported checkpoint format {meta.get('format')!r}")
+    return _config_from_state(meta["config"])
+
+
+def restore(sim, path) -> None:
+    """Overwrite ``sim``'s state with the checkpoint at ``path`` (see ``apply``)."""
+    with np.load(path) as data:
+        arrays = {key: data[key] for key in data.files if key != "meta"}
+        meta = json.loads(data["meta"].tobytes())
+    try:
+        apply(sim, arrays, meta)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from e
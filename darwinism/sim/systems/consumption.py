@@ -57,22 +57,12 @@ def apply(cfg, world, ent, idx, act, veg, species_grids, rng):
     if field_food:
         graze = eat_gate & np.isin(spec, np.fromiter(field_food, dtype=spec.dtype))
         if graze.any():
-            for k in np.nonzero(graze)[0]:            # ascending row order; no RNG here
-                slot = idx[k]
-                cx = int(min(max(px[k], 0), world.w - 1))
-                cy = int(min(max(py[k], 0), world.h - 1))
-                available = veg[cy, cx]
-                if available < cfg.sim.food_eat_threshold:
-                    continue
-                take = available * cfg.sim.veg_graze_amount
-                size = gn.gene(ent.genome[slot:slot + 1], "size")[0]
-                eat_value = field_food[int(spec[k])].eat_value
-                gain = eat_value * take * (0.7 + 0.3 * size)
-                ent.energy[slot] = min(1.0, ent.energy[slot] + gain)
-                ent.hunger[slot] = max(0.0, ent.hunger[slot] - take * 1.5)
-                veg[cy, cx] = available - take
-                world.nutrients[cy, cx] = max(0.0, world.nutrients[cy, cx] - take * 0.15)
-                n_graze += 1
+            rows = np.nonzero(graze)[0]               # ascending row order; no RNG here
+            eat_value = np.zeros(max(cfg.species) + 1, dtype=np.float32)
+            for sid, ff in field_food.items():
+                eat_value[sid] = ff.eat_value
+            n_graze = _graze(cfg, world, ent, veg, idx[rows], px[rows], py[rows],
+                             eat_value[spec[rows]])
 
     # --- PREDATION: prey-hunters with gate + adjacent EXPOSED prey -> kill, gain energy ---
     killed = []
@@ -88,7 +78,14 @@ def apply(cfg, world, ent, idx, act, veg, species_grids, rng):
             n_prey = sum(int(ent.count_species(t)) for t in pf.prey)
             scarcity[psid] = (n_prey ** 2) / (n_prey ** 2 + pf.hunt_halfsat ** 2)
         has_aggression = "aggression" in gn.GENE_INDEX
-        if hunt.any():
+        mode = cfg.sim.predation_mode
+        if mode not in ("sequential", "batched"):
+            raise ValueError(f"unknown predation_mode {mode!r} (expected 'sequential' or "
+                             f"'batched')")
+        if hunt.any() and mode == "batched":
+            killed, n_pred = _hunt_batched(cfg, world, ent, idx, np.nonzero(hunt)[0], px, py,
+                                           spec, prey_food, scarcity, species_grids, rng)
+        elif hunt.any():
             # iterate rows in ascending GLOBAL index (as before) so the per-attempt rng.random()
             # stream is consumed in the exact same order for the single-predator default.
             for k in np.nonzero(hunt)[0]:
@@ -133,3 +130,139 @@ def apply(cfg, world, ent, idx, act, veg, species_grids, rng):
     if killed_arr.shape[0] > 0:
         ent.kill(killed_arr)
     return killed_arr, n_drink, n_graze, n_pred
+
+
+def _hunt_batched(cfg, world, ent, idx, rows, px, py, spec, prey_food, scarcity,
+                  species_grids, rng):
+    """Resolve every hunter's attack at once (``cfg.sim.predation_mode == "batched"``).
+
+    Same rules and the same RNG stream as the sequential loop -- nearest living, exposed prey
+    within ``eat_radius``, Type III kill probability, one roll per hunter with a target in
+    ascending row order -- but the candidate search is one batched grid query per prey species
+    and the rolls are drawn as one ``rng.random(n)``. The one difference: a prey that several
+    hunters bring down feeds the lowest-row hunter alone (the sequential loop lets each of
+    them feed on it). A tick with no contested prey matches the sequential loop exactly.
+    Returns ``(killed_prey_slots, n_predation)``.
+    """
+    eat_r = cfg.sim.eat_radius
+    n_lut = max(cfg.species) + 1
+    # position of each prey species in each hunter's diet: the sequential loop breaks a
+    # distance tie between prey species in that order
+    diet_pos = np.zeros((n_lut, n_lut), dtype=np.intp)
+    for psid, pf in prey_food.items():
+        for j, tsid in reversed(list(enumerate(pf.prey))):
+            diet_pos[psid, tsid] = j
+    pair_rows, pair_prey, pair_pos = [], [], []
+    for tsid in sorted({t for pf in prey_food.values() for t in pf.prey}):
+        g = species_grids.get(tsid)
+        if g is None:
+            continue
+        hunts_t = np.zeros(n_lut, dtype=bool)
+        for psid, pf in prey_food.items():
+            hunts_t[psid] = tsid in pf.prey
+        hunters = rows[hunts_t[spec[rows]]]
+        if hunters.shape[0] == 0:
+            continue
+        offsets, cand, _dx, _dy = g.query_radius_batch(
+            px[hunters], py[hunters], np.full(hunters.shape[0], eat_r))
+        pair_rows.append(np.repeat(hunters, np.diff(offsets)))
+        pair_prey.append(cand)
+        pair_pos.append(diet_pos[spec[pair_rows[-1]], tsid])
+    if not pair_rows:
+        return [], 0
+    hr = np.concatenate(pair_rows)
+    prey = np.concatenate(pair_prey)
+    pos = np.concatenate(pair_pos)
+    # only living prey, and not hidden in cover
+    keep = ent.alive[prey] & ~world.in_cover(ent.pos_x[prey], ent.pos_y[prey])
+    hr, prey, pos = hr[keep], prey[keep], pos[keep]
+    if hr.shape[0] == 0:
+        return [], 0
+
+    # nearest prey per hunter: stable sort by (row, d2, diet position), so ties keep
+    # candidate order
+    d2 = (ent.pos_x[prey] - px[hr]) ** 2 + (ent.pos_y[prey] - py[hr]) ** 2
+    order = np.lexsort((pos, d2, hr))
+    hr, prey = hr[order], prey[order]
+    first = np.ones(hr.shape[0], dtype=bool)
+    first[1:] = hr[1:] != hr[:-1]
+    hr, prey = hr[first], prey[first]
+
+    # one batched kill roll per hunter (most chases fail: prey gets a real chance to flee).
+    # The probability and the gain are rounded as the sequential loop rounds them: float32
+    # when the float32 aggression / size gene enters, float64 otherwise.
+    hunt_s = np.zeros(n_lut, dtype=np.float64)
+    scarce = np.zeros(n_lut, dtype=np.float64)
+    gain_lut = np.zeros(n_lut, dtype=np.float32)
+    for psid, pf in prey_food.items():
+        hunt_s[psid] = pf.hunt_success
+        scarce[psid] = scarcity[psid]
+        gain_lut[psid] = pf.predation_gain
+    slots = idx[hr]
+    ps = spec[hr]
+    if "aggression" in gn.GENE_INDEX:
+        aggression = gn.gene(ent.genome[slots], "aggression")
+        kill_prob = (aggression * hunt_s[ps].astype(np.float32)) * scarce[ps].astype(np.float32)
+    else:
+        kill_prob = hunt_s[ps] * scarce[ps]
+    success = rng.random(hr.shape[0]) <= kill_prob
+    hr, prey = hr[success], prey[success]
+
+    # conflicts: a prey caught by several hunters feeds only the lowest-row one
+    _, winner = np.unique(prey, return_index=True)
+    winner = np.sort(winner)
+    hr, prey = hr[winner], prey[winner]
+    slots = idx[hr]
+    prey_size = gn.gene(ent.genome[prey], "size")
+    gain = gain_lut[spec[hr]] * (0.4 + 0.5 * prey_size)
+    ent.energy[slots] = np.minimum(1.0, ent.energy[slots] + gain)
+    ent.hunger[slots] = np.maximum(0.0, ent.hunger[slots] - 0.6)
+    return prey.tolist(), int(hr.shape[0])
+
+
+def _graze(cfg, world, ent, veg, slots, px, py, eat_value) -> int:
+    """Vectorized grazing for the given grazers (ascending row order). Returns bites taken.
+
+    Grazers sharing a cell eat first-come in ascending row order: each bite takes
+    ``veg_graze_amount`` of what the previous one left, until the cell drops below
+    ``food_eat_threshold``. Grazers are grouped by cell and the bites applied rank by rank --
+    every cell's first grazer at once, then every cell's second, ... -- so each pass writes at
+    most one grazer per cell and the float32 result is byte-identical to a per-grazer loop.
+    The loop runs only a few passes: a bite removes most of a cell, so it soon falls below
+    the threshold and every later grazer there goes hungry.
+    """
+    cx = np.clip(px, 0, world.w - 1).astype(np.intp)
+    cy = np.clip(py, 0, world.h - 1).astype(np.intp)
+    flat = cy * world.w + cx
+    order = np.argsort(flat, kind="stable")           # by cell, ascending row within a cell
+    flat = flat[order]
+    first = np.ones(flat.shape[0], dtype=bool)
+    first[1:] = flat[1:] != flat[:-1]
+    group_start = np.nonzero(first)[0]
+    rank = np.arange(flat.shape[0]) - group_start[np.cumsum(first) - 1]
+
+    thr = cfg.sim.food_eat_threshold
+    amount = cfg.sim.veg_graze_amount
+    take = np.zeros(slots.shape[0], dtype=np.float32)
+    ate = np.zeros(slots.shape[0], dtype=bool)
+    for r in range(int(rank.max()) + 1):
+        k = order[rank == r]                          # at most one grazer per cell
+        available = veg[cy[k], cx[k]]
+        ok = available >= thr
+        if not ok.any():
+            break                                     # every shared cell is now grazed out
+        k, available = k[ok], available[ok]
+        kcy, kcx = cy[k], cx[k]
+        bite = available * amount
+        veg[kcy, kcx] = available - bite
+        world.nutrients[kcy, kcx] = np.maximum(0.0, world.nutrients[kcy, kcx] - bite * 0.15)
+        take[k] = bite
+        ate[k] = True
+
+    fed = slots[ate]
+    take = take[ate]
+    size = gn.gene(ent.genome[fed], "size")
+    gain = eat_value[ate] * take * (0.7 + 0.3 * size)
+    ent.energy[fed] = np.minimum(1.0, ent.energy[fed] + gain)
+    ent.hunger[fed] = np.maximum(0.0, ent.hunger[fed] - take * 1.5)
+    return int(fed.shape[0])
@@ -76,17 +76,39 @@ class StepContext:
 
 class System:
     """Base class for a tick system. Subclass and implement ``apply(ctx)``; insert the
-    instance into ``Simulation.systems`` (or a list passed to ``Simulation(systems=...)``)."""
+    instance into ``Simulation.systems`` (or a list passed to ``Simulation(systems=...)``).
+
+    A system that can run every world of a ``LockstepSimulation`` in one call sets
+    ``batchable = True`` and overrides ``apply_batch``; otherwise the batch calls each world's
+    own instance's ``apply`` in turn."""
+
+    batchable = False
 
     def apply(self, ctx: StepContext) -> None:
         raise NotImplementedError
 
+    def apply_batch(self, ctxs: list, batch) -> None:
+        """Run this tick step for every world of ``batch`` (``ctxs[b]`` is world ``b``'s
+        context). Must leave each world exactly as ``apply`` would have."""
+        for ctx in ctxs:
+            self.apply(ctx)
+
 
 class EnvironmentSystem(System):
+    batchable = True
+
     def apply(self, ctx):
         ctx.env.update(ctx.dt)
         ctx.temp_field = ctx.env.temperature_field(ctx.world.static_temp)
 
+    def apply_batch(self, ctxs, batch):
+        for ctx in ctxs:
+            ctx.env.update(ctx.dt)       # weather draws stay on each world's own RNG
+        offsets = np.array([ctx.env.temp_offset for ctx in ctxs], dtype=np.float32)
+        temp = np.clip(batch.static_temp + offsets.reshape(-1, 1, 1), 0.0, 1.0)
+        for ctx, field in zip(ctxs, temp):
+            ctx.temp_field = field
+
 
 class GridSystem(System):
     """Rebuild the per-species spatial hashes for this tick's positions."""
@@ -103,13 +125,29 @@ class PerceptionSystem(System):
         p._species_grids = ctx.species_grids
         p.veg = ctx.veg
         p.temp_field = ctx.temp_field
-        ctx.obs, ctx.idx = p.build()
+        ctx.obs, ctx.idx = p.build(self._channels(ctx))
+
+    @staticmethod
+    def _channels(ctx):
+        """Per-species roles the brain declares, plus ``threat`` (the sleep system reads it)."""
+        brain = ctx.sim.brain_system.brain
+        if not hasattr(brain, "channels"):
+            return None
+        out = {}
+        for sid in ctx.cfg.species:
+            roles = brain.channels(sid)
+            out[sid] = None if roles is None else tuple(roles) + ("threat",)
+        return out
 
 
 class BrainSystem(System):
-    """Batched decision: the (possibly composite/learned) brain maps observations -> actions."""
+    """Batched decision: the (possibly composite/learned) brain maps observations -> actions.
+    Then finishes the lazy entity channels the brain did not read, while the entity state is
+    still the one perception saw (``last_obs`` outlives the tick)."""
     def apply(self, ctx):
         ctx.act = ctx.sim.brain_system.decide(ctx.obs, ctx.idx)
+        for obs in ctx.obs.values():
+            obs.finish_entities()
 
 
 class SleepSystem(System):
@@ -144,20 +182,40 @@ class ReproductionSystem(System):
 
 
 class VegetationSystem(System):
+    batchable = True
+
     def apply(self, ctx):
         if not ctx.veg_growth_paused:    # paused: grazed cells stay depleted (live-viewer toggle)
             vegetation.grow(ctx.cfg, ctx.world, ctx.env, ctx.veg, ctx.dt)
 
+    def apply_batch(self, ctxs, batch):
+        if any(ctx.veg_growth_paused for ctx in ctxs):
+            super().apply_batch(ctxs, batch)
+            return
+        vegetation.grow_batch(ctxs, batch.veg, batch.nutrients, batch.plant_suitability,
+                              batch.moisture, batch.water_any)
+
 
 class StatsSystem(System):
     """Assemble the per-tick stats dict consumed by the logger / HUD."""
+    batchable = True
+
     def apply(self, ctx):
-        ent = ctx.ent
+        counts = {sid: ctx.ent.count_species(sid) for sid in ctx.cfg.species}
+        ctx.stats = self._assemble(ctx, counts)
+
+    def apply_batch(self, ctxs, batch):
+        counts = {sid: batch.entities.count_species(sid) for sid in ctxs[0].cfg.species}
+        for b, ctx in enumerate(ctxs):
+            ctx.stats = self._assemble(ctx, {sid: int(n[b]) for sid, n in counts.items()})
+
+    @staticmethod
+    def _assemble(ctx, counts: dict) -> dict:
         deaths_total = sum(ctx.causes.values()) + ctx.n_pred
         stats = {"tick": ctx.tick}
         # per-species live counts, keyed n_<name> (n_sheep/n_fox for the default config)
         for sid in sorted(ctx.cfg.species):
-            stats[f"n_{ctx.cfg.species[sid].name}"] = ent.count_species(sid)
+            stats[f"n_{ctx.cfg.species[sid].name}"] = counts[sid]
         stats.update({
             "veg_biomass": float(ctx.veg.sum()),
             "births": ctx.births,
@@ -171,7 +229,7 @@ class StatsSystem(System):
             "n_graze": ctx.n_graze,
             "n_asleep": ctx.n_asleep,
         })
-        ctx.stats = stats
+        return stats
 
 
 def default_pipeline(cfg) -> list:
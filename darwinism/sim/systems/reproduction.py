@@ -50,44 +50,14 @@ def apply(cfg, world, ent, idx, act, species_grids, rng):
         if grid is None:
             continue
 
-        elig_set = set(elig_slots.tolist())
-        used = set()
-        pairs = []
-        # deterministic: pair greedily by ascending slot index
-        for a in sorted(elig_slots.tolist()):
-            if a in used:
-                continue
-            ax, ay = float(ent.pos_x[a]), float(ent.pos_y[a])
-            cand, cpx, cpy = grid.query_radius(ax, ay, cfg.sim.repro_radius)
-            if cand.shape[0] == 0:
-                continue
-            # eligible, opposite sex, not self, not used
-            best = None
-            best_d2 = np.inf
-            for c, cx, cy in zip(cand.tolist(), cpx.tolist(), cpy.tolist()):
-                if c == a or c in used or c not in elig_set:
-                    continue
-                if ent.sex[c] == ent.sex[a]:
-                    continue
-                d2 = (cx - ax) ** 2 + (cy - ay) ** 2
-                if d2 < best_d2:
-                    best_d2 = d2
-                    best = c
-            if best is not None:
-                used.add(a)
-                used.add(best)
-                pairs.append((a, best))
-
-        if not pairs:
+        parents_a, parents_b = _pair_mates(cfg, ent, grid, elig_slots)
+        if parents_a.shape[0] == 0:
             continue
 
         # build offspring genomes via crossover+mutation
         room = spec.population_cap - pop
-        n_pairs = len(pairs)
+        n_pairs = parents_a.shape[0]
         # respect both pop cap and pool capacity
-        parents_a = np.array([p[0] for p in pairs], dtype=np.intp)
-        parents_b = np.array([p[1] for p in pairs], dtype=np.intp)
-
         litter = spec.litter_size
         ga_rows = []
         gb_rows = []
@@ -127,3 +97,57 @@ def apply(cfg, world, ent, idx, act, species_grids, rng):
             ent.mating_glow[pset] = cfg.sim.mating_glow_duration  # cosmetic: flash rose
 
     return total_births
+
+
+def _pair_mates(cfg, ent, grid, elig_slots):
+    """Greedy mate pairing by ascending slot index, as arrays. Returns ``(parents_a, parents_b)``.
+
+    The rule: visit eligible animals in ascending slot order; one not yet paired takes its
+    nearest unpaired, eligible, opposite-sex neighbour within ``repro_radius`` (ties keep
+    grid order). That is a greedy matching over the candidate edges ranked by (proposer slot,
+    distance, grid order), and it is computed here without a per-animal loop. One batched
+    grid query and a sort build the ranked edge list. Then each round accepts every edge
+    that outranks all other remaining edges at both of its endpoints, and drops the edges of
+    the animals just paired. Those edges are exactly the ones the sequential greedy would
+    accept, so the pairs are identical. Every round accepts at least the best remaining edge,
+    and in practice a few rounds clear even a dense herd. Pairs come back in ascending
+    proposer order.
+    """
+    xs = ent.pos_x[elig_slots]
+    ys = ent.pos_y[elig_slots]
+    offsets, cand, dx, dy = grid.query_radius_batch(
+        xs, ys, np.full(elig_slots.shape[0], cfg.sim.repro_radius))
+    # candidate edges (proposer -> partner) as local indices into elig_slots
+    a = np.repeat(np.arange(elig_slots.shape[0], dtype=np.intp), np.diff(offsets))
+    b = np.searchsorted(elig_slots, cand)
+    b_ok = b < elig_slots.shape[0]
+    b_ok[b_ok] = elig_slots[b[b_ok]] == cand[b_ok]           # partner is eligible too
+    valid = b_ok & (cand != elig_slots[a])
+    valid[valid] = ent.sex[cand[valid]] != ent.sex[elig_slots[a[valid]]]
+    a, b = a[valid], b[valid]
+    d2 = dx[valid] ** 2 + dy[valid] ** 2
+    # rank = position in (proposer, distance, grid order); lexsort is stable
+    order = np.lexsort((d2, a))
+    a, b = a[order], b[order]
+    rank = np.arange(a.shape[0], dtype=np.intp)
+
+    n = elig_slots.shape[0]
+    paired = np.zeros(n, dtype=bool)
+    acc_a, acc_b, acc_rank = [], [], []
+    while a.shape[0]:
+        best = np.full(n, np.iinfo(np.intp).max, dtype=np.intp)   # best edge rank per animal
+        np.minimum.at(best, a, rank)
+        np.minimum.at(best, b, rank)
+        take = (best[a] == rank) & (best[b] == rank)
+        acc_a.append(a[take])
+        acc_b.append(b[take])
+        acc_rank.append(rank[take])
+        paired[a[take]] = True
+        paired[b[take]] = True
+        keep = ~paired[a] & ~paired[b]
+        a, b, rank = a[keep], b[keep], rank[keep]
+    if not acc_a:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    order = np.argsort(np.concatenate(acc_rank))
+    return (elig_slots[np.concatenate(acc_a)[order]],
+            elig_slots[np.concatenate(acc_b)[order]])
@@ -18,7 +18,7 @@ from __future__ import annotations
 import numpy as np
 
 from darwinism.sim import genome as gn
-from darwinism.sim.brain import A_DRINK, A_DX, A_DY, A_EAT, A_REPRO, A_SPEED, nearest_in_channel
+from darwinism.sim.brain import A_DRINK, A_DX, A_DY, A_EAT, A_REPRO, A_SPEED, decode_nearest
 from darwinism.sim.perception import S_SENSORY
 
 # A threat within this fraction of sensory range keeps a sheep awake to flee (mirrors the
@@ -57,9 +57,9 @@ def apply(cfg, world, ent, idx, act, obs_by_species, env) -> int:
     threat_close = np.zeros(n, dtype=bool)
     for sid in sorted(obs_by_species):
         obs = obs_by_species[sid]
-        if obs.grids.shape[0] == 0 or obs.channels is None or "threat" not in obs.channels:
+        if len(obs) == 0 or obs.channels is None or "threat" not in obs.channels:
             continue
-        thr_p, _, _, thr_dc = nearest_in_channel(obs.grids[:, obs.channels["threat"]])
+        thr_p, _, _, thr_dc = decode_nearest(obs, "threat")
         thr_frac = thr_dc / np.maximum(obs.scalars[:, S_SENSORY], 1e-6)
         pos = np.searchsorted(idx, obs.idx)              # this species' rows in the global order
         threat_close[pos] = (thr_p > 0.5) & (thr_frac < _WAKE_THREAT)
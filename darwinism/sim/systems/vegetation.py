@@ -19,19 +19,46 @@ def initial_field(world, rng: np.random.Generator) -> np.ndarray:
 
 
 def _carrying_capacity(world, growth_mult: float) -> np.ndarray:
-    cap = world.plant_suitability * world.nutrients * (0.4 + 0.6 * world.moisture)
+    return _capacity(world.plant_suitability, world.nutrients, world.moisture, world.water_any,
+                     growth_mult)
+
+
+def _capacity(suitability, nutrients, moisture, water, growth_mult) -> np.ndarray:
+    cap = suitability * nutrients * (0.4 + 0.6 * moisture)
     cap = cap * growth_mult
-    cap[world.water_any] = 0.0
+    cap[water] = 0.0
     return np.clip(cap, 0.0, 1.0).astype(np.float32)
 
 
 def grow(cfg, world, env, veg: np.ndarray, dt: float) -> None:
     """Logistic growth toward carrying capacity; consumes & regenerates nutrients."""
-    growth_mult = env.growth_multiplier()
-    cap = _carrying_capacity(world, growth_mult)
+    _grow(veg, world.nutrients, world.plant_suitability, world.moisture, world.water_any,
+          env.growth_multiplier(), cfg.sim.veg_regrow_rate * dt, cfg.env.nutrient_regen_rate * dt)
+
+
+def grow_batch(ctxs, veg: np.ndarray, nutrients: np.ndarray, suitability: np.ndarray,
+               moisture: np.ndarray, water: np.ndarray) -> None:
+    """``grow`` for a stack of worlds in one pass: ``veg`` / ``nutrients`` are ``(B, H, W)``, the
+    static fields ``(B, H, W)`` or ``(1, H, W)``, and each world's season, weather, ``dt`` and
+    rates come from its own ``StepContext``. Every cell gets exactly the float32 arithmetic
+    ``grow`` would give it, so each world stays byte-identical to running alone."""
+    def per_world(values):
+        return np.array(values, dtype=np.float32).reshape(-1, 1, 1)
+
+    _grow(veg, nutrients, suitability, moisture, water,
+          per_world([c.env.growth_multiplier() for c in ctxs]),
+          per_world([c.cfg.sim.veg_regrow_rate * c.dt for c in ctxs]),
+          per_world([c.cfg.env.nutrient_regen_rate * c.dt for c in ctxs]))
+
+
+def _grow(veg, nutrients, suitability, moisture, water, growth_mult, rate, regen) -> None:
+    # the scalars are cast to float32 up front, which is what NumPy does with a Python float
+    # anyway -- so a (B, 1, 1) array of them gives each world the same arithmetic as a scalar
+    growth_mult, rate, regen = (np.asarray(v, dtype=np.float32) for v in (growth_mult, rate, regen))
+    water = np.broadcast_to(water, veg.shape)
+    cap = _capacity(suitability, nutrients, moisture, water, growth_mult)
 
     # logistic growth: dV = rate * V * (1 - V/cap); seed a tiny base so empty cells recover
-    rate = cfg.sim.veg_regrow_rate * dt
     safe_cap = np.maximum(cap, 1e-4)
     seed = 0.01 * cap                       # lets fully-grazed suitable cells restart
     effective = np.maximum(veg, seed)
@@ -39,10 +66,10 @@ def grow(cfg, world, env, veg: np.ndarray, dt: float) -> None:
     growth = np.where(cap > 1e-4, growth, 0.0)
     veg += growth
     np.clip(veg, 0.0, cap, out=veg)
-    veg[world.water_any] = 0.0
+    veg[water] = 0.0
 
     # nutrient dynamics: growth consumes a little; regen toward 1.0 on land
-    world.nutrients -= growth * 0.05
-    land = ~world.water_any
-    world.nutrients[land] += cfg.env.nutrient_regen_rate * dt
-    np.clip(world.nutrients, 0.0, 1.0, out=world.nutrients)
+    nutrients -= growth * 0.05
+    land = ~water
+    nutrients[land] += regen if regen.ndim == 0 else np.broadcast_to(regen, nutrients.shape)[land]
+    np.clip(nutrients, 0.0, 1.0, out=nutrients)
@@ -0,0 +1,156 @@
+"""Per-system state tracing: a hash of the simulation state after every ``System.apply``.
+
+A golden-master fingerprint (``tests/determinism_util``) says *whether* a run drifted, after
+the whole run. A trace says *where*: opt in with ``sim.enable_tracing()`` and every system of
+every tick appends a short digest of
+
+    entities   every Structure-of-Arrays column, the free-slot stack, the next birth id
+    veg        the vegetation field and the world's nutrient field
+    rng        the run Generator's bit-generator state
+    env        the environment clock / season / weather scalars
+    working    this tick's ``temp_field`` / ``idx`` / ``act`` (so a brain that emits different
+               actions is caught at the brain system, before movement spreads it around)
+
+Record a trace on trusted code, save it, then replay the refactored code against it: with
+``reference`` set, the run raises ``TraceDivergence`` at the first (tick, system) whose digest
+differs, so a broken refactor fails within a tick of the change instead of after the run.
+
+    sim = Simulation(cfg)
+    trace = sim.enable_tracing()
+    for _ in range(200):
+        sim.step()
+    trace.save("runs/trace.json")
+
+    sim = Simulation(cfg)
+    sim.enable_tracing(reference=StateTracer.load("runs/trace.json"))
+    for _ in range(200):
+        sim.step()                  # -> TraceDivergence: tick 37, MovementSystem ...
+
+Hashing only reads state (no RNG draws), so a traced run is identical to an untraced one.
+Like the profiler, it costs nothing when off; when on, each digest costs roughly one pass
+over the entity arrays.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from darwinism.sim.profiling import system_names
+
+FORMAT_VERSION = 1
+
+# Environment attributes that are wiring, not state
+_ENV_SKIP = ("cfg", "rng")
+
+
+class TraceDivergence(ValueError):
+    """The traced run left its reference trace at ``(tick, system)``."""
+
+    def __init__(self, tick: int, system: str, expected: str, got: str):
+        super().__init__(f"state diverged from the reference trace at tick {tick}, after "
+                         f"{system} (expected {expected}, got {got})")
+        self.tick = tick
+        self.system = system
+
+
+def _update(h, value) -> None:
+    if value is None:
+        h.update(b"\0")
+    else:
+        a = np.ascontiguousarray(value)
+        h.update(str(a.dtype).encode() + str(a.shape).encode())
+        h.update(a.tobytes())
+
+
+def state_digest(sim, ctx=None) -> str:
+    """16-hex-digit digest of ``sim``'s dynamic state (plus ``ctx``'s working set, if given)."""
+    h = hashlib.blake2b(digest_size=8)
+    ent = sim.entities
+    for name, value in sorted(vars(ent).items()):
+        if isinstance(value, np.ndarray):
+            h.update(name.encode())
+            _update(h, value)
+    _update(h, np.asarray(ent._free, dtype=np.int64))
+    h.update(str(ent._next_birth_id).encode())
+    _update(h, sim.veg)
+    _update(h, sim.world.nutrients)
+    h.update(repr(sim.rng.bit_generator.state).encode())
+    h.update(repr(sorted((k, v) for k, v in vars(sim.env).items()
+                         if k not in _ENV_SKIP)).encode())
+    if ctx is not None:
+        for value in (ctx.temp_field, ctx.idx, ctx.act):
+            _update(h, value)
+    return h.hexdigest()
+
+
+class StateTracer:
+    """Digest after every system of every tick, optionally checked against a reference."""
+
+    def __init__(self, reference: StateTracer | None = None):
+        self.reference = reference
+        self.ticks: dict[int, list[str]] = {}     # tick -> one digest per system
+        self.systems: list[str] = []              # names of the pipeline that was traced
+        self._names_key: tuple = ()
+
+    def run(self, systems, ctx, profile=None) -> None:
+        """Apply every system to ``ctx`` in order, digesting the state after each (and timing
+        the ``apply`` calls into ``profile`` when profiling is on too)."""
+        key = tuple(id(s) for s in systems)
+        if key != self._names_key:                # pipeline edited since the last tick
+            self.systems = system_names(systems)
+            self._names_key = key
+        expected = None
+        if self.reference is not None:
+            expected = self.reference.ticks.get(ctx.tick)
+        digests = self.ticks[ctx.tick] = []
+        for i, (name, system) in enumerate(zip(self.systems, systems)):
+            if profile is None:
+                system.apply(ctx)
+            else:
+                t0 = time.perf_counter()
+                system.apply(ctx)
+                profile.record(name, time.perf_counter() - t0)
+            digest = state_digest(ctx.sim, ctx)
+            digests.append(digest)
+            if expected is not None:
+                want = expected[i] if i < len(expected) else None
+                ref_name = self.reference.systems[i] if i < len(self.reference.systems) else None
+                if ref_name != name or want != digest:
+                    raise TraceDivergence(ctx.tick, name, f"{ref_name} {want}", digest)
+
+    def first_divergence(self, other: StateTracer) -> tuple[int, str] | None:
+        """The first ``(tick, system)`` where this trace and ``other`` differ, over the ticks
+        both recorded; ``None`` when they agree."""
+        for tick in sorted(self.ticks.keys() & other.ticks.keys()):
+            mine, theirs = self.ticks[tick], other.ticks[tick]
+            for i in range(max(len(mine), len(theirs))):
+                name = self.systems[i] if i < len(self.systems) else other.systems[i]
+                if (i >= len(mine) or i >= len(theirs) or mine[i] != theirs[i]
+                        or self.systems[i] != other.systems[i]):
+                    return tick, name
+        return None
+
+    # ------------------------------------------------------------------ persistence
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "format": FORMAT_VERSION,
+            "systems": self.systems,
+            "ticks": {str(t): d for t, d in sorted(self.ticks.items())},
+        }) + "\n")
+        return path
+
+    @classmethod
+    def load(cls, path) -> StateTracer:
+        data = json.loads(Path(path).read_text())
+        if data.get("format") != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported trace format {data.get('format')!r}")
+        trace = cls()
+        trace.systems = list(data["systems"])
+        trace.ticks = {int(t): list(d) for t, d in data["ticks"].items()}
+        return trace
@@ -0,0 +1,122 @@
+"""Incremental per-species trait statistics (count, running sum and sum of squares per gene).
+
+A genome is written once, at spawn, and never changes while the animal lives, so the
+population's trait moments only move when an animal is born or dies. ``TraitStats`` is
+updated by ``Entities.spawn`` / ``Entities.kill`` and answers means and variances in O(1),
+instead of gathering ``genome[mask]`` and reducing it on every log row:
+
+    ent.traits.mean(SHEEP)          # (N_GENES,) float64, in GENE_NAMES order
+    ent.traits.var(SHEEP)
+    ent.traits.histogram(SHEEP, "max_speed")   # after track_histograms(bins)
+
+Sums are accumulated in float64 from the float32 genes. A float32 gene has a 24-bit
+significand, so while a sum stays within float64's 53 bits every add and remove of ``sum`` is
+exact and it never drifts. Squares need 48 bits each, so ``sumsq`` does round on most updates
+and slowly drifts over a long run with many births and deaths (relative error around 1e-16
+per update; variances of nearly constant genes suffer most, and are clamped at 0).
+``rebuild`` recomputes everything from the entity arrays: it runs after a checkpoint restore,
+and a caller that needs exact variances late in a long run can call it too. Histograms are
+optional: fixed bins spanning each species' gene range, updated the same way (integer
+counts, so exact).
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from darwinism.sim import genome as gn
+
+
+class TraitStats:
+    def __init__(self, cfg):
+        self.cfg = cfg
+        self.n_genes = gn.N_GENES
+        size = max(cfg.species) + 1 if cfg.species else 1
+        self.count = np.zeros(size, dtype=np.int64)
+        self.sum = np.zeros((size, self.n_genes), dtype=np.float64)
+        self.sumsq = np.zeros((size, self.n_genes), dtype=np.float64)
+        self.bins = 0
+        self.hist = None                 # (species, gene, bins) int64 when tracked
+        self._lo = self._scale = None
+
+    # ------------------------------------------------------------------ updates
+    def add(self, species_id: int, genomes: np.ndarray) -> None:
+        """Account for newborns of one species (``genomes`` is ``(k, N_GENES)``)."""
+        if genomes.shape[0] == 0:
+            return
+        g = genomes.astype(np.float64)
+        self.count[species_id] += g.shape[0]
+        self.sum[species_id] += g.sum(axis=0)
+        self.sumsq[species_id] += (g * g).sum(axis=0)
+        if self.hist is not None:
+            self._bin(np.full(g.shape[0], species_id), g, 1)
+
+    def remove(self, species: np.ndarray, genomes: np.ndarray) -> None:
+        """Account for deaths (``species`` is ``(k,)``, ``genomes`` ``(k, N_GENES)``)."""
+        if genomes.shape[0] == 0:
+            return
+        species = species.astype(np.intp)
+        g = genomes.astype(np.float64)
+        np.subtract.at(self.count, species, 1)
+        np.subtract.at(self.sum, species, g)
+        np.subtract.at(self.sumsq, species, g * g)
+        if self.hist is not None:
+            self._bin(species, g, -1)
+
+    def rebuild(self, ent) -> None:
+        """Recompute every statistic from the live entities."""
+        self.count[:] = 0
+        self.sum[:] = 0.0
+        self.sumsq[:] = 0.0
+        if self.hist is not None:
+            self.hist[:] = 0
+        alive = ent.alive_indices()
+        for sid in range(self.count.shape[0]):
+            rows = alive[ent.species[alive] == sid]
+            self.add(sid, ent.genome[rows])
+
+    def track_histograms(self, bins: int, ent) -> None:
+        """Start maintaining ``bins``-bin histograms per species and gene (built from the
+        current population, then kept up to date on spawn / kill)."""
+        size = self.count.shape[0]
+        self.bins = int(bins)
+        self._lo = np.zeros((size, self.n_genes), dtype=np.float64)
+        self._scale = np.zeros((size, self.n_genes), dtype=np.float64)
+        for sid, spec in self.cfg.species.items():
+            lo, hi = gn._bounds(spec)
+            self._lo[sid] = lo
+            width = hi.astype(np.float64) - lo
+            self._scale[sid] = np.where(width > 0, self.bins / np.where(width > 0, width, 1), 0)
+        self.hist = np.zeros((size, self.n_genes, self.bins), dtype=np.int64)
+        self.rebuild(ent)
+
+    def _bin(self, species, g, sign: int) -> None:
+        b = ((g - self._lo[species]) * self._scale[species]).astype(np.intp)
+        np.clip(b, 0, self.bins - 1, out=b)
+        genes = np.broadcast_to(np.arange(self.n_genes), b.shape)
+        np.add.at(self.hist, (np.broadcast_to(species[:, None], b.shape), genes, b), sign)
+
+    # ------------------------------------------------------------------ queries
+    def mean(self, species_id: int) -> np.ndarray:
+        """Per-gene mean over the living members (NaN when there are none)."""
+        n = self.count[species_id]
+        if n <= 0:
+            return np.full(self.n_genes, np.nan)
+        return self.sum[species_id] / n
+
+    def var(self, species_id: int) -> np.ndarray:
+        """Per-gene population variance over the living members (NaN when there are none)."""
+        n = self.count[species_id]
+        if n <= 0:
+            return np.full(self.n_genes, np.nan)
+        m = self.sum[species_id] / n
+        return np.maximum(self.sumsq[species_id] / n - m * m, 0.0)
+
+    def histogram(self, species_id: int, gene: str) -> tuple[np.ndarray, np.ndarray]:
+        """``(counts, edges)`` for one gene of one species; needs ``track_histograms``."""
+        if self.hist is None:
+            raise ValueError("histograms are not tracked; call track_histograms(bins, ent) first")
+        i = gn.GENE_INDEX[gene]
+        lo = self._lo[species_id, i]
+        scale = self._scale[species_id, i]
+        hi = lo + (self.bins / scale if scale > 0 else 0.0)
+        return self.hist[species_id, i].copy(), np.linspace(lo, hi, self.bins + 1)
@@ -157,39 +157,13 @@ class World:
 
     # ------------------------------------------------------------------ nearest-source fields
     def _nearest_source_fields(self, source: np.ndarray):
-        """Multi-source BFS over a boolean ``source`` mask.
+        """Nearest-source fields over a boolean ``source`` mask (``hydrology.nearest_source``).
 
         Returns ``(dist, nearest_x, nearest_y)``: for every cell, the distance (in cell
         units; inf where no source is reachable) to the closest source cell and that
         cell's center coordinates. Used for both freshwater (drinking) and cover (sleep).
         """
-        from collections import deque
-        h, w = self.h, self.w
-        INF = np.float32(np.inf)
-        dist = np.full((h, w), INF, dtype=np.float32)
-        nx_arr = np.full((h, w), -1, dtype=np.int32)
-        ny_arr = np.full((h, w), -1, dtype=np.int32)
-        dq = deque()
-        ys, xs = np.nonzero(source)
-        for y, x in zip(ys.tolist(), xs.tolist()):
-            dist[y, x] = 0.0
-            nx_arr[y, x] = x
-            ny_arr[y, x] = y
-            dq.append((y, x))
-        nb8 = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-        while dq:
-            y, x = dq.popleft()
-            base = dist[y, x]
-            for dy, dx in nb8:
-                ny, nx = y + dy, x + dx
-                if 0 <= ny < h and 0 <= nx < w:
-                    step = 1.41421356 if (dy and dx) else 1.0
-                    nd = base + step
-                    if nd < dist[ny, nx]:
-                        dist[ny, nx] = nd
-                        nx_arr[ny, nx] = nx_arr[y, x]
-                        ny_arr[ny, nx] = ny_arr[y, x]
-                        dq.append((ny, nx))
+        dist, nx_arr, ny_arr = hydrology.nearest_source(source)
         # store nearest as float cell-center coords for direction math
         return dist, (nx_arr.astype(np.float32) + 0.5), (ny_arr.astype(np.float32) + 0.5)
 
@@ -0,0 +1,127 @@
+"""Content-addressed on-disk cache of generated worlds.
+
+A ``World`` depends only on its ``WorldConfig`` (noise, rivers, lakes, biomes and the
+nearest-source fields are all seeded from ``world.seed``), yet generating one takes seconds
+while a sweep builds hundreds of simulations on the same map. This module stores every world
+array once, under a directory named by a hash of the config, and serves later requests by
+memory-mapping those files instead of regenerating:
+
+    <cache_dir>/world-<key>/meta.json       config, format version, field list
+    <cache_dir>/world-<key>/<field>.npy     one array per World attribute
+
+Arrays are mapped copy-on-write (``mmap_mode="c"``): a run may write to them (the nutrient
+field is mutated every tick) and only its private pages change -- the files, and every other
+process mapping them, are untouched. The key also covers the numpy / opensimplex versions, a
+format version and a digest of the generation modules' source (``world.py``, ``hydrology.py``),
+so an upgrade or an edit to generation code retires old entries instead of serving them. A
+change that reaches generation from anywhere else (e.g. a helper moved to a new module) must
+bump ``CACHE_VERSION`` by hand.
+
+    world = load_or_build(cfg.world, "cache/worlds")     # generate once, then mmap
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import asdict
+from importlib import metadata
+from pathlib import Path
+
+import numpy as np
+
+from darwinism.config import WorldConfig
+from darwinism.sim import hydrology, world
+from darwinism.sim.world import World
+
+# bump when world generation changes output for the same config through code the source
+# digest below doesn't see, to retire old entries
+CACHE_VERSION = 1
+
+# the modules whose source decides what a WorldConfig generates
+_GENERATION_MODULES = (world, hydrology)
+
+
+def _generator_versions() -> dict:
+    try:
+        simplex = metadata.version("opensimplex")
+    except metadata.PackageNotFoundError:
+        simplex = None
+    return {"numpy": np.__version__, "opensimplex": simplex, "source": _generation_source()}
+
+
+def _generation_source() -> str:
+    """Digest of the world-generation modules' source, so editing them changes the key."""
+    digest = hashlib.sha256()
+    for module in _GENERATION_MODULES:
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def cache_key(cfg: WorldConfig) -> str:
+    """Stable hex digest of everything a generated world depends on."""
+    payload = {"version": CACHE_VERSION, "world": asdict(cfg), **_generator_versions()}
+    blob = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha256(blob).hexdigest()[:24]
+
+
+def entry_path(cfg: WorldConfig, cache_dir) -> Path:
+    return Path(cache_dir) / f"world-{cache_key(cfg)}"
+
+
+def save(world: World, cache_dir) -> Path:
+    """Write ``world`` into the cache (atomically: a reader never sees a half-written entry).
+    Returns the entry directory; an entry that already exists is left as it is."""
+    final = entry_path(world.cfg, cache_dir)
+    if final.exists():
+        return final
+    final.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=".tmp-world-", dir=final.parent))
+    try:
+        fields = sorted(k for k, v in vars(world).items() if isinstance(v, np.ndarray))
+        for name in fields:
+            np.save(tmp / f"{name}.npy", getattr(world, name))
+        meta = {"version": CACHE_VERSION, "world": asdict(world.cfg), "fields": fields,
+                **_generator_versions()}
+        (tmp / "meta.json").write_text(json.dumps(meta, indent=2) + "\n")
+        os.replace(tmp, final)
+    except OSError:
+        if not final.exists():                   # a concurrent writer that lost the race is fine
+            raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return final
+
+
+def load(cfg: WorldConfig, cache_dir) -> World | None:
+    """Memory-map the cached world for ``cfg``, or ``None`` when there is no usable entry."""
+    entry = entry_path(cfg, cache_dir)
+    try:
+        meta = json.loads((entry / "meta.json").read_text())
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != CACHE_VERSION or meta.get("world") != asdict(cfg):
+        return None
+    world = World.__new__(World)                 # skip generation; attach the stored arrays
+    world.cfg = cfg
+    world.w = cfg.width
+    world.h = cfg.height
+    try:
+        for name in meta["fields"]:
+            # np.asarray drops the memmap subclass but keeps the copy-on-write mapping
+            setattr(world, name, np.asarray(np.load(entry / f"{name}.npy", mmap_mode="c")))
+    except (OSError, ValueError, KeyError):
+        return None
+    return world
+
+
+def load_or_build(cfg: WorldConfig, cache_dir) -> World:
+    """The cached world for ``cfg`` if there is one, else generate it, store it and return it
+    (freshly generated, so this first run doesn't pay for a reload)."""
+    world = load(cfg, cache_dir)
+    if world is None:
+        world = World(cfg)
+        save(world, cache_dir)
+    return world
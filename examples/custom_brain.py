@@ -20,10 +20,10 @@ class GreedyForagerBrain(dw.Brain):
     def decide(self, obs_by_species, idx):
         act = np.zeros((len(idx), dw.ACT_DIM), dtype=np.float32)
         for obs in obs_by_species.values():
-            if obs.grids.shape[0] == 0:
+            if len(obs) == 0:
                 continue
             # reduce the food channel to a target direction (nearest/best cell)
-            present, dx, dy, _dist = dw.best_in_channel(obs.grids[:, obs.channels["food"]])
+            present, dx, dy, _dist = dw.best_in_channel(obs.channel("food"))
             mag = np.sqrt(dx * dx + dy * dy)
             safe = mag > 1e-6
             hx = np.where(safe, dx / np.where(safe, mag, 1.0), 1.0)   # else drift east
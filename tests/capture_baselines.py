@@ -7,10 +7,18 @@ Run this ONCE on trusted (pre-refactor) code:
 It writes ``tests/baselines/golden.json``, which ``test_determinism.py`` compares against
 after every refactor step. Re-run it ONLY when you have deliberately, knowingly changed the
 default-config dynamics (then the diff in the committed JSON is the audit trail).
+
+An opt-in mode that changes the RNG stream can carry its own baseline file (add it to
+``BASELINES``). Name the files to (re)capture just those, leaving the default golden master
+untouched:
+
+    venv/Scripts/python.exe tests/capture_baselines.py <file>.json
+
 """
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 
 from determinism_util import run_fingerprint
@@ -20,33 +28,46 @@ SEEDS = [7, 99, 12345]
 TICKS = 200
 LOG_EVERY = 1
 
-OUT = Path(__file__).resolve().parent / "baselines" / "golden.json"
+BASE_DIR = Path(__file__).resolve().parent / "baselines"
 
+# baseline file -> (SimConfig overrides, note)
+BASELINES = {
+    "golden.json": (
+        {},
+        "default sheep+fox config; frozen on pre-refactor code as the "
+        "byte-identical baseline for the framework refactor"),
+}
 
-def main() -> None:
+
+def capture(name: str) -> None:
+    overrides, note = BASELINES[name]
     runs = {}
     for seed in SEEDS:
-        print(f"capturing seed={seed} ...", flush=True)
+        print(f"capturing {name} seed={seed} ...", flush=True)
         runs[str(seed)] = run_fingerprint(seed, world_seed=WORLD_SEED,
-                                          ticks=TICKS, log_every=LOG_EVERY)
-    payload = {
-        "meta": {
-            "world_seed": WORLD_SEED,
-            "seeds": SEEDS,
-            "ticks": TICKS,
-            "log_every": LOG_EVERY,
-            "note": "default sheep+fox config; frozen on pre-refactor code as the "
-                    "byte-identical baseline for the framework refactor",
-        },
-        "runs": runs,
+                                          ticks=TICKS, log_every=LOG_EVERY, **overrides)
+    meta = {
+        "world_seed": WORLD_SEED,
+        "seeds": SEEDS,
+        "ticks": TICKS,
+        "log_every": LOG_EVERY,
+        "note": note,
     }
-    OUT.parent.mkdir(parents=True, exist_ok=True)
-    OUT.write_text(json.dumps(payload, indent=2) + "\n")
-    print(f"\nwrote {OUT}")
+    if overrides:
+        meta["sim_overrides"] = overrides
+    out = BASE_DIR / name
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps({"meta": meta, "runs": runs}, indent=2) + "\n")
+    print(f"\nwrote {out}")
     for seed, fp in runs.items():
         print(f"  seed {seed}: {fp['final']}  csv={fp['csv_sha256'][:12]}  "
               f"state={fp['state_sha256'][:12]}")
 
 
+def main() -> None:
+    for name in sys.argv[1:] or BASELINES:
+        capture(name)
+
+
 if __name__ == "__main__":
     main()
@@ -9,6 +9,8 @@ a compact, comparable fingerprint:
     and hashes both the CSV output and the raw entity Structure-of-Arrays state.
   * ``state_hash`` hashes every dynamically-meaningful SoA array at full float32 precision
     -- this catches divergences that the coarser ``log_every`` CSV sampling would miss.
+  * ``run_trace`` records a per-tick, per-system state trace (``sim.trace``); replayed
+    against a stored one it stops at the first diverging (tick, system).
 
 Baselines are captured ONCE on the pre-refactor code (see ``capture_baselines.py``) and
 frozen in ``baselines/golden.json``; ``test_determinism.py`` regenerates and compares.
@@ -31,9 +33,9 @@ _ROOT = Path(__file__).resolve().parents[1]
 if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
-from darwinism.config import make_config              # noqa: E402
-from darwinism.sim.simulation import Simulation       # noqa: E402
-from darwinism.analysis.logger import Logger          # noqa: E402
+from darwinism.analysis.logger import Logger  # noqa: E402
+from darwinism.config import make_config  # noqa: E402
+from darwinism.sim.simulation import Simulation  # noqa: E402
 
 # SoA arrays that carry real (RNG-load-bearing) dynamics. ``mating_glow`` /
 # ``action_overridden`` are cosmetic/diagnostic per the entity store's own docs, but they
@@ -56,15 +58,18 @@ def state_hash(sim) -> str:
 
 
 def run_fingerprint(seed: int, world_seed: int = 12345, ticks: int = 200,
-                    log_every: int = 1) -> dict:
+                    log_every: int = 1, **sim_overrides) -> dict:
     """Run the default-config sim and return a compact, comparable fingerprint.
 
     Mirrors ``run_experiment``'s core loop (default RuleBrain, no early-extinction stop,
     no prints). Returns CSV + entity-state hashes plus a few human-readable final values
-    for debuggability when a comparison fails.
+    for debuggability when a comparison fails. ``sim_overrides`` set ``SimConfig`` fields
+    (e.g. ``predation_mode="batched"``) to fingerprint an opt-in mode.
     """
     cfg = make_config(world_seed=world_seed, seed=seed)
     cfg.sim.log_every = log_every
+    for name, value in sim_overrides.items():
+        setattr(cfg.sim, name, value)
     sim = Simulation(cfg)   # default RuleBrain for every species
 
     fd, path = tempfile.mkstemp(suffix=".csv")
@@ -90,3 +95,20 @@ def run_fingerprint(seed: int, world_seed: int = 12345, ticks: int = 200,
             "veg_biomass": round(float(sim.stats["veg_biomass"]), 3),
         },
     }
+
+
+def run_trace(seed: int, world_seed: int = 12345, ticks: int = 200, reference=None,
+              **sim_overrides):
+    """Run the default-config sim with per-system state tracing and return the trace.
+
+    With ``reference`` (a ``StateTracer``, e.g. one recorded on the code before a change) the
+    run stops with ``TraceDivergence`` at the first (tick, system) that differs from it.
+    """
+    cfg = make_config(world_seed=world_seed, seed=seed)
+    for name, value in sim_overrides.items():
+        setattr(cfg.sim, name, value)
+    sim = Simulation(cfg)
+    trace = sim.enable_tracing(reference=reference)
+    for _ in range(ticks):
+        sim.step()
+    return trace
@@ -0,0 +1,41 @@
+"""Benchmark-suite tests: scenario configs scale the way they claim, and one timed run yields a
+complete, JSON-ready record. Uses a shrunken world so world generation stays fast."""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import darwinism as dw  # noqa: E402
+from darwinism.cli import bench  # noqa: E402
+
+
+def test_scenario_configs_scale_as_described():
+    base = bench.scenario_config("default")
+    herd = bench.scenario_config("dense-herd")
+    assert herd.species[dw.SHEEP].init_count == 4 * base.species[dw.SHEEP].init_count
+    foxes = bench.scenario_config("many-foxes")
+    assert foxes.species[dw.FOX].init_count == 10 * base.species[dw.FOX].init_count
+    large = bench.scenario_config("large-world")
+    assert (large.world.width, large.world.height) == (2 * base.world.width, 2 * base.world.height)
+
+    swept = bench.scenario_config("default", pop_scale=2.0, world_scale=0.5)
+    assert swept.species[dw.SHEEP].init_count == 2 * base.species[dw.SHEEP].init_count
+    assert swept.world.width == base.world.width // 2
+    with pytest.raises(ValueError):
+        bench.scenario_config("no-such-scenario")
+
+
+def test_run_once_reports_throughput_and_every_system():
+    cfg = bench.scenario_config("default", world_scale=0.35)
+    run = bench.run_once(cfg, ticks=5, warmup=2)
+    assert run["ticks"] == 5 and run["ticks_per_s"] > 0
+    assert run["world"] == [cfg.world.width, cfg.world.height]
+    assert all(row["calls"] == 5 for row in run["systems"].values())
+    json.dumps(run)                                     # machine-readable as-is
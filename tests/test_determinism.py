@@ -16,10 +16,12 @@ import json
 from pathlib import Path
 
 import pytest
+from determinism_util import run_fingerprint, run_trace
 
-from determinism_util import run_fingerprint
+from darwinism.sim.trace import StateTracer
 
-_GOLDEN = json.loads((Path(__file__).resolve().parent / "baselines" / "golden.json").read_text())
+_BASE_DIR = Path(__file__).resolve().parent / "baselines"
+_GOLDEN = json.loads((_BASE_DIR / "golden.json").read_text())
 _META = _GOLDEN["meta"]
 _SEEDS = _META["seeds"]
 
@@ -36,6 +38,27 @@ def test_matches_golden(seed):
         f"entity-state drift on seed {seed} (CSV may match but full state diverged)")
 
 
+@pytest.mark.parametrize("seed", _SEEDS)
+def test_matches_trace(seed, tmp_path):
+    """Per-system replay of the golden seeds: a recorded trace, saved and reloaded, must replay
+    without a ``TraceDivergence`` (which would name the first tick and system that differ)."""
+    trace = run_trace(seed, world_seed=_META["world_seed"], ticks=60)
+    reference = StateTracer.load(trace.save(tmp_path / f"golden_{seed}.json"))
+    assert sorted(reference.ticks) == list(range(1, 61))
+    run_trace(seed, world_seed=_META["world_seed"], ticks=60, reference=reference)
+
+
+@pytest.mark.parametrize("seed", _SEEDS)
+def test_batched_predation_matches_sequential(seed):
+    """The opt-in batched predation engine draws the same kill rolls in the same order, and
+    the golden seeds never have two foxes bring down one sheep in a tick, so it must
+    reproduce the sequential run exactly. (Contested prey are pinned by the predation
+    oracles in ``test_oracles.py``.)"""
+    kw = dict(world_seed=_META["world_seed"], ticks=_META["ticks"], log_every=_META["log_every"])
+    assert (run_fingerprint(seed, predation_mode="batched", **kw)
+            == run_fingerprint(seed, **kw))
+
+
 def test_reproducible():
     """Same config run twice in-process is identical (pure determinism, no baseline)."""
     a = run_fingerprint(7, world_seed=_META["world_seed"], ticks=40, log_every=1)
@@ -0,0 +1,60 @@
+"""SpatialGrid batch-query tests: ``query_radius_batch`` must return exactly what a loop of
+``query_radius`` calls returns (same neighbours, same order), since perception and the
+systems rely on that order for byte-identical runs."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from darwinism.sim.grid import SpatialGrid  # noqa: E402
+
+
+def _random_grid(rng, n_ent, w=208.0, h=117.0, cell=28.0):
+    px = (rng.random(n_ent) * w).astype(np.float32)
+    py = (rng.random(n_ent) * h).astype(np.float32)
+    px[::3] = np.round(px[::3])                    # exact-distance ties on the radius
+    py[::3] = np.round(py[::3])
+    idx = np.sort(rng.choice(n_ent, n_ent // 2, replace=False))
+    g = SpatialGrid(w, h, cell)
+    g.rebuild(idx, px, py)
+    return g
+
+
+def test_batch_matches_scalar_queries():
+    rng = np.random.default_rng(0)
+    g = _random_grid(rng, 3000)
+    q = 400
+    xs = (rng.random(q) * 208.0).astype(np.float32)
+    ys = (rng.random(q) * 117.0).astype(np.float32)
+    xs[::2] = np.round(xs[::2])
+    rs = rng.random(q) * 28.0                     # float64 radii, as a Python float would be
+    rs[::4] = np.round(rs[::4])
+    rs[1::4] = 1.6                                # not representable in float32
+
+    offsets, slots, dx, dy = g.query_radius_batch(xs, ys, rs)
+    assert offsets.shape == (q + 1,) and offsets[-1] == slots.shape[0]
+    for k in range(q):
+        cand, cpx, cpy = g.query_radius(float(xs[k]), float(ys[k]), float(rs[k]))
+        s, e = offsets[k], offsets[k + 1]
+        np.testing.assert_array_equal(slots[s:e], cand)
+        np.testing.assert_array_equal(dx[s:e], cpx.astype(np.float64) - float(xs[k]))
+        np.testing.assert_array_equal(dy[s:e], cpy.astype(np.float64) - float(ys[k]))
+
+
+def test_batch_empty_grid_and_no_queries():
+    g = SpatialGrid(50.0, 50.0, 10.0)
+    g.rebuild(np.empty(0, dtype=np.intp), np.zeros(4, np.float32), np.zeros(4, np.float32))
+    offsets, slots, dx, dy = g.query_radius_batch([1.0, 2.0], [1.0, 2.0], [5.0, 5.0])
+    np.testing.assert_array_equal(offsets, [0, 0, 0])
+    assert slots.shape == dx.shape == dy.shape == (0,)
+
+    g = _random_grid(np.random.default_rng(1), 200, 50.0, 50.0, 10.0)
+    offsets, slots, _, _ = g.query_radius_batch(np.empty(0), np.empty(0), np.empty(0))
+    np.testing.assert_array_equal(offsets, [0])
+    assert slots.shape == (0,)
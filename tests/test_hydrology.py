@@ -0,0 +1,153 @@
+"""Hydrology tests: the vectorized passes must reproduce the queue-based BFS code they replaced
+bit for bit -- ``nearest_source`` distances AND which source wins a tie, the ocean flood fill,
+and the capped lake flood fill + spill search (whose result depends on queue order) -- since
+the whole world, and so the golden baseline, is built on them. The old code is kept here as
+the oracle."""
+from __future__ import annotations
+
+import sys
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from darwinism.sim import hydrology  # noqa: E402
+from darwinism.sim.hydrology import nearest_source  # noqa: E402
+
+_NB8 = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def _reference_bfs(mask, max_dist=np.inf):
+    """The original queue-based transform (World._nearest_source_fields + the
+    hydrology._distance_to cap), kept here as the oracle."""
+    h, w = mask.shape
+    dist = np.full((h, w), np.inf, dtype=np.float32)
+    nx_arr = np.full((h, w), -1, dtype=np.int32)
+    ny_arr = np.full((h, w), -1, dtype=np.int32)
+    dq = deque()
+    ys, xs = np.nonzero(mask)
+    for y, x in zip(ys.tolist(), xs.tolist()):
+        dist[y, x] = 0.0
+        nx_arr[y, x] = x
+        ny_arr[y, x] = y
+        dq.append((y, x))
+    while dq:
+        y, x = dq.popleft()
+        base = dist[y, x]
+        if base >= max_dist:
+            continue
+        for dy, dx in _NB8:
+            ny, nx = y + dy, x + dx
+            if 0 <= ny < h and 0 <= nx < w:
+                nd = base + (1.41421356 if (dy and dx) else 1.0)
+                if nd < dist[ny, nx]:
+                    dist[ny, nx] = nd
+                    nx_arr[ny, nx] = nx_arr[y, x]
+                    ny_arr[ny, nx] = ny_arr[y, x]
+                    dq.append((ny, nx))
+    return dist, nx_arr, ny_arr
+
+
+@pytest.mark.parametrize("density", [0.0005, 0.01, 0.1, 0.6])
+@pytest.mark.parametrize("max_dist", [np.inf, 12.0])
+def test_nearest_source_matches_reference_bfs(density, max_dist):
+    rng = np.random.default_rng(int(density * 1e4))
+    mask = rng.random((97, 151)) < density
+    mask[40, 10:60] = True                         # a river-like line: many equal-distance ties
+    want = _reference_bfs(mask, max_dist)
+    got = nearest_source(mask, max_dist)
+    np.testing.assert_array_equal(got[0].view(np.uint32), want[0].view(np.uint32))
+    np.testing.assert_array_equal(got[1], want[1])
+    np.testing.assert_array_equal(got[2], want[2])
+
+
+def test_nearest_source_empty_and_full_masks():
+    dist, nx, ny = nearest_source(np.zeros((5, 7), dtype=bool))
+    assert np.isinf(dist).all() and (nx == -1).all() and (ny == -1).all()
+    dist, nx, ny = nearest_source(np.ones((5, 7), dtype=bool))
+    assert (dist == 0).all()
+    np.testing.assert_array_equal(nx, np.broadcast_to(np.arange(7), (5, 7)))
+
+
+def _reference_ocean(elevation, sea_level):
+    h, w = elevation.shape
+    below = elevation < sea_level
+    ocean = np.zeros((h, w), dtype=bool)
+    dq = deque()
+    for y in range(h):
+        for x in range(w):
+            if (y in (0, h - 1) or x in (0, w - 1)) and below[y, x]:
+                ocean[y, x] = True
+                dq.append((y, x))
+    while dq:
+        y, x = dq.popleft()
+        for dy, dx in _NB8:
+            ny, nx = y + dy, x + dx
+            if 0 <= ny < h and 0 <= nx < w and below[ny, nx] and not ocean[ny, nx]:
+                ocean[ny, nx] = True
+                dq.append((ny, nx))
+    return ocean
+
+
+def _reference_basin(elevation, sy, sx, spill, ocean):
+    h, w = elevation.shape
+    basin = np.zeros((h, w), dtype=bool)
+    if ocean[sy, sx]:
+        return basin
+    dq = deque([(sy, sx)])
+    basin[sy, sx] = True
+    count = 0
+    while dq and count < 400:
+        y, x = dq.popleft()
+        count += 1
+        for dy, dx in _NB8:
+            ny, nx = y + dy, x + dx
+            if (0 <= ny < h and 0 <= nx < w and not basin[ny, nx]
+                    and not ocean[ny, nx] and elevation[ny, nx] <= spill):
+                basin[ny, nx] = True
+                dq.append((ny, nx))
+    return basin
+
+
+def _reference_spill(elevation, basin):
+    h, w = elevation.shape
+    best, best_e = None, np.inf
+    for y, x in zip(*np.nonzero(basin)):
+        for dy, dx in _NB8:
+            ny, nx = y + dy, x + dx
+            if 0 <= ny < h and 0 <= nx < w and not basin[ny, nx] and elevation[ny, nx] < best_e:
+                best_e, best = elevation[ny, nx], (ny, nx)
+    return best
+
+
+def _smooth_elevation(rng, h, w):
+    """Blurred noise, quantized so equal heights (spill ties) actually occur."""
+    e = rng.random((h, w))
+    for _ in range(4):
+        e = (e + np.roll(e, 1, 0) + np.roll(e, -1, 0) + np.roll(e, 1, 1) + np.roll(e, -1, 1)) / 5
+    e = (e - e.min()) / np.ptp(e)
+    return (np.round(e * 200) / 200).astype(np.float32)
+
+
+def test_ocean_beach_basin_and_spill_match_reference():
+    rng = np.random.default_rng(11)
+    for _ in range(6):
+        elev = _smooth_elevation(rng, int(rng.integers(20, 70)), int(rng.integers(20, 90)))
+        h, w = elev.shape
+        ocean = hydrology._ocean_floodfill(elev, 0.35)
+        np.testing.assert_array_equal(ocean, _reference_ocean(elev, 0.35))
+        for _ in range(15):
+            sy, sx = int(rng.integers(0, h)), int(rng.integers(0, w))
+            spill = elev[sy, sx] + np.float32(rng.choice([0.015, 0.1, 0.4]))  # 0.4: hits the cap
+            want = _reference_basin(elev, sy, sx, spill, ocean)
+            got = np.zeros((h, w), dtype=bool)
+            got.ravel()[hydrology._floodfill_basin(elev, sy, sx, spill, ocean)] = True
+            np.testing.assert_array_equal(got, want)
+            if want.any():
+                basin = hydrology._floodfill_basin(elev, sy, sx, spill, ocean)
+                assert hydrology._find_spill(elev, basin) == _reference_spill(elev, want)
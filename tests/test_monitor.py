@@ -0,0 +1,75 @@
+"""Live monitor tailing and plot decimation: incremental reads must reproduce a full ``read_csv``
+whatever the write boundaries, and min/max-decimated plots must keep every series' envelope."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("matplotlib")
+
+import darwinism as dw  # noqa: E402
+from darwinism.analysis.logger import Logger  # noqa: E402
+from darwinism.analysis.monitor import CsvTail  # noqa: E402
+from darwinism.analysis.plots import make_report, minmax_rows  # noqa: E402
+
+
+def test_tail_matches_full_read(tmp_path):
+    sim = dw.Simulation(dw.make_config(world_seed=12345, seed=7, width=64, height=36))
+    with Logger(tmp_path / "run.csv", sim, log_every=1) as log:
+        for _ in range(40):
+            sim.step()
+            log.record()
+    data = (tmp_path / "run.csv").read_bytes()
+
+    live = tmp_path / "live.csv"
+    live.write_bytes(b"")
+    tail = CsvTail(live)
+    # append in odd-sized pieces so rows (and the header) arrive split across polls
+    for start in range(0, len(data), 333):
+        with open(live, "ab") as fh:
+            fh.write(data[start:start + 333])
+        tail.poll()
+    expected = pd.read_csv(tmp_path / "run.csv")
+    got = tail.frame()
+    assert tail.n == len(expected) == 40
+    assert list(got.columns) == list(expected.columns)
+    np.testing.assert_allclose(got.to_numpy(), expected.to_numpy(dtype=np.float64))
+
+    live.write_bytes(data[:data.index(b"\n") + 1])     # a new run reuses the path
+    tail.poll()
+    assert tail.n == 0 and tail.frame() is None
+
+
+def test_minmax_rows_keeps_the_envelope():
+    rng = np.random.default_rng(0)
+    y = np.cumsum(rng.normal(size=100_003))
+    z = rng.normal(size=y.shape[0])
+    z[5000:9000] = np.nan
+    rows = minmax_rows([y, z], 500)
+    assert rows.shape[0] <= 4 * 500 + 2
+    assert rows[0] == 0 and rows[-1] == y.shape[0] - 1
+    assert y[rows].max() == y.max() and y[rows].min() == y.min()
+    assert np.nanmax(z[rows]) == np.nanmax(z) and np.nanmin(z[rows]) == np.nanmin(z)
+    assert minmax_rows([y[:800]], 500).shape[0] == 800        # short series are untouched
+
+
+def test_report_is_decimated_unless_opted_out(tmp_path):
+    n = 50_000
+    t = np.arange(n)
+    pd.DataFrame({"tick": t, "n_sheep": 100 + 50 * np.sin(t / 300), "n_fox": 20 + t % 7,
+                  "veg_biomass": t * 0.5, "sheep_max_speed": np.cos(t / 50),
+                  "other": t}).to_csv(tmp_path / "long.csv", index=False)
+    fig = make_report(tmp_path / "long.csv")
+    line = fig.axes[0].lines[0]
+    assert len(line.get_xdata()) < 10_000
+    assert max(line.get_ydata()) == pytest.approx(150, abs=1e-3)
+    full = make_report(tmp_path / "long.csv", decimated=False)
+    assert len(full.axes[0].lines[0].get_xdata()) == n
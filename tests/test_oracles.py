@@ -0,0 +1,309 @@
+"""Oracle tests: each vectorized system kernel against the per-entity Python loop it replaced,
+on hand-built worst cases (dense herds, values sitting on the thresholds) rather than whatever
+a short run happens to produce. The loops are kept here verbatim as the reference."""
+from __future__ import annotations
+
+import copy
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import darwinism as dw  # noqa: E402
+from darwinism.cli.bench import scenario_config  # noqa: E402
+from darwinism.config import FieldFood, PreyFood  # noqa: E402
+from darwinism.sim import genome as gn  # noqa: E402
+from darwinism.sim.grid import SpatialGrid  # noqa: E402
+from darwinism.sim.systems import consumption, reproduction  # noqa: E402
+
+
+def _sim():
+    cfg = dw.make_config(world_seed=12345, seed=7, width=64, height=36)
+    return dw.Simulation(cfg)
+
+
+def _graze_loop(cfg, world, ent, veg, slots, px, py, spec, field_food) -> int:
+    """The per-grazer loop ``consumption._graze`` replaced."""
+    n_graze = 0
+    for k in range(slots.shape[0]):                   # ascending row order; no RNG here
+        slot = slots[k]
+        cx = int(min(max(px[k], 0), world.w - 1))
+        cy = int(min(max(py[k], 0), world.h - 1))
+        available = veg[cy, cx]
+        if available < cfg.sim.food_eat_threshold:
+            continue
+        take = available * cfg.sim.veg_graze_amount
+        size = gn.gene(ent.genome[slot:slot + 1], "size")[0]
+        eat_value = field_food[int(spec[k])].eat_value
+        gain = eat_value * take * (0.7 + 0.3 * size)
+        ent.energy[slot] = min(1.0, ent.energy[slot] + gain)
+        ent.hunger[slot] = max(0.0, ent.hunger[slot] - take * 1.5)
+        veg[cy, cx] = available - take
+        world.nutrients[cy, cx] = max(0.0, world.nutrients[cy, cx] - take * 0.15)
+        n_graze += 1
+    return n_graze
+
+
+def test_graze_matches_the_per_grazer_loop():
+    sim = _sim()
+    cfg, world, ent = sim.cfg, sim.world, sim.entities
+    rng = np.random.default_rng(0)
+    slots = np.flatnonzero(ent.alive & (ent.species == dw.SHEEP))
+    n = slots.shape[0]
+    field_food = {dw.SHEEP: next(s for s in cfg.species[dw.SHEEP].diet
+                                 if isinstance(s, FieldFood))}
+
+    # a dense herd: every grazer lands on one of a dozen cells (one off the map edge, so the
+    # clamp is exercised), many to a cell, in a shuffled row order
+    cells = np.array([[3, 4], [3, 5], [10, 20], [0, 0], [35, 63], [17, 31], [17, 32],
+                      [18, 31], [5, 50], [30, 2], [22, 22], [-1, 70]])
+    pick = rng.integers(0, cells.shape[0], n)
+    py = (cells[pick, 0] + rng.random(n)).astype(np.float32)
+    px = (cells[pick, 1] + rng.random(n)).astype(np.float32)
+
+    # vegetation on and around the threshold, before and after one or two bites
+    thr = np.float32(cfg.sim.food_eat_threshold)
+    left = np.float32(1.0 - cfg.sim.veg_graze_amount)
+    near = [thr, np.nextafter(thr, np.float32(0)), np.nextafter(thr, np.float32(1)),
+            thr / left, np.nextafter(thr / left, np.float32(0)), thr / left / left,
+            np.float32(1.0), np.float32(0.0)]
+    veg = sim.veg.copy()
+    nutrients = world.nutrients.copy()
+    for i, (cy, cx) in enumerate(cells):
+        cy, cx = min(max(cy, 0), world.h - 1), min(max(cx, 0), world.w - 1)
+        veg[cy, cx] = near[i % len(near)]
+        nutrients[cy, cx] = np.float32(0.01) * (i % 3)         # some clamp at zero
+    energy = rng.choice(np.float32([0.0, 0.5, 0.999, 1.0]), n)
+    hunger = rng.choice(np.float32([0.0, 0.001, 0.5, 1.0]), n)
+    spec = ent.species[slots]
+
+    results = []
+    for kernel in ("vectorized", "loop"):
+        ent.energy[slots] = energy
+        ent.hunger[slots] = hunger
+        world.nutrients = nutrients.copy()
+        v = veg.copy()
+        if kernel == "vectorized":
+            eat_value = np.zeros(max(cfg.species) + 1, dtype=np.float32)
+            eat_value[dw.SHEEP] = field_food[dw.SHEEP].eat_value
+            bites = consumption._graze(cfg, world, ent, v, slots, px, py, eat_value[spec])
+        else:
+            bites = _graze_loop(cfg, world, ent, v, slots, px, py, spec, field_food)
+        results.append((bites, v, world.nutrients.copy(), ent.energy[slots].copy(),
+                        ent.hunger[slots].copy()))
+
+    (bites, *arrays), (want_bites, *want_arrays) = results
+    assert bites == want_bites
+    grazeable = sum(veg[min(max(cy, 0), world.h - 1), min(max(cx, 0), world.w - 1)] >= thr
+                    for cy, cx in cells)
+    assert bites > grazeable                          # some cells fed more than one grazer
+    for got, want in zip(arrays, want_arrays):
+        assert got.dtype == want.dtype
+        assert got.tobytes() == want.tobytes()
+
+
+def _pair_loop(cfg, ent, grid, elig_slots):
+    """The nested-loop matcher ``reproduction._pair_mates`` replaced."""
+    elig_set = set(elig_slots.tolist())
+    used = set()
+    pairs = []
+    # deterministic: pair greedily by ascending slot index
+    for a in sorted(elig_slots.tolist()):
+        if a in used:
+            continue
+        ax, ay = float(ent.pos_x[a]), float(ent.pos_y[a])
+        cand, cpx, cpy = grid.query_radius(ax, ay, cfg.sim.repro_radius)
+        if cand.shape[0] == 0:
+            continue
+        # eligible, opposite sex, not self, not used
+        best = None
+        best_d2 = np.inf
+        for c, cx, cy in zip(cand.tolist(), cpx.tolist(), cpy.tolist()):
+            if c == a or c in used or c not in elig_set:
+                continue
+            if ent.sex[c] == ent.sex[a]:
+                continue
+            d2 = (cx - ax) ** 2 + (cy - ay) ** 2
+            if d2 < best_d2:
+                best_d2 = d2
+                best = c
+        if best is not None:
+            used.add(a)
+            used.add(best)
+            pairs.append((a, best))
+    return pairs
+
+
+def test_pair_mates_matches_the_nested_loop():
+    sim = _sim()
+    cfg, world, ent = sim.cfg, sim.world, sim.entities
+    slots = np.flatnonzero(ent.alive & (ent.species == dw.SHEEP))
+    grid = SpatialGrid(world.w, world.h, cfg.sim.grid_cell_size)
+    r = cfg.sim.repro_radius
+    for trial in range(20):
+        rng = np.random.default_rng(trial)
+        # clusters of odd and even sizes, tighter than the mating radius; half of them sit on
+        # a lattice of half-radius steps so many partners are exactly equidistant
+        sizes = rng.choice([1, 2, 3, 5, 7, 8, 11], slots.shape[0])
+        sizes = sizes[np.cumsum(sizes) <= slots.shape[0]]
+        member = np.repeat(np.arange(sizes.shape[0]), sizes)
+        n = member.shape[0]
+        centre = rng.uniform(2, [world.w - 2, world.h - 2], (sizes.shape[0], 2))
+        jitter = np.where((member % 2 == 0)[:, None],
+                          rng.integers(-2, 3, (n, 2)) * (r / 2),
+                          rng.uniform(-r, r, (n, 2)))
+        pos = (centre[member] + jitter).astype(np.float32)
+        ent.pos_x[slots[:n]], ent.pos_y[slots[:n]] = pos[:, 0], pos[:, 1]
+        ent.sex[slots[:n]] = rng.integers(0, 2, n)
+        grid.rebuild(slots[:n], ent.pos_x, ent.pos_y)
+        elig_slots = np.sort(rng.choice(slots[:n], int(n * 0.8), replace=False))
+
+        parents_a, parents_b = reproduction._pair_mates(cfg, ent, grid, elig_slots)
+        want = _pair_loop(cfg, ent, grid, elig_slots)
+        assert list(zip(parents_a.tolist(), parents_b.tolist())) == want
+        assert len(want) > 0
+
+
+def _hunt_loop(world, ent, idx, rows, px, py, spec, prey_food, scarcity, species_grids, rng,
+               eat_r):
+    """The sequential predation loop in ``consumption.apply``, with the batched mode's one
+    rule added: a prey already caught this tick feeds no later hunter. Returns the killed
+    prey and how many successful hunters that rule left hungry."""
+    killed, contested = [], 0
+    for k in rows:
+        slot = idx[k]
+        pf = prey_food[int(spec[k])]
+        cand_list = []
+        for tsid in pf.prey:
+            c, _cpx, _cpy = species_grids[tsid].query_radius(float(px[k]), float(py[k]), eat_r)
+            if c.shape[0]:
+                cand_list.append(c)
+        if not cand_list:
+            continue
+        cand = np.concatenate(cand_list)
+        cand = cand[ent.alive[cand]]
+        cand = cand[~world.in_cover(ent.pos_x[cand], ent.pos_y[cand])]
+        if cand.shape[0] == 0:
+            continue
+        d2 = (ent.pos_x[cand] - px[k]) ** 2 + (ent.pos_y[cand] - py[k]) ** 2
+        prey = int(cand[int(np.argmin(d2))])
+        aggression = gn.gene(ent.genome[slot:slot + 1], "aggression")[0]
+        kill_prob = aggression * pf.hunt_success * scarcity[int(spec[k])]
+        if rng.random() > kill_prob:
+            continue
+        if prey in killed:
+            contested += 1
+            continue
+        prey_size = gn.gene(ent.genome[prey:prey + 1], "size")[0]
+        gain = pf.predation_gain * (0.4 + 0.5 * prey_size)
+        ent.energy[slot] = min(1.0, ent.energy[slot] + gain)
+        ent.hunger[slot] = max(0.0, ent.hunger[slot] - 0.6)
+        killed.append(prey)
+    return killed, contested
+
+
+def _hunt_setup(sim, packs, spread=0.5):
+    """Move foxes into packs around exposed sheep: ``packs`` is a list of pack sizes, one
+    sheep each, the foxes within ``spread * eat_radius`` of it. Returns the ``_hunt_batched``
+    arguments after ``(cfg, world, ent)``."""
+    cfg, world, ent = sim.cfg, sim.world, sim.entities
+    rng = np.random.default_rng(1)
+    sheep = np.flatnonzero(ent.alive & (ent.species == dw.SHEEP))
+    sheep = sheep[~world.in_cover(ent.pos_x[sheep], ent.pos_y[sheep])]
+    foxes = np.flatnonzero(ent.alive & (ent.species == dw.FOX))
+    assert sum(packs) <= foxes.shape[0] and len(packs) <= sheep.shape[0]
+    r = cfg.sim.eat_radius * spread
+    start = 0
+    for target, size in zip(sheep, packs):
+        pack = foxes[start:start + size]
+        start += size
+        ent.pos_x[pack] = ent.pos_x[target] + rng.uniform(-r, r, size).astype(np.float32)
+        ent.pos_y[pack] = ent.pos_y[target] + rng.uniform(-r, r, size).astype(np.float32)
+    ent.pos_x[foxes[start:]] = ent.pos_y[foxes[start:]] = -100.0    # off the map: no target
+    sim._rebuild_grids()
+    idx = np.flatnonzero(ent.alive)
+    spec = ent.species[idx]
+    rows = np.flatnonzero(spec == dw.FOX)
+    pf = next(s for s in cfg.species[dw.FOX].diet if isinstance(s, PreyFood))
+    prey_food = {dw.FOX: replace(pf, hunt_success=1.0)}
+    return (idx, rows, ent.pos_x[idx], ent.pos_y[idx], spec, prey_food, {dw.FOX: 1.0},
+            sim._species_grids)
+
+
+def test_hunt_batched_matches_the_loop_with_contested_prey():
+    sim = _sim()
+    cfg, world, ent = sim.cfg, sim.world, sim.entities
+    args = _hunt_setup(sim, [1, 2, 3, 5, 1, 4, 2])
+    idx, rows = args[0], args[1]
+    slots = idx[rows]
+    energy = np.random.default_rng(2).choice(np.float32([0.0, 0.3, 0.9]), slots.shape[0])
+    results = []
+    for kernel in ("batched", "loop"):
+        ent.energy[slots] = energy
+        ent.hunger[slots] = np.float32(0.5)
+        rng = np.random.default_rng(3)
+        if kernel == "batched":
+            killed, n = consumption._hunt_batched(cfg, world, ent, *args, rng)
+        else:
+            killed, contested = _hunt_loop(world, ent, *args, rng, cfg.sim.eat_radius)
+            n = len(killed)
+        results.append((sorted(killed), n, ent.energy[slots].copy(), ent.hunger[slots].copy(),
+                        rng.random()))
+    (killed, n, *arrays), (want_killed, want_n, *want_arrays) = results
+    assert (killed, n) == (want_killed, want_n)
+    assert n > 0 and contested > 0                    # some packs really shared a kill
+    for got, want in zip(arrays, want_arrays):
+        assert np.asarray(got).tobytes() == np.asarray(want).tobytes()
+
+
+def test_hunt_batched_feeds_only_the_lowest_row_on_a_contested_prey():
+    sim = _sim()
+    cfg, world, ent = sim.cfg, sim.world, sim.entities
+    args = _hunt_setup(sim, [2], spread=0.0)         # both foxes on the sheep itself
+    idx, rows, prey_food = args[0], args[1], args[5]
+    ent.genome[idx[rows], gn.GENE_INDEX["aggression"]] = 1.0     # every roll succeeds
+    a, b = idx[rows[:2]]
+    ent.energy[[a, b]] = 0.0
+    ent.hunger[[a, b]] = 1.0
+    killed, n = consumption._hunt_batched(cfg, world, ent, *args, np.random.default_rng(0))
+    assert n == 1 and len(killed) == 1
+    assert ent.energy[a] > 0.0 and ent.hunger[a] < 1.0
+    assert ent.energy[b] == 0.0 and ent.hunger[b] == 1.0
+    assert prey_food[dw.FOX].hunt_success == 1.0
+
+
+def test_hunt_batched_matches_the_loop_through_a_many_foxes_run(monkeypatch):
+    """Every tick of a crowded predation run: the batched kernel against the loop, from the
+    same state and RNG."""
+    cfg = scenario_config("many-foxes")
+    cfg.world = replace(cfg.world, width=64, height=36)
+    cfg.sim.predation_mode = "batched"
+    sim = dw.Simulation(cfg)
+    kernel = consumption._hunt_batched
+    totals = {"kills": 0, "contested": 0}
+
+    def checked(cfg, world, ent, *args):
+        *args, rng = args
+        before = ent.energy.copy(), ent.hunger.copy()
+        ref_rng = copy.deepcopy(rng)
+        want, contested = _hunt_loop(world, ent, *args, ref_rng, cfg.sim.eat_radius)
+        want_state = ent.energy.copy(), ent.hunger.copy()
+        ent.energy[:], ent.hunger[:] = before
+        killed, n = kernel(cfg, world, ent, *args, rng)
+        assert sorted(killed) == sorted(want) and n == len(want)
+        assert rng.bit_generator.state == ref_rng.bit_generator.state
+        assert ent.energy.tobytes() == want_state[0].tobytes()
+        assert ent.hunger.tobytes() == want_state[1].tobytes()
+        totals["kills"] += n
+        totals["contested"] += contested
+        return killed, n
+
+    monkeypatch.setattr(consumption, "_hunt_batched", checked)
+    for _ in range(60):
+        sim.step()
+    assert totals["kills"] > 0 and totals["contested"] > 0
@@ -0,0 +1,153 @@
+"""Sparse perception: a sparse observation must materialize to exactly the dense grids, decode
+to exactly the dense targets, and so drive a run to exactly the dense run's state. Under the
+default "auto" format a rule brain's observation stays lazy; a whole-tensor brain gets grids."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from determinism_util import run_fingerprint  # noqa: E402
+
+import darwinism as dw  # noqa: E402
+
+
+def _sim(fmt, dtype="float32"):
+    cfg = dw.make_config(world_seed=12345, seed=7, width=64, height=36)
+    cfg.sim.perception_format = fmt
+    cfg.sim.perception_dtype = dtype
+    sim = dw.Simulation(cfg)
+    for _ in range(15):
+        sim.step()
+    return sim
+
+
+def test_sparse_observation_materializes_the_dense_grids():
+    dense_obs, dense_idx = _sim("dense").perception.build()
+    sparse_obs, sparse_idx = _sim("sparse").perception.build()
+    np.testing.assert_array_equal(sparse_idx, dense_idx)
+    for sid, dense in dense_obs.items():
+        sparse = sparse_obs[sid]
+        assert sparse.sparse and not dense.sparse and len(sparse) == len(dense)
+        for role in dense.channels:
+            if sparse.cells(role) is not None:
+                for got, want in zip(dw.decode_nearest(sparse, role),
+                                     dw.nearest_in_channel(dense.channel(role))):
+                    np.testing.assert_array_equal(got, want)
+        np.testing.assert_array_equal(sparse.grids, dense.grids)
+        np.testing.assert_array_equal(sparse.scalars, dense.scalars)
+
+
+def test_nearest_in_points_matches_the_dense_decode():
+    rng = np.random.default_rng(3)
+    n, K = 50, 9
+    rows = rng.integers(0, n, 300)
+    y, x = rng.integers(0, K, 300), rng.integers(0, K, 300)
+    chan = np.zeros((n, K, K), dtype=np.float32)
+    chan[rows, y, x] = 1.0
+    cells = (rows, y, x, np.ones(300, dtype=np.float32))
+    for got, want in zip(dw.nearest_in_points(cells, n, K), dw.nearest_in_channel(chan)):
+        assert got.dtype == want.dtype
+        np.testing.assert_array_equal(got, want)
+
+
+def test_sparse_run_matches_dense_run():
+    assert (run_fingerprint(7, ticks=60, perception_format="sparse")
+            == run_fingerprint(7, ticks=60))
+
+
+class _WholeTensorBrain(dw.RuleBrain):
+    """A rule brain that declares nothing, so perception must hand it the dense grids."""
+
+    def channels(self, species_id):
+        return None
+
+
+def test_auto_format_follows_the_brain_declaration():
+    sim = _sim("auto")
+    for obs in sim.last_obs.values():
+        assert obs.sparse
+        assert set(obs._cache) <= {"food", "water"}         # terrain/dist never built
+        assert set(obs.points) <= {"food", "mate", "threat"}
+    cfg = dw.make_config(world_seed=12345, seed=7, width=64, height=36)
+    sim = dw.Simulation(cfg, brain={dw.SHEEP: _WholeTensorBrain(np.random.default_rng(0))})
+    sim.step()
+    assert not sim.last_obs[dw.SHEEP].sparse and sim.last_obs[dw.FOX].sparse
+
+
+class _FoodOnlyBrain(dw.Brain):
+    """Declares and reads only ``food``; wanders on its own RNG, so a run does not depend on
+    the perception format."""
+
+    def __init__(self, seed):
+        self.rng = np.random.default_rng(seed)
+
+    def channels(self, species_id):
+        return ("food",)
+
+    def decide(self, obs_by_species, idx):
+        for obs in obs_by_species.values():
+            obs.channel("food")
+        act = self.rng.random((idx.shape[0], dw.ACT_DIM)).astype(np.float32)
+        act[:, [dw.A_DX, dw.A_DY]] = act[:, [dw.A_DX, dw.A_DY]] * 2 - 1
+        return act
+
+
+def test_last_obs_holds_the_undeclared_channels_of_its_own_tick():
+    seen = {}
+    for fmt in ("auto", "dense"):
+        cfg = dw.make_config(world_seed=12345, seed=7, width=64, height=36)
+        cfg.sim.perception_format = fmt
+        sim = dw.Simulation(cfg, brain=_FoodOnlyBrain(5))
+        for _ in range(15):
+            sim.step()
+        seen[fmt] = sim.last_obs
+    assert seen["auto"][dw.SHEEP].sparse and not seen["dense"][dw.SHEEP].sparse
+    for sid, dense in seen["dense"].items():
+        np.testing.assert_array_equal(seen["auto"][sid].channel("mate"), dense.channel("mate"))
+        np.testing.assert_array_equal(seen["auto"][sid].grids, dense.grids)
+
+
+def test_direct_decoding_matches_the_grid_decoding():
+    # "validate" decodes every target both ways and raises at the first disagreement
+    assert (run_fingerprint(99, ticks=80, rule_decode="validate")
+            == run_fingerprint(99, ticks=80, rule_decode="grid"))
+    with pytest.raises(ValueError, match="decode mode"):
+        dw.RuleBrain(np.random.default_rng(0), decode="fast")
+
+
+@pytest.mark.parametrize("dtype, step", [("float16", 1e-3), ("uint8", 1 / 255)])
+def test_narrow_grids_quantize_the_float32_grids(dtype, step):
+    wide_obs, _ = _sim("dense").perception.build()
+    narrow_obs, _ = _sim("dense", dtype).perception.build()
+    lazy_obs, _ = _sim("sparse", dtype).perception.build()
+    for sid, wide in wide_obs.items():
+        narrow, lazy = narrow_obs[sid], lazy_obs[sid]
+        assert narrow.grids.dtype == lazy.grids.dtype == np.dtype(dtype)
+        np.testing.assert_array_equal(lazy.grids, narrow.grids)
+        for role in wide.channels:
+            chan = narrow.channel(role)
+            assert chan.dtype == np.float32
+            np.testing.assert_allclose(chan, wide.channel(role), rtol=0, atol=step)
+            np.testing.assert_array_equal(lazy.channel(role), chan)
+
+
+def test_each_species_gets_its_own_window():
+    sim = _sim("dense")
+    for sid, obs in sim.last_obs.items():
+        r = int(np.ceil(sim.cfg.species[sid].gene_ranges["sensory_range"].hi))
+        assert obs.radius == r and obs.grids.shape[-2:] == (2 * r + 1, 2 * r + 1)
+    assert sim.last_obs[dw.SHEEP].radius < sim.last_obs[dw.FOX].radius == sim.perception.R
+
+
+def test_unknown_format_is_rejected():
+    cfg = dw.make_config(world_seed=12345, seed=7, width=64, height=36)
+    cfg.sim.perception_format = "coo"
+    with pytest.raises(ValueError, match="perception_format"):
+        dw.Simulation(cfg)
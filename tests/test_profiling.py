@@ -0,0 +1,38 @@
+"""Per-system profiling: timing must never change the run, and the summary / exports must cover
+every pipeline system."""
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from determinism_util import state_hash  # noqa: E402
+
+import darwinism as dw  # noqa: E402
+
+
+def test_profiled_run_is_identical_and_reports_every_system(tmp_path):
+    plain = dw.Simulation(dw.make_config(world_seed=12345, seed=7))
+    profiled = dw.Simulation(dw.make_config(world_seed=12345, seed=7), profile=True)
+    assert plain.profile is None
+    for _ in range(20):
+        plain.step()
+        profiled.step()
+    assert state_hash(plain) == state_hash(profiled)
+
+    summary = profiled.profile.summary()
+    assert list(summary) == [type(s).__name__ for s in profiled.systems]
+    for row in summary.values():
+        assert row["calls"] == 20
+        assert 0.0 <= row["p50_ms"] <= row["p99_ms"]
+    assert abs(sum(r["share"] for r in summary.values()) - 1.0) < 1e-9
+
+    with open(profiled.profile.to_csv(tmp_path / "profile.csv")) as fh:
+        assert [r["system"] for r in csv.DictReader(fh)] == list(summary)
+    payload = json.loads(profiled.profile.to_json(tmp_path / "profile.json").read_text())
+    assert set(payload["systems"]) == set(summary)
@@ -0,0 +1,110 @@
+"""Checkpoint / resume and in-memory forks: a run restored from ``save_state`` -- or forked
+without a new seed -- must continue byte-identically to the uninterrupted run. Uses a shrunken
+map so world generation stays fast."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from determinism_util import state_hash  # noqa: E402
+
+import darwinism as dw  # noqa: E402
+
+
+def test_resumed_run_is_byte_identical(tmp_path):
+    sim = dw.Simulation(dw.make_config(world_seed=12345, seed=7, width=64, height=36))
+    for _ in range(25):
+        sim.step()
+    sim.save_state(tmp_path / "warm.npz")
+    for _ in range(25):
+        sim.step()
+
+    resumed = dw.Simulation.load_state(tmp_path / "warm.npz")
+    assert resumed.tick == 25
+    for _ in range(25):
+        resumed.step()
+    assert state_hash(resumed) == state_hash(sim)
+    assert resumed.entities._free == sim.entities._free
+    assert resumed.entities._next_birth_id == sim.entities._next_birth_id
+    np.testing.assert_array_equal(resumed.veg, sim.veg)
+    np.testing.assert_array_equal(resumed.world.nutrients, sim.world.nutrients)
+    assert resumed.stats == sim.stats
+    assert resumed.rng.bit_generator.state == sim.rng.bit_generator.state
+
+
+def test_checkpoint_config_round_trips_without_pickle(tmp_path):
+    cfg = dw.make_config(world_seed=12345, seed=7, width=64, height=36)
+    cfg.sim.predation_mode = "batched"
+    cfg.species[dw.FOX].gene_ranges["max_speed"].hi = 2.5
+    cfg.species[dw.FOX].cluster = (2, 3.0)
+    path = dw.Simulation(cfg).save_state(tmp_path / "cold.npz")
+    with np.load(path, allow_pickle=False) as data:
+        assert set(data.files) >= {"meta", "veg"} and "config" not in data.files
+    assert dw.Simulation.load_state(path).cfg == cfg
+
+
+def test_fork_shares_the_map_and_branches_independently():
+    sim = dw.Simulation(dw.make_config(world_seed=12345, seed=7, width=64, height=36))
+    for _ in range(20):
+        sim.step()
+    same = sim.fork()
+    other = sim.fork(seed=99)
+    assert same.world.elevation is sim.world.elevation          # static arrays shared
+    assert same.world.nutrients is not sim.world.nutrients      # mutable state copied
+
+    for _ in range(20):
+        other.step()
+    for _ in range(20):
+        sim.step()
+        same.step()
+    assert state_hash(same) == state_hash(sim)
+    np.testing.assert_array_equal(same.world.nutrients, sim.world.nutrients)
+    assert state_hash(other) != state_hash(sim)
+    assert other.cfg.seed == 99 and sim.cfg.seed == 7
+
+
+class _BoundBrain(dw.RuleBrain):
+    """A rule brain with per-agent memory tied to the entity store it was bound to."""
+
+    def bind(self, entities):
+        self.entities = entities
+        self.seen = np.zeros(entities.cap, dtype=np.int64)
+
+    def decide(self, obs_by_species, idx):
+        assert self.entities.alive[idx].all()          # bound to the run that is stepping
+        self.seen[idx] += 1
+        return super().decide(obs_by_species, idx)
+
+
+def _bound_sim():
+    cfg = dw.make_config(world_seed=12345, seed=7, width=64, height=36)
+    brain = _BoundBrain(np.random.default_rng(3))
+    return dw.Simulation(cfg, brain={dw.SHEEP: brain}), brain
+
+
+def test_fork_gives_a_bound_brain_its_own_copy():
+    sim, brain = _bound_sim()
+    twin, _ = _bound_sim()
+    for _ in range(10):
+        sim.step()
+        twin.step()
+    child = sim.fork()
+    child_brain = child.brain.brains[dw.SHEEP]
+    assert child_brain is not brain and child_brain.entities is child.entities
+    assert brain.entities is sim.entities                # the parent is still bound to itself
+    assert child_brain.seen is not brain.seen and brain.seen.any()
+    np.testing.assert_array_equal(child_brain.seen, brain.seen)   # memory kept, not re-bound
+
+    for _ in range(15):
+        sim.step()                                       # the parent steps on after the fork
+        twin.step()
+        child.step()
+    assert state_hash(sim) == state_hash(twin) == state_hash(child)
+    np.testing.assert_array_equal(brain.seen, twin.brain.brains[dw.SHEEP].seen)
+    np.testing.assert_array_equal(child_brain.seen, brain.seen)
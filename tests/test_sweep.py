@@ -0,0 +1,47 @@
+"""Sweep runner tests: grid expansion and override parsing, and a tiny two-worker sweep whose
+rows must match running the same grid cell in-process. Uses a shrunken world."""
+from __future__ import annotations
+
+import csv
+import sys
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from darwinism.cli import sweep  # noqa: E402
+
+
+def test_grid_and_overrides():
+    assert sweep.parse_ints("1-3,7, 9-10") == [1, 2, 3, 7, 9, 10]
+    key, values = sweep.parse_set("species.fox.init_count=20,40")
+    assert (key, values) == ("species.fox.init_count", [20, 40])
+
+    jobs = sweep.build_grid([1, 2], [12345], [(key, values), ("sim.predation_mode", ["batched"])])
+    assert [(j["seed"], j["overrides"][key]) for j in jobs] == [(1, 20), (2, 20), (1, 40), (2, 40)]
+    cfg = sweep.job_config(jobs[2])
+    assert (cfg.seed, cfg.species[1].init_count, cfg.sim.predation_mode) == (1, 40, "batched")
+
+    for bad in ("species.wolf.init_count", "sim.no_such_field", "weather.rate"):
+        with pytest.raises(ValueError):
+            sweep.apply_override(cfg, bad, 1)
+
+
+def test_pool_sweep_writes_one_row_per_run(tmp_path):
+    jobs = sweep.build_grid([1, 2], [12345], [("world.width", [64]), ("world.height", [36])])
+    rows = sweep.run_sweep(jobs, ticks=4, out_dir=tmp_path / "out", cache_dir=tmp_path / "worlds",
+                           workers=2, quiet=True)
+    assert [r["run"] for r in rows] == [0, 1]
+    assert len(list((tmp_path / "worlds").glob("world-*"))) == 1    # generated once, shared
+
+    with open(tmp_path / "out" / "results.csv") as fh:
+        table = list(csv.DictReader(fh))
+    assert [int(r["seed"]) for r in table] == [1, 2]
+    assert all((tmp_path / "out" / r["csv"]).exists() for r in table)
+
+    again = sweep._run_job(jobs[1], 4, str(tmp_path / "solo"), str(tmp_path / "worlds"), None)
+    assert (again["final_sheep"], again["final_fox"], again["veg_biomass"]) == (
+        rows[1]["final_sheep"], rows[1]["final_fox"], rows[1]["veg_biomass"])
@@ -0,0 +1,66 @@
+"""Per-system state tracing: traced runs are unchanged and reproducible, and a perturbed run
+is caught at exactly the tick and system where it first leaves the reference trace."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from determinism_util import state_hash  # noqa: E402
+
+import darwinism as dw  # noqa: E402
+from darwinism.sim.trace import StateTracer, TraceDivergence  # noqa: E402
+
+
+def _sim():
+    return dw.Simulation(dw.make_config(world_seed=12345, seed=7, width=64, height=36))
+
+
+def test_trace_replays_and_pins_the_first_divergence(tmp_path):
+    plain, traced = _sim(), _sim()
+    reference = traced.enable_tracing()
+    for _ in range(12):
+        plain.step()
+        traced.step()
+    assert state_hash(plain) == state_hash(traced)       # tracing never touches the run
+    assert len(reference.ticks) == 12
+    assert len(reference.ticks[1]) == len(traced.systems)
+
+    reference = StateTracer.load(reference.save(tmp_path / "trace.json"))
+    replay = _sim()
+    replay.enable_tracing(reference=reference)
+    for _ in range(12):
+        replay.step()                                   # identical: no divergence raised
+
+    broken = _sim()                                     # a "refactor" that breaks movement
+    movement = next(s for s in broken.systems if type(s).__name__ == "MovementSystem")
+    move = movement.apply
+
+    def perturbed(ctx):
+        move(ctx)
+        if ctx.tick == 5:
+            ctx.ent.pos_x[int(ctx.ent.alive_indices()[0])] += 1e-3
+
+    movement.apply = perturbed
+    broken.enable_tracing(reference=reference)
+    for _ in range(4):
+        broken.step()
+    with pytest.raises(TraceDivergence) as err:
+        broken.step()
+    assert (err.value.tick, err.value.system) == (5, "MovementSystem")
+
+
+def test_first_divergence_finds_the_perturbed_system():
+    a, b = _sim(), _sim()
+    ta, tb = a.enable_tracing(), b.enable_tracing()
+    for _ in range(8):
+        a.step()
+        b.step()
+        if b.tick == 4:
+            b.entities.energy[int(b.entities.alive_indices()[0])] += 1e-3
+    assert ta.first_divergence(tb) == (5, "EnvironmentSystem")
@@ -0,0 +1,68 @@
+"""Incremental trait statistics: the running sums kept on spawn / kill must agree with a full
+recompute over the live genomes, through births, deaths and a checkpoint restore."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import darwinism as dw  # noqa: E402
+from darwinism.sim import genome as gn  # noqa: E402
+
+
+def _check(sim):
+    ent = sim.entities
+    for sid in sim.cfg.species:
+        g = ent.genome[ent.species_mask(sid)].astype(np.float64)
+        assert ent.traits.count[sid] == g.shape[0]
+        if g.shape[0] == 0:
+            assert np.isnan(ent.traits.mean(sid)).all()
+            continue
+        np.testing.assert_allclose(ent.traits.mean(sid), g.mean(axis=0), rtol=1e-9)
+        np.testing.assert_allclose(ent.traits.var(sid), g.var(axis=0), rtol=1e-6, atol=1e-9)
+
+
+def test_running_sums_match_recompute(tmp_path):
+    sim = dw.Simulation(dw.make_config(world_seed=12345, seed=7, width=64, height=36))
+    sim.entities.traits.track_histograms(8, sim.entities)
+    for _ in range(60):
+        sim.step()
+    _check(sim)
+    exact = sim.trait_means(dw.SHEEP)
+    for name, value in sim.trait_means(dw.SHEEP, running=True).items():
+        assert value == pytest.approx(exact[name], rel=1e-6)
+
+    counts, edges = sim.entities.traits.histogram(dw.SHEEP, "max_speed")
+    assert counts.sum() == sim.entities.count_species(dw.SHEEP)
+    assert edges.shape == (9,)
+
+    sim.save_state(tmp_path / "warm.npz")
+    resumed = dw.Simulation.load_state(tmp_path / "warm.npz")
+    _check(resumed)
+    np.testing.assert_array_equal(resumed.entities.traits.count, sim.entities.traits.count)
+
+
+def test_running_trait_means_match_the_gathered_means():
+    sim = dw.Simulation(dw.make_config(world_seed=12345, seed=7, width=64, height=36))
+    ent = sim.entities
+    founders, first_id = ent.n_alive, ent._next_birth_id
+    for _ in range(120):
+        sim.step()
+    births = ent._next_birth_id - first_id
+    assert births > 0 and founders + births > ent.n_alive          # both births and deaths
+    for sid in sim.cfg.species:
+        gathered = sim.trait_means(sid)
+        for name, value in sim.trait_means(sid, running=True).items():
+            assert value == pytest.approx(gathered[name], rel=1e-6)
+
+
+def test_histogram_needs_tracking():
+    sim = dw.Simulation(dw.make_config(world_seed=12345, seed=7, width=64, height=36))
+    with pytest.raises(ValueError):
+        sim.entities.traits.histogram(dw.SHEEP, gn.GENE_NAMES[0])
@@ -0,0 +1,77 @@
+"""World-cache tests: a cached world must be array-for-array identical to a generated one,
+later loads must skip generation entirely, and a run on a cached world must match a run on a
+fresh one. Uses a shrunken world so generation stays fast."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from determinism_util import state_hash  # noqa: E402
+
+import darwinism as dw  # noqa: E402
+from darwinism.sim import world_cache  # noqa: E402
+from darwinism.sim.world import World  # noqa: E402
+
+
+def _small_cfg(seed=7):
+    return dw.make_config(world_seed=12345, seed=seed, width=72, height=40)
+
+
+def test_cached_world_is_identical_and_skips_generation(tmp_path, monkeypatch):
+    cfg = _small_cfg()
+    fresh = world_cache.load_or_build(cfg.world, tmp_path)
+    assert world_cache.entry_path(cfg.world, tmp_path).is_dir()
+
+    def _no_generation(self, cfg):
+        raise AssertionError("world was regenerated despite a cache entry")
+    monkeypatch.setattr(World, "__init__", _no_generation)
+    cached = world_cache.load_or_build(cfg.world, tmp_path)
+
+    assert (cached.w, cached.h) == (fresh.w, fresh.h)
+    arrays = {k for k, v in vars(fresh).items() if isinstance(v, np.ndarray)}
+    assert arrays == {k for k, v in vars(cached).items() if isinstance(v, np.ndarray)}
+    for name in arrays:
+        np.testing.assert_array_equal(getattr(cached, name), getattr(fresh, name))
+        assert getattr(cached, name).dtype == getattr(fresh, name).dtype
+
+    # copy-on-write: mutating a loaded world never reaches the files
+    cached.nutrients[:] = -1.0
+    again = world_cache.load(cfg.world, tmp_path)
+    np.testing.assert_array_equal(again.nutrients, fresh.nutrients)
+
+
+def test_key_tracks_the_world_config(tmp_path):
+    a, b = _small_cfg(), _small_cfg()
+    assert world_cache.cache_key(a.world) == world_cache.cache_key(b.world)
+    c = dw.make_config(world_seed=12346, width=72, height=40)
+    assert world_cache.cache_key(c.world) != world_cache.cache_key(a.world)
+    assert world_cache.load(c.world, tmp_path) is None
+
+
+def test_key_tracks_the_generation_source(tmp_path, monkeypatch):
+    cfg = _small_cfg()
+    world_cache.load_or_build(cfg.world, tmp_path)
+    key = world_cache.cache_key(cfg.world)
+    monkeypatch.setattr(world_cache, "_generation_source", lambda: "edited")
+    assert world_cache.cache_key(cfg.world) != key
+    assert world_cache.load(cfg.world, tmp_path) is None
+
+
+def test_run_on_cached_world_matches_fresh_world(tmp_path):
+    plain = dw.Simulation(_small_cfg())
+    cfg = _small_cfg()
+    cfg.sim.world_cache = str(tmp_path)
+    dw.Simulation(cfg)                                  # populates the cache
+    cfg = _small_cfg()
+    cfg.sim.world_cache = str(tmp_path)
+    cached = dw.Simulation(cfg)                         # served from the cache
+    for _ in range(30):
+        plain.step()
+        cached.step()
+    assert state_hash(plain) == state_hash(cached)
@@ -0,0 +1,76 @@
+"""Background log writing: a logger in background mode must write exactly what the synchronous
+one does, drain everything on close, and surface writer-thread errors to the caller."""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import darwinism as dw  # noqa: E402
+from darwinism.analysis.columnar import ColumnarLogger, read_columns  # noqa: E402
+from darwinism.analysis.logger import Logger  # noqa: E402
+from darwinism.analysis.writer import BackgroundWriter  # noqa: E402
+
+
+def test_background_logs_match_synchronous(tmp_path):
+    sim = dw.Simulation(dw.make_config(world_seed=12345, seed=7, width=64, height=36))
+    loggers = [Logger(tmp_path / "sync.csv", sim),
+               Logger(tmp_path / "async.csv", sim, background=True, queue_size=2),
+               ColumnarLogger(tmp_path / "sync", sim, fmt="npy", chunk_rows=4),
+               ColumnarLogger(tmp_path / "async", sim, fmt="npy", chunk_rows=4,
+                              background=True, queue_size=1)]
+    for log in loggers:
+        log.open()
+    for _ in range(30):
+        sim.step()
+        for log in loggers:
+            log.record()
+    for log in loggers:
+        log.close()
+
+    assert (tmp_path / "async.csv").read_bytes() == (tmp_path / "sync.csv").read_bytes()
+    sync, bg = read_columns(tmp_path / "sync"), read_columns(tmp_path / "async")
+    assert list(bg) == list(sync)
+    for name in sync:
+        np.testing.assert_array_equal(bg[name], sync[name])
+
+
+def test_bounded_queue_applies_backpressure_and_drains():
+    written, gate = [], threading.Event()
+
+    def slow(item):
+        gate.wait()
+        written.append(item)
+
+    writer = BackgroundWriter(slow, maxsize=2)
+    writer.submit(0)                        # taken by the (blocked) writer thread
+    while writer.pending:
+        time.sleep(0.001)
+    writer.submit(1)
+    writer.submit(2)                        # the queue is now full
+    blocked = threading.Thread(target=writer.submit, args=(3,))
+    blocked.start()
+    time.sleep(0.05)
+    assert blocked.is_alive()               # submit waits for the writer to catch up
+    gate.set()
+    blocked.join(timeout=5)
+    writer.close()
+    assert written == [0, 1, 2, 3]
+
+
+def test_writer_errors_reach_the_caller():
+    def fail(item):
+        raise OSError("disk full")
+
+    writer = BackgroundWriter(fail, maxsize=4)
+    writer.submit("row")
+    with pytest.raises(OSError, match="disk full"):
+        writer.close()